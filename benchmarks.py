@@ -0,0 +1,173 @@
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from manim import *
+from ManimHelpers import constructions, geometry  # importing constructions registers them
+from ManimHelpers.registry import CONSTRUCTIONS, op_count
+from ManimHelpers.shapes import MarkedLine
+from ManimHelpers.timeline import Recorder
+
+def point(x: float, y: float) -> np.ndarray:
+    return np.array([x, y, 0.])
+
+def cases() -> dict:
+    """Fresh inputs for every construction, by name"""
+    angle = (Line(point(0, 0), point(1, 0)), Line(point(0, 0), point(np.cos(1.2), np.sin(1.2))))
+    triangle = (Line(point(0, 0), point(3, 0)), Line(point(3, 0), point(1, 2)), Line(point(1, 2), point(0, 0)))
+    figure = (
+        Line(point(0, 0), point(3, 0)), Line(point(3, 0), point(3, 2)),
+        Line(point(3, 2), point(0, 3)), Line(point(0, 3), point(0, 0))
+    )
+    base = Line(point(-2, -3), point(1, -3))
+    # the sides of a regular octagon, for the batched constructions
+    corners = [point(2*np.cos(angle), 2*np.sin(angle)) for angle in np.linspace(0, TAU, 9)]
+    sides = np.array([[start, end] for start, end in zip(corners, corners[1:])])
+    return {
+        'equilateral_triangle': (Line(point(0, 0), point(2, 0)),),
+        'point_to_line': (point(2, 1), Line(point(0, 0), point(0, 3))),
+        'cut_seperate_line_to_length': (Line(point(0, 0), point(5, 0)), Line(point(1, 1), point(1, 3))),
+        'cut_coincident_line_to_length': (Line(point(0, 0), point(5, 0)), Line(point(0, 0), point(0, 3))),
+        'bisect_angle': (Line(point(0, 0), point(2, 0)), Line(point(0, 2), point(0, 0))),
+        'bisect_line': (Line(point(0, 0), point(4, 0)),),
+        'perpendicular_from_point_on_line': (Line(point(0, 0), point(4, 0)), point(1, 0)),
+        'perpendicular_from_point_off_line': (Line(point(0, 0), point(0, 4)), point(3, 1)),
+        'triangle_from_lines': (
+            Line(point(0, 0), point(20, 0)), Line(point(1, 0), point(4, 0)),
+            Line(point(1, 1), point(5, 1)), Line(point(2, 2), point(7, 2))
+        ),
+        'equal_angle': (Line(point(5, 5), point(8, 5)), point(5, 5), angle),
+        'parallel_line': (point(1, 3), Line(point(0, 0), point(2, 1))),
+        'parallelogram_from_angle_and_triangle': (angle, triangle),
+        'parallelogram_from_angle_and_triangle_on_line': (angle, triangle, base),
+        'parallelogram_from_angle_and_rectilineal_figure': (angle, figure, base),
+        'square_on_line': (Line(point(1, 1), point(3, 2)),),
+        'equilateral_triangles': (sides,),
+        'bisect_lines': (sides,),
+        'perpendiculars_from_points_on_lines': (sides, sides[:, 0] + 0.25*(sides[:, 1] - sides[:, 0])),
+        'squares_on_lines': (sides,),
+    }
+
+def best_time(function, repeat: int) -> float:
+    """The shortest of repeat runs of function, in seconds"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+def peak_memory(function) -> int:
+    """The most memory function has allocated at once, in bytes"""
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def render_time(name: str, args: tuple) -> float:
+    """How long it takes to render a construction at low quality, in seconds"""
+    class Benchmark(Scene):
+        def construct(self):
+            CONSTRUCTIONS[name](self, *args)
+
+    with tempconfig({'quality': 'low_quality', 'preview': False, 'disable_caching': True, 'verbosity': 'ERROR'}):
+        start = time.perf_counter()
+        Benchmark().render()
+        return time.perf_counter() - start
+
+def benchmark_construction(name: str, repeat: int = 3, render: bool = False) -> dict:
+    """Measures one construction
+
+    Parameters
+    ----------
+    name :
+        the name of the construction
+    repeat :
+        how many times to run the timings, the fastest is kept
+    render :
+        whether to render it as well, which needs a working manim install with ffmpeg
+
+    Returns
+    -------
+    a dictionary of the measurements
+    """
+    function = CONSTRUCTIONS[name]
+    solver = getattr(geometry, name)
+
+    def solve():
+        geometry.clear_cache()
+        solver(*cases()[name])
+
+    def record():
+        geometry.clear_cache()
+        recorder = Recorder()
+        function(recorder, *cases()[name])
+        return recorder
+
+    recorder = record()
+    result = {
+        'operations': op_count(function),
+        'geometry_time': best_time(solve, repeat),
+        'record_time': best_time(record, repeat),
+        'play_count': recorder.timeline.get_play_count(),
+        'peak_mobject_count': max(recorder.timeline.get_live_counts(), default=0),
+        'mobject_count': recorder.get_mobject_count(),
+        'peak_memory': peak_memory(record),
+    }
+    if render:
+        result['render_time'] = render_time(name, cases()[name])
+    return result
+
+def benchmark_marked_line(repeat: int = 3) -> dict:
+    """Measures making and moving a MarkedLine with 17 ticks and 23 arrows"""
+    line = Line(point(0, 0), point(4, 1))
+    marked = MarkedLine(line, 17, 23)
+    return {
+        'build_time': best_time(lambda: MarkedLine(line, 17, 23), repeat),
+        'update_time': best_time(lambda: marked.put_start_and_end_on(point(1, 0), point(3, 3)), repeat),
+        'family_size': len(marked.get_family()),
+        'peak_memory': peak_memory(lambda: MarkedLine(line, 17, 23)),
+    }
+
+def run(names: list = None, repeat: int = 3, render: bool = False) -> dict:
+    """Runs the benchmarks
+
+    Parameters
+    ----------
+    names :
+        the constructions to run, all of them when None
+    repeat :
+        how many times to run each timing
+    render :
+        whether to render each construction as well
+
+    Returns
+    -------
+    a dictionary that can be written out as JSON
+    """
+    return {
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'constructions': {name: benchmark_construction(name, repeat, render) for name in (names or cases())},
+        'MarkedLine': benchmark_marked_line(repeat),
+    }
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmarks the constructions and MarkedLine and prints the results as JSON')
+    parser.add_argument('names', nargs='*', help='the constructions to run, all of them by default')
+    parser.add_argument('--repeat', type=int, default=3, help='how many times to run each timing')
+    parser.add_argument('--render', action='store_true', help='also render each construction at low quality')
+    parser.add_argument('--output', help='a file to write the JSON to instead of printing it')
+    options = parser.parse_args()
+
+    results = json.dumps(run(options.names, options.repeat, options.render), indent=2)
+    if options.output:
+        with open(options.output, 'w') as file:
+            file.write(results)
+    else:
+        sys.stdout.write(results + '\n')
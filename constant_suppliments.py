@@ -1,32 +1,166 @@
+import hashlib
+import os
 from manim import *
+from ManimHelpers.files import replacing
 
 HOT_PINK = '#ED109D'
 LETTER_FONT_SIZE = 30
 INDICATE_TIME = 2
+MIN_RUN_TIME = 0.5
+# where to keep glyph outlines between runs, nothing is written when None
+LABEL_CACHE_DIR = os.environ.get('MANIMHELPERS_LABEL_CACHE')
+PRIME = '′'
+SUBSCRIPT_SCALE = 0.6
 
-TEXT_A = Text('A', font_size=LETTER_FONT_SIZE)
-TEXT_B = Text('B', font_size=LETTER_FONT_SIZE)
-TEXT_C = Text('C', font_size=LETTER_FONT_SIZE)
-TEXT_D = Text('D', font_size=LETTER_FONT_SIZE)
-TEXT_E = Text('E', font_size=LETTER_FONT_SIZE)
-TEXT_F = Text('F', font_size=LETTER_FONT_SIZE)
-TEXT_G = Text('G', font_size=LETTER_FONT_SIZE)
-TEXT_H = Text('H', font_size=LETTER_FONT_SIZE)
-TEXT_I = Text('I', font_size=LETTER_FONT_SIZE)
-TEXT_J = Text('J', font_size=LETTER_FONT_SIZE)
-TEXT_K = Text('K', font_size=LETTER_FONT_SIZE)
-TEXT_L = Text('L', font_size=LETTER_FONT_SIZE)
-TEXT_M = Text('M', font_size=LETTER_FONT_SIZE)
-TEXT_N = Text('N', font_size=LETTER_FONT_SIZE)
-TEXT_O = Text('O', font_size=LETTER_FONT_SIZE)
-TEXT_P = Text('P', font_size=LETTER_FONT_SIZE)
-TEXT_Q = Text('Q', font_size=LETTER_FONT_SIZE)
-TEXT_R = Text('R', font_size=LETTER_FONT_SIZE)
-TEXT_S = Text('S', font_size=LETTER_FONT_SIZE)
-TEXT_T = Text('T', font_size=LETTER_FONT_SIZE)
-TEXT_U = Text('U', font_size=LETTER_FONT_SIZE)
-TEXT_V = Text('V', font_size=LETTER_FONT_SIZE)
-TEXT_W = Text('W', font_size=LETTER_FONT_SIZE)
-TEXT_X = Text('X', font_size=LETTER_FONT_SIZE)
-TEXT_Y = Text('Y', font_size=LETTER_FONT_SIZE)
-TEXT_Z = Text('Z', font_size=LETTER_FONT_SIZE)
+__all__ = [
+    'HOT_PINK', 'LETTER_FONT_SIZE', 'INDICATE_TIME', 'MIN_RUN_TIME', 'LABEL_CACHE_DIR', 'PRIME', 'SUBSCRIPT_SCALE', 'label',
+    *[f"TEXT_{chr(code)}" for code in range(ord('A'), ord('Z') + 1)],
+]
+
+_outlines = {}
+
+def glyph_outline(text: str, font: str = '') -> list:
+    """The outline of some text at LETTER_FONT_SIZE, rendered with Pango the first time it is asked for
+        and then kept in memory, and on disk under LABEL_CACHE_DIR if it is set
+
+    Parameters
+    ----------
+    text :
+        the text
+    font :
+        the font to render it in
+
+    Returns
+    -------
+    a list of arrays of points, one for each character
+    """
+    key = (text, font)
+    if key in _outlines:
+        return _outlines[key]
+
+    path = None
+    if LABEL_CACHE_DIR:
+        name = hashlib.sha1(repr((text, font, LETTER_FONT_SIZE)).encode()).hexdigest()
+        path = os.path.join(LABEL_CACHE_DIR, f"{name}.npz")
+        if os.path.exists(path):
+            with np.load(path) as saved:
+                _outlines[key] = [saved[f"arr_{i}"] for i in range(len(saved.files))]
+            return _outlines[key]
+
+    _outlines[key] = [character.points.copy() for character in Text(text, font=font, font_size=LETTER_FONT_SIZE).submobjects]
+    if path is not None:
+        with replacing(path, '.npz') as partial:
+            np.savez(partial, *_outlines[key])
+    return _outlines[key]
+
+def glyph(text: str, font: str = '', font_size: float = LETTER_FONT_SIZE, color: str = WHITE) -> VGroup:
+    """A filled copy of the outline of some text
+
+    Parameters
+    ----------
+    text :
+        the text
+    font :
+        the font
+    font_size :
+        how big it is
+    color :
+        what color it is
+
+    Returns
+    -------
+    a VGroup with a VMobject for each character
+    """
+    characters = VGroup(*[
+        VMobject(fill_color=color, fill_opacity=1, stroke_width=0).set_points(points)
+        for points in glyph_outline(text, font)
+    ])
+    return characters.scale(font_size/LETTER_FONT_SIZE, about_point=ORIGIN)
+
+def label(name: str, font_size: float = LETTER_FONT_SIZE, color: str = WHITE, font: str = '') -> VGroup:
+    """Makes the label of a point, like 'A', "A'", "A''" or 'A_1'
+
+    Parameters
+    ----------
+    name :
+        the letter, followed by any primes and then an underscore and the subscript
+    font_size :
+        how big the letter is
+    color :
+        what color it is
+    font :
+        the font
+
+    Returns
+    -------
+    a VGroup of the letter, the primes and the subscript
+    """
+    name, _, subscript = name.partition('_')
+    letter = name.rstrip("'")
+    primes = len(name) - len(letter)
+
+    main = glyph(letter, font, font_size, color)
+    parts = VGroup(main)
+    if primes:
+        parts.add(glyph(PRIME*primes, font, font_size, color).next_to(main, RIGHT, buff=0.02, aligned_edge=UP))
+    if subscript:
+        parts.add(
+            glyph(subscript, font, SUBSCRIPT_SCALE*font_size, color)
+                .next_to(parts, RIGHT, buff=0.02, aligned_edge=DOWN)
+                .shift(0.25*SUBSCRIPT_SCALE*main.height*DOWN)
+        )
+    return parts
+
+class _Letter(VGroup):
+    """The label of a letter that only renders it the first time it is used, see TEXT_A
+
+    Parameters
+    ----------
+    letter :
+        the letter
+    """
+
+    def __init__(self, letter: str):
+        self._parts = []
+        self._letter = None
+        super().__init__()
+        self._letter = letter
+
+    @property
+    def submobjects(self):
+        if self._letter is not None:
+            letter, self._letter = self._letter, None
+            self._parts = list(label(letter).submobjects)
+        return self._parts
+
+    @submobjects.setter
+    def submobjects(self, submobjects):
+        self._parts = submobjects
+
+# TEXT_A to TEXT_Z, each rendered the first time it is used instead of all at import
+TEXT_A = _Letter('A')
+TEXT_B = _Letter('B')
+TEXT_C = _Letter('C')
+TEXT_D = _Letter('D')
+TEXT_E = _Letter('E')
+TEXT_F = _Letter('F')
+TEXT_G = _Letter('G')
+TEXT_H = _Letter('H')
+TEXT_I = _Letter('I')
+TEXT_J = _Letter('J')
+TEXT_K = _Letter('K')
+TEXT_L = _Letter('L')
+TEXT_M = _Letter('M')
+TEXT_N = _Letter('N')
+TEXT_O = _Letter('O')
+TEXT_P = _Letter('P')
+TEXT_Q = _Letter('Q')
+TEXT_R = _Letter('R')
+TEXT_S = _Letter('S')
+TEXT_T = _Letter('T')
+TEXT_U = _Letter('U')
+TEXT_V = _Letter('V')
+TEXT_W = _Letter('W')
+TEXT_X = _Letter('X')
+TEXT_Y = _Letter('Y')
+TEXT_Z = _Letter('Z')
@@ -1,6 +1,11 @@
 from manim import *
+from ManimHelpers import geometry
+from ManimHelpers.registry import construction, get_dt, time_for
+from ManimHelpers.shapes import circles, retire_circles
+from ManimHelpers.timeline import moved, play_together, replayed, steps, trace
 
-def equilateral_triangle(s: Scene, base_AB: Line, time: float = 5) -> tuple:
+@construction(plays=5, names={'base_AB': 'AB', 'return': ('CB', 'CA')})
+def equilateral_triangle(s: Scene, base_AB: Line, time: float = None) -> tuple:
     """will construct an equilateral triangle using Prop 1.1 with 5 operations
     
     Parameters
@@ -16,26 +21,29 @@ def equilateral_triangle(s: Scene, base_AB: Line, time: float = 5) -> tuple:
     -------
     The two lines that make up the rest of the triangle, in counterclockwise order
     """
-    dt = time/5
+    dt = get_dt(equilateral_triangle, time)
     r = base_AB.get_length()
+    line_CB, line_CA = geometry.equilateral_triangle(base_AB)
 
-    circle_BCD = Circle(radius=r, color=WHITE).shift(base_AB.get_start())
+    circle_BCD = circles.get(r, base_AB.get_start())
     s.play(Create(circle_BCD), run_time=dt)
 
-    circle_ACE = Circle(radius=r, color=WHITE).shift(base_AB.get_end())
+    circle_ACE = circles.get(r, base_AB.get_end())
     s.play(Create(circle_ACE), run_time=dt)
 
-    line_AC = base_AB.copy().rotate(angle=60*DEGREES, about_point=base_AB.get_start())
+    line_AC = Line(*line_CA)
     s.play(Create(line_AC), run_time=dt)
 
-    line_BC = base_AB.copy().rotate(angle=-60*DEGREES, about_point=base_AB.get_end())
+    line_BC = Line(*line_CB)
     s.play(Create(line_BC), run_time=dt)
 
     s.play(FadeOut(circle_BCD, circle_ACE), run_time=dt)
+    retire_circles(s, circle_BCD, circle_ACE)
 
-    return line_BC, Line(line_AC.get_end(), line_AC.get_start())
+    return line_BC, line_AC
 
-def point_to_line(s: Scene, point_A: np.ndarray, line_BC: Line, time: float = 11) -> Line:
+@construction(plays=6, calls=(equilateral_triangle,), names={'point_A': 'A', 'line_BC': 'BC', 'return': 'AL'})
+def point_to_line(s: Scene, point_A: np.ndarray, line_BC: Line, time: float = None) -> Line:
     """Will construct a line from a point equal to a given line using prop 1.2 with 11 operations
     
     Parameters
@@ -53,40 +61,48 @@ def point_to_line(s: Scene, point_A: np.ndarray, line_BC: Line, time: float = 11
     -------
     The desired Line
     """
-    dt = time/11
+    dt = get_dt(point_to_line, time)
+    point_A = geometry.as_point(point_A)
+
+    line_AL = Line(*geometry.point_to_line(point_A, line_BC))
+    if np.allclose(point_A, line_BC.get_start()):
+        # the point is already on the line, so there is nothing to construct
+        s.play(Create(line_AL), run_time=time_for(point_to_line, dt))
+        return line_AL
 
     line_AB = Line(start=point_A, end=line_BC.get_start())
     s.play(Create(line_AB), run_time=dt)
 
-    line_AD, line_BD = equilateral_triangle(s, line_AB, time=dt*5)
+    line_DB, line_DA = equilateral_triangle(s, line_AB, time_for(equilateral_triangle, dt))
 
-    line_AE = Line(start=point_A, end=point_A + -1.5*line_AD.get_unit_vector()*line_BC.get_length())
+    line_AE = Line(start=point_A, end=point_A + 1.5*line_DA.get_unit_vector()*line_BC.get_length())
     s.play(Create(line_AE), run_time=dt)
 
-    line_BF = Line(start=line_BC.get_start(), end=line_BC.get_start() + -1.5*line_BD.get_unit_vector()*line_BC.get_length())
+    line_BF = Line(start=line_BC.get_start(), end=line_BC.get_start() + 1.5*line_DB.get_unit_vector()*line_BC.get_length())
     s.play(Create(line_BF), run_time=dt)
 
-    circle_CGH = Circle(radius=line_BC.get_length(), color=WHITE).shift(line_BC.get_start())
+    circle_CGH = circles.get(line_BC.get_length(), line_BC.get_start())
     s.play(Create(circle_CGH), run_time=dt)
 
-    circle_GKL = Circle(radius=line_AB.get_length() + line_BC.get_length(), color=WHITE).shift(line_AD.get_end())
+    circle_GKL = circles.get(line_AB.get_length() + line_BC.get_length(), line_DA.get_start())
     s.play(Create(circle_GKL), run_time=dt)
 
-    line_AL = Line(point_A, point_A + -line_AD.get_unit_vector()*line_BC.get_length())
     s.add(line_AL)
     
     s.play(FadeOut(
         line_AB,
-        line_AD,
-        line_BD,
+        line_DA,
+        line_DB,
         line_AE,
         line_BF,
         circle_CGH,
         circle_GKL
     ), run_time=dt)
+    retire_circles(s, circle_CGH, circle_GKL)
     return line_AL
 
-def cut_seperate_line_to_length(s: Scene, greater_line: Line, lesser_line: Line, time: float = 13) -> Point:
+@construction(plays=2, calls=(point_to_line,), names={'greater_line': 'AB', 'lesser_line': ('C', None), 'return': 'E'})
+def cut_seperate_line_to_length(s: Scene, greater_line: Line, lesser_line: Line, time: float = None) -> np.ndarray:
     """Will use a circle to cut a given length out of another length using prop 1.3 with 13 operations.
     If greater_line and lesser_line start from the same point then 3 operations.
     
@@ -105,16 +121,18 @@ def cut_seperate_line_to_length(s: Scene, greater_line: Line, lesser_line: Line,
     -------
     The point where greater_line was cut.
     """
-    dt = time / 13
+    dt = get_dt(cut_seperate_line_to_length, time)
 
-    line_AD = point_to_line(s, greater_line.get_start(), lesser_line, time=dt*11)
-    circle_DEF = Circle(radius=line_AD.get_length(), color=WHITE).shift(greater_line.get_start())
+    line_AD = point_to_line(s, greater_line.get_start(), lesser_line, time_for(point_to_line, dt))
+    circle_DEF = circles.get(line_AD.get_length(), greater_line.get_start())
     s.play(Create(circle_DEF), run_time=dt)
-    point_E = greater_line.get_start() + greater_line.get_unit_vector()*line_AD.get_length()
+    point_E = geometry.cut_seperate_line_to_length(greater_line, lesser_line)
     s.play(FadeOut(circle_DEF, line_AD), run_time=dt)
+    retire_circles(s, circle_DEF)
     return point_E
 
-def cut_coincident_line_to_length(s: Scene, greater_line: Line, lesser_line: Line, time: float = 2) -> Point:
+@construction(plays=2, names={'greater_line': 'AB', 'lesser_line': 'AC', 'return': 'E'})
+def cut_coincident_line_to_length(s: Scene, greater_line: Line, lesser_line: Line, time: float = None) -> np.ndarray:
     """Will cut greater_line to the length of lesser_line assuming they are coincident in 2 operations
     
     Parameters
@@ -132,16 +150,18 @@ def cut_coincident_line_to_length(s: Scene, greater_line: Line, lesser_line: Lin
     -------
     The Point on the greater line that was cut
     """
-    dt = time / 2
-    circle = Circle(lesser_line.length(), color=WHITE).shift(greater_line.get_start())
+    dt = get_dt(cut_coincident_line_to_length, time)
+    circle = circles.get(lesser_line.get_length(), greater_line.get_start())
     s.play(Create(circle), run_time=dt)
-    point = greater_line.get_start() + greater_line.get_unit_vector()*lesser_line.get_length()
+    point = geometry.cut_coincident_line_to_length(greater_line, lesser_line)
     s.play(FadeOut(circle), run_time=dt)
+    retire_circles(s, circle)
     return point
 
-def bisect_angle(s: Scene, line_AB: Line, line_CA: Line, time: float = 10) -> Line:
-    """Cuts an angle in half. Assumes the line that cuts will start at line_1.get_start() and line_2.get_start()
-        and will be in same direction as both lines. Performs using I.9 in 10 operations.
+@construction(plays=3, calls=(cut_coincident_line_to_length, equilateral_triangle), names={'line_AB': 'AB', 'line_CA': 'CA', 'return': 'AF'})
+def bisect_angle(s: Scene, line_AB: Line, line_CA: Line, time: float = None) -> Line:
+    """Cuts an angle in half. Assumes the angle is at line_AB.get_start() and line_CA.get_end().
+        Performs using I.9 in 10 operations.
         
     Parameters
     ----------
@@ -149,7 +169,7 @@ def bisect_angle(s: Scene, line_AB: Line, line_CA: Line, time: float = 10) -> Li
         the Scene
     line_AB :
         one of the lines
-    line_AC :
+    line_CA :
         the other line
     time :
         how long the construction should take
@@ -158,40 +178,23 @@ def bisect_angle(s: Scene, line_AB: Line, line_CA: Line, time: float = 10) -> Li
     -------
     the Line that bisects the angle
     """
-    line_AC = Line(line_CA.get_end(), line_CA.get_start())
-    dt = time / 10
+    line_AC = geometry.Segment(line_CA.get_end(), line_CA.get_start())
+    dt = get_dt(bisect_angle, time)
 
     point_D = line_AB.get_start() + line_AB.get_unit_vector()*0.5*line_AB.get_length()
-    line_AD = Line(line_AB.get_start(), point_D)
-    point_E = cut_coincident_line_to_length(s, line_AC, line_AD, dt*2)
+    line_AD = geometry.Segment(line_AB.get_start(), point_D)
+    point_E = cut_coincident_line_to_length(s, line_AC, line_AD, time_for(cut_coincident_line_to_length, dt))
     line_DE = Line(point_D, point_E)
     s.play(Create(line_DE), run_time=dt)
 
-    angle_AB = line_AB.get_angle()
-    if angle_AB < 0: angle_AB = 2*PI + angle_AB
-    angle_AC = line_AC.get_angle()
-    if angle_AC < 0: angle_AC = 2*PI + angle_AC
-    polarity = -1
-    if angle_AB < PI:
-            if 0 <= angle_AC < angle_AB or 2*PI > angle_AC > angle_AB + PI:
-                polarity = True
-            else:
-                polarity = False
-    else:
-        if angle_AB - PI < angle_AC < angle_AB:
-            polarity = True
-        else:
-            polarity = False
-    if polarity == -1:
-        raise AssertionError("bisect line still has issues")
-
-    line_FD, line_FE = equilateral_triangle(s, Line(point_E, point_D), 5*dt)
-    line_AF = Line(line_AB.get_start(), line_FD.get_start())
+    line_FD, line_FE = equilateral_triangle(s, geometry.Segment(*geometry.base_away_from(line_AB.get_start(), point_E, point_D)), time_for(equilateral_triangle, dt))
+    line_AF = Line(*geometry.bisect_angle(line_AB, line_CA))
     s.play(Create(line_AF), run_time=dt)
     s.play(FadeOut(line_DE, line_FD, line_FE), run_time=dt)
     return line_AF
 
-def bisect_line(s: Scene, line_AB: Line, time: float = 16) -> Line:
+@construction(plays=1, calls=(equilateral_triangle, bisect_angle), names={'line_AB': 'AB', 'return': 'CD'})
+def bisect_line(s: Scene, line_AB: Line, time: float = None) -> Line:
     """Draws a perpendicular line off of line_AB using I.10 in 16 operations
     
     Parameters
@@ -206,21 +209,22 @@ def bisect_line(s: Scene, line_AB: Line, time: float = 16) -> Line:
     
     Returns
     -------
-    The bisector Line
+    The bisector Line, ending in the middle of line_AB
     """
-    dt = time / 16
-    line_CA, line_CB = equilateral_triangle(s, line_AB, 5*dt)
+    dt = get_dt(bisect_line, time)
+    line_CB, line_CA = equilateral_triangle(s, line_AB, time_for(equilateral_triangle, dt))
 
     bisector = bisect_angle(
         s,
-        line_CA,
         line_CB,
-        dt*10
+        geometry.Segment(line_CA.get_end(), line_CA.get_start()),
+        time_for(bisect_angle, dt)
     )
     s.play(FadeOut(line_CA, line_CB), run_time=dt)
     return bisector
 
-def perpendicular_from_point_on_line(s: Scene, line_AB: Line, point_C: Point, time: float = 9) -> Line:
+@construction(plays=2, calls=(cut_coincident_line_to_length, equilateral_triangle), names={'line_AB': 'AB', 'point_C': 'C', 'return': 'CF'})
+def perpendicular_from_point_on_line(s: Scene, line_AB: Line, point_C: np.ndarray, time: float = None) -> Line:
     """From a point on a line, creates a perpendicular line using I.11 in 9 operations
     
     Parameters
@@ -238,26 +242,24 @@ def perpendicular_from_point_on_line(s: Scene, line_AB: Line, point_C: Point, ti
     -------
     The perpendicular Line
     """
-    dt = time/9
-
-    line_AC = Line(line_AB.get_start(), point_C)
-    point_D = Dot(line_AC.get_start() + line_AC.get_unit_vector()*0.5*line_AC.get_length())
+    dt = get_dt(perpendicular_from_point_on_line, time)
+    point_C = geometry.as_point(point_C)
 
-    line_CD = Line(point_C, point_D.get_center())
-    line_CB = Line(point_C, line_AB.get_end())
-    line_CE = cut_coincident_line_to_length(s, line_CB, line_CD, dt*2)
+    point_D, point_E = geometry.straddle_points(line_AB, point_C)
+    line_CD = geometry.Segment(point_C, point_D)
+    point_E = cut_coincident_line_to_length(s, geometry.Segment(point_C, point_E), line_CD, time_for(cut_coincident_line_to_length, dt))
 
-    line_DE = Line(point_D, line_CE.get_end())
-    line_FD, line_FE = equilateral_triangle(s, line_DE, 5*dt)
+    line_FD, line_FE = equilateral_triangle(s, geometry.Segment(point_D, point_E), time_for(equilateral_triangle, dt))
 
-    line_CF = Line(point_C, line_FD.get_start())
+    line_CF = Line(*geometry.perpendicular_from_point_on_line(line_AB, point_C))
     s.play(Create(line_CF), run_time=dt)
 
-    s.play(FadeOut(line_CE, line_FD, line_FE), run_time=dt)
+    s.play(FadeOut(line_FD, line_FE), run_time=dt)
 
     return line_CF
 
-def perpendicular_from_point_off_line(s: Scene, line_AB: Line, point_C: Point, time: float = 20) -> Line:
+@construction(plays=4, calls=(bisect_line,), names={'line_AB': 'AB', 'point_C': 'C', 'return': 'CH'})
+def perpendicular_from_point_off_line(s: Scene, line_AB: Line, point_C: np.ndarray, time: float = None) -> Line:
     """Given a line and point not on the line, will drop a perpendicular using I.12 in 20 operations
     
     Parameters
@@ -275,40 +277,26 @@ def perpendicular_from_point_off_line(s: Scene, line_AB: Line, point_C: Point, t
     -------
     The perpendicular Line
     """
-    dt = time/20
-
-    line_CZ = Line(point_C, line_AB.get_start() + 0.5*line_AB.get_length()*line_AB.get_unit_vector())
-    line_CD = Line(point_C, line_CZ.get_end() + line_CZ.get_unit_vector())
+    dt = get_dt(perpendicular_from_point_off_line, time)
+    point_C = geometry.as_point(point_C)
 
-    circle_EFG = Circle(line_CD.get_length(), color=WHITE).shift(point_C.get_center())
+    line_GE = geometry.Segment(*geometry.perpendicular_chord(line_AB, point_C))
+    circle_EFG = circles.get(np.linalg.norm(line_GE.get_start() - point_C), point_C)
     s.play(Create(circle_EFG), run_time=dt)
-
-    # find intersection
-    m = line_AB.get_slope()
-    b = -m*line_AB.get_start()[0] + line_AB.get_start()[1]
-    r = line_CD.get_length()
-    y_c = point_C.get_center()[1]
-    x_c = point_C.get_center()[0]
-    zeta = b - y_c
-
-    x_1 = (-2*m*zeta + 2*x_c + np.sqrt((2*m*zeta - 2*x_c)**2 - 4*(m**2 + 1)*(zeta**2 + x_c**2 - r**2)))/2/(m**2 + 1)
-    x_2 = (-2*m*zeta + 2*x_c - np.sqrt((2*m*zeta - 2*x_c)**2 - 4*(m**2 + 1)*(zeta**2 + x_c**2 - r**2)))/2/(m**2 + 1)
-    y_1 = m*x_1 + b
-    y_2 = m*x_2 + b
-
-    line_GE = Line(np.array([x_1, y_1, 0]), np.array([x_2, y_2, 0]))
     
-    bisector_GE = bisect_line(s, line_GE, 16*dt)
+    bisector_GE = bisect_line(s, line_GE, time_for(bisect_line, dt))
     point_H = Dot(bisector_GE.get_end())
     s.play(FadeOut(bisector_GE), Create(point_H), run_time=dt)
 
-    line_CH = Line(point_C, point_H.get_center())
+    line_CH = Line(*geometry.perpendicular_from_point_off_line(line_AB, point_C))
     s.play(Create(line_CH), run_time=dt)
 
     s.play(FadeOut(point_H, circle_EFG), run_time=dt)
+    retire_circles(s, circle_EFG)
     return line_CH
 
-def triangle_from_lines(s: Scene, base_line: Line, line_A: Line, line_B: Line, line_C: Line, time = 47) ->  tuple:
+@construction(plays=8, calls=(cut_seperate_line_to_length,)*3, names={'base_line': 'DE', 'return': ('KF', 'FG', 'GK')})
+def triangle_from_lines(s: Scene, base_line: Line, line_A: Line, line_B: Line, line_C: Line, time: float = None, clockwise: bool = False) ->  tuple:
     """Will construct a triangle using I.22 from three given lines on a base line in 47 operations.
     
     Parameters
@@ -325,65 +313,43 @@ def triangle_from_lines(s: Scene, base_line: Line, line_A: Line, line_B: Line, l
         the third line
     time :
         how long it takes    
+    clockwise :
+        put the triangle on the right of base_line instead of the left
     
     Returns
     -------
     a tuple of the three lines that make up the triangle respective to (line_A, line_B, line_C)
     """
-    dt = time/47
-
-    line_DF = cut_seperate_line_to_length(s, base_line, line_A, 13*dt)
-    point_F = Dot(line_DF.get_end())
-    s.play(FadeOut(line_DF), Create(point_F), run_time=dt)
-    line_FE = Line(line_DF.get_end(), base_line.get_end())
-    line_FG = cut_seperate_line_to_length(s, line_FE, line_B, 13*dt)
-    point_G = Dot(line_FG.get_end())
-    s.play(FadeOut(line_FG), Create(point_G), run_time=dt)
-    line_GE = Line(line_FG.get_end(), base_line.get_end())
-    line_GH = cut_seperate_line_to_length(s, line_GE, line_C, 13*dt)
-    point_H = Dot(line_GH.get_end())
-    s.play(FadeOut(line_GH), Create(point_H), run_time=dt)
-
-    circle_DKL = Circle(radius=line_DF.get_length(), color=WHITE).shift(point_F.get_center)
+    dt = get_dt(triangle_from_lines, time)
+    line_KF, line_FG, line_GK = (Line(*line) for line in geometry.triangle_from_lines(base_line, line_A, line_B, line_C, clockwise))
+
+    point_F = Dot(cut_seperate_line_to_length(s, base_line, line_A, time_for(cut_seperate_line_to_length, dt)))
+    s.play(Create(point_F), run_time=dt)
+    line_FE = geometry.Segment(point_F.get_center(), base_line.get_end())
+    point_G = Dot(cut_seperate_line_to_length(s, line_FE, line_B, time_for(cut_seperate_line_to_length, dt)))
+    s.play(Create(point_G), run_time=dt)
+    line_GE = geometry.Segment(point_G.get_center(), base_line.get_end())
+    point_H = Dot(cut_seperate_line_to_length(s, line_GE, line_C, time_for(cut_seperate_line_to_length, dt)))
+    s.play(Create(point_H), run_time=dt)
+
+    circle_DKL = circles.get(line_A.get_length(), point_F.get_center())
     s.play(Create(circle_DKL), run_time=dt)
 
-    circle_KLH = Circle(line_GH.get_length(), color=WHITE).shift(point_G.get_center())
+    circle_KLH = circles.get(np.linalg.norm(point_H.get_center() - point_G.get_center()), point_G.get_center())
     s.play(Create(circle_KLH), run_time=dt)
 
-    x1 = point_F.get_center()[0]
-    x2 = point_G.get_center()[0]
-    y1 = point_F.get_center()()[1]
-    y2 = point_G.get_center()[1]
-    r1 = line_A.get_length()
-    r2 = line_B.get_length()
-
-    if y1 - y2 == 0:
-        kx = ((r1**2 - r2**2) - (x1**2 - x2**2))/(2*x2 - 2*x1)
-        lx = kx
-        ky = (2*y2 + np.sqrt(4*y2**2 - 4*(y2**2 + kx**2 - 2*kx*x2 + x2**2 - r2**2)))/2
-        ly = (2*y2 - np.sqrt(4*y2**2 - 4*(y2**2 + kx**2 - 2*kx*x2 + x2**2 - r2**2)))/2
-    else:
-        m = (x2 - x1)/(y1 - y2)
-        b = -1/2/(y1 - y2)*((r1**2 - r2**2) - (x1**2 - x2**2) - (y1**2 - y2**2))
-        A = 1 + m**2
-        B = -2*x1 + 2*b*m - 2*m*y1
-        C = x1**2 + b**2 - 2*b*y1 +  y1**2 - r1**2
-        kx = (-B + np.sqrt(B**2 - 4*A*C))/2/A
-        lx = (-B - np.sqrt(B**2 - 4*A*C))/2/A
-        ky = m*kx + b
-        ly = m*lx + b
-    
-    line_KF = Line(np.array([kx, ky, 0]), point_F.get_center())
     s.play(Create(line_KF), run_time=dt)
 
-    line_KG = Line(np.array([kx, ky, 0]), point_G.get_center())
-    s.play(Create(line_KG), run_time=dt)
+    s.play(Create(line_GK), run_time=dt)
 
+    s.add(line_FG)
     s.play(FadeOut(circle_KLH, circle_DKL, point_H, point_G, point_F), run_time=dt)
+    retire_circles(s, circle_KLH, circle_DKL)
 
-    return line_KF, line_FG, Line(line_KG.get_end(), line_KG.get_start())
+    return line_KF, line_FG, line_GK
     
-def equal_angle(s: Scene, line_AB: Line, point_A: np.ndarray, angle: tuple, time: float = 64) -> Line:
+@construction(plays=4, calls=(cut_seperate_line_to_length, triangle_from_lines), names={'line_AB': 'AB', 'point_A': 'A', 'angle': ('CD', 'CE'), 'return': 'FA'})
+def equal_angle(s: Scene, line_AB: Line, point_A: np.ndarray, angle: tuple, time: float = None) -> Line:
     """will construct an angle on a point on a line equal to a the angle of angle using I.23 in 64 operations
 
     Parameters
@@ -395,7 +361,7 @@ def equal_angle(s: Scene, line_AB: Line, point_A: np.ndarray, angle: tuple, time
     point_A :
         The point to construct the angle on
     angle :
-        A tuple of two lines forming an angle. Assumes counterclockwise order
+        A tuple of two lines from the same point forming an angle
     time :
         how long it takes
 
@@ -403,31 +369,30 @@ def equal_angle(s: Scene, line_AB: Line, point_A: np.ndarray, angle: tuple, time
     -------
     The line that makes the angle ending on A
     """
-    dt = time/64
+    dt = get_dt(equal_angle, time)
     line_CD, line_CE = angle
     line_DE = Line(line_CD.get_end(), line_CE.get_end())
     s.play(Create(line_DE), run_time=dt)
 
-    line_A = line_CD
-    line_B = line_CE
-    line_C = line_DE
-
-    line_AB = Line(point_A, line_AB.get_unit_vector()*1.1*(line_C.get_length() + line_B.get_length()))
-    line_AZ = Line(point_A, line_AB.get_unit_vector()*-1.1*line_A.get_length())
+    line_AZ, end = geometry.equal_angle_lines(line_AB, point_A, angle)
+    line_AZ = Line(*line_AZ)
     s.play(Create(line_AZ), run_time=dt)
 
-    line_AY = cut_seperate_line_to_length(s, line_AZ, line_A, 13*dt)
-    point_Y = Dot(line_AY.get_end())
-    s.play(FadeOut(line_AY), Create(point_Y), run_time=dt)
+    point_Y = Dot(cut_seperate_line_to_length(s, line_AZ, line_CD, time_for(cut_seperate_line_to_length, dt)))
+    s.play(Create(point_Y), run_time=dt)
 
-    line_YB = Line(point_Y.get_center(), line_AB.get_end())
-    line_FA, line_AG, line_FG = triangle_from_lines(s, line_YB, line_A, line_B, line_C, 47*dt)
+    line_YB = geometry.Segment(point_Y.get_center(), end)
+    line_FA, line_AG, line_GF = triangle_from_lines(
+        s, line_YB, line_CD, line_CE, line_DE, time_for(triangle_from_lines, dt),
+        clockwise=geometry.angle_is_counterclockwise(angle)
+    )
 
-    s.play(FadeOut(line_DE, line_AZ, point_Y, line_FG, line_AG), run_time=dt)
+    s.play(FadeOut(line_DE, line_AZ, point_Y, line_GF, line_AG), run_time=dt)
 
     return line_FA
 
-def parallel_line(s: Scene, point_A: np.ndarray, line_BC: Line, time: float = 68) -> Line:
+@construction(plays=4, calls=(equal_angle,), names={'point_A': 'A', 'line_BC': 'BC', 'return': 'EF'})
+def parallel_line(s: Scene, point_A: np.ndarray, line_BC: Line, time: float = None) -> Line:
     """Will construct a line parallel to line_BC, through point_A using I.31 in 68 operations
     
     Parameters
@@ -438,8 +403,6 @@ def parallel_line(s: Scene, point_A: np.ndarray, line_BC: Line, time: float = 68
         The point to draw the parallel line through
     line_BC :
         The direction the parallel line goes in
-    to_point :
-        The point to draw the parallel line to
     time :
         How long to take
 
@@ -447,7 +410,8 @@ def parallel_line(s: Scene, point_A: np.ndarray, line_BC: Line, time: float = 68
     -------
     The Line that is parallel
     """
-    dt = time / 68
+    dt = get_dt(parallel_line, time)
+    point_A = geometry.as_point(point_A)
 
     point_D = Dot(line_BC.get_start() + line_BC.get_unit_vector()*0.25*line_BC.get_length())
     s.play(Create(point_D), run_time=dt)
@@ -455,13 +419,13 @@ def parallel_line(s: Scene, point_A: np.ndarray, line_BC: Line, time: float = 68
     line_AD = Line(point_A, point_D.get_center())
     s.play(Create(line_AD), run_time=dt)
 
-    line_CD = Line(line_BC.get_end(), point_D.get_center())
-    line_DA = Line(line_AD.get_end(), line_AD.get_start())
-    line_EA = equal_angle(s, line_AD, point_A, (line_CD, line_DA), 64*dt)
+    line_DC = geometry.Segment(point_D.get_center(), line_BC.get_end())
+    line_DA = geometry.Segment(point_D.get_center(), point_A)
+    line_EA = equal_angle(s, line_AD, point_A, (line_DC, line_DA), time_for(equal_angle, dt))
 
-    line_AF = Line(point_A, point_A + line_EA.get_unit_vector()*line_EA.get_length())
+    line_EF = Line(*geometry.parallel_line(point_A, line_BC))
+    line_AF = Line(point_A, line_EF.get_end())
     s.play(Create(line_AF), run_time=dt)
-    line_EF = Line(line_EA.get_start(), line_AF.get_end())
 
     s.add(line_EF)
     s.remove(line_AF, line_EA)
@@ -469,8 +433,9 @@ def parallel_line(s: Scene, point_A: np.ndarray, line_BC: Line, time: float = 68
     s.play(FadeOut(line_AD, point_D), run_time=dt)
     return line_EF
 
-def parallelogram_from_angle_and_triangle(s: Scene, angle: tuple, triangle: tuple, time: float = 219) -> tuple:
-    """Constructs a prallelogram on an angle equal to the given triangle using I.42 in 219 operations.
+@construction(plays=3, calls=(bisect_line, equal_angle, (parallel_line, parallel_line)), names={'triangle': ('BA', 'AC', 'CB'), 'angle': (('D', None), ('D', None)), 'return': ('EC', 'CG', 'GF', 'FE')})
+def parallelogram_from_angle_and_triangle(s: Scene, angle: tuple, triangle: tuple, time: float = None) -> tuple:
+    """Constructs a prallelogram on an angle equal to the given triangle using I.42 in 151 operations.
         Assumes that half the third line of triangle will be the base of the parallelogram
     
     Parameters
@@ -480,51 +445,48 @@ def parallelogram_from_angle_and_triangle(s: Scene, angle: tuple, triangle: tupl
     angle :
         A tuple containing the two lines assuming counterclockwise order
     triangle :
-        A tuple of three lines containing the triangle assuming counterclockwise order
+        A tuple of three lines containing the triangle, each starting where the last ended
     time :
         how long it takes
     
     Returns
     -------
-    a tuple of the four lines making the parallelogram
+    a tuple of the four lines making the parallelogram, starting from the middle of the third line
     """
-    dt = time / 219
+    dt = get_dt(parallelogram_from_angle_and_triangle, time)
+    line_EC, line_CG, line_GF, line_FE = (Line(*line) for line in geometry.parallelogram_from_angle_and_triangle(angle, triangle))
 
-    line_AB = triangle[0]
-    line_AC = triangle[1]
-    line_BC = triangle[2]
-    line_BC_bisector = bisect_line(s, line_BC, dt*16)
-    point_E = Dot(line_BC_bisector.get_end())
-    s.play(Create(point_E), FadeOut(line_BC_bisector), run_time=dt)
+    line_BA, line_AC, line_CB = triangle
+    line_CB_bisector = bisect_line(s, line_CB, time_for(bisect_line, dt))
+    point_E = Dot(line_CB_bisector.get_end())
+    s.play(Create(point_E), FadeOut(line_CB_bisector), run_time=dt)
     
-    line_CE = Line(line_AC.get_end(), point_E.get_center())
+    line_CE = Line(line_CB.get_start(), point_E.get_center())
     s.add(line_CE)
-    line_EF = equal_angle(s, line_CE, line_CE.get_end(), angle, 64*dt)
-
-    line_AG = parallel_line(s, line_AB.get_start(), line_BC, 68*dt)
+    line_KE = equal_angle(s, line_CE, point_E.get_center(), angle, time_for(equal_angle, dt))
 
-    line_CG = parallel_line(s, line_BC.get_end(), line_EF, 68*dt)
-
-    point_G = line_intersection([line_AG.get_start(), line_AG.get_end()], [line_CG.get_start(), line_CG.get_end()])
-    point_F = line_intersection([line_AG.get_start(), line_AG.get_end()], [line_EF.get_start(), line_EF.get_end()])
+    line_AG, line_CG_long = play_together(
+        s,
+        steps(parallel_line, line_AC.get_start(), line_CB, time_for(parallel_line, dt)),
+        steps(parallel_line, line_CB.get_start(), line_KE, time_for(parallel_line, dt))
+    )
 
     s.play(
-        ReplacementTransform(line_AG, Line(line_AG.get_start(), point_G)),
-        ReplacementTransform(line_EF, Line(line_EF.get_start(), point_F)),
-        ReplacementTransform(line_CG, Line(line_CG.get_start(), point_G)),
+        ReplacementTransform(line_AG, line_GF),
+        ReplacementTransform(line_KE, line_FE),
+        ReplacementTransform(line_CG_long, line_CG),
         run_time=dt)
     
-    line_GF = Line(point_G, point_F)
-    s.add(line_GF)
-
-    line_EC = Line(line_CE.get_end(), line_CE.get_start())
+    s.remove(line_CE)
+    s.add(line_EC)
 
     s.play(FadeOut(point_E), run_time=dt)
 
-    return line_EC, line_CG, line_GF, Line(line_EF.get_end(), line_EF.get_start())
+    return line_EC, line_CG, line_GF, line_FE
 
-def parallelogram_from_angle_and_triangle_on_line(s: Scene, angle: tuple, triangle: tuple, line_AB: Line, time: float = 409) -> tuple:
-    """Will construct a parallelogram from an angle and triangle on a given line using I.44 in 409 operations
+@construction(plays=7, calls=(triangle_from_lines, parallelogram_from_angle_and_triangle, parallel_line, parallel_line), names={'line_AB': 'AB', 'angle': (('D', None), ('D', None)), 'return': ('AL', 'LM', 'MB')})
+def parallelogram_from_angle_and_triangle_on_line(s: Scene, angle: tuple, triangle: tuple, line_AB: Line, time: float = None) -> tuple:
+    """Will construct a parallelogram from an angle and triangle on a given line using I.44 in 341 operations
     
     Parameters
     ----------
@@ -543,48 +505,45 @@ def parallelogram_from_angle_and_triangle_on_line(s: Scene, angle: tuple, triang
     -------
     A tuple of the three remaining lines that make the parallelogram
     """
-    dt = time / 409
+    dt = get_dt(parallelogram_from_angle_and_triangle_on_line, time)
+    line_AL, line_LM, line_MB = (Line(*line) for line in geometry.parallelogram_from_angle_and_triangle_on_line(angle, triangle, line_AB))
 
-    line_A_prime_E_prime = Line(line_AB.get_start() - line_AB.get_unit_vector()*triangle[0].get_length(), line_AB.get_end() + line_AB.get_unit_vector()*(triangle[1].get_length() + triangle[2].get_length()))
+    line_A_prime_E_prime = Line(*geometry.triangle_base_on_line(triangle, line_AB))
     s.play(Create(line_A_prime_E_prime), run_time=dt)
-    line_A_prime, line_B_prime, line_C_prime = triangle_from_lines(s, line_A_prime_E_prime, triangle[0], triangle[1], triangle[2], 47*dt)
+    line_A_prime, line_B_prime, line_C_prime = triangle_from_lines(s, line_A_prime_E_prime, triangle[0], triangle[1], triangle[2], time_for(triangle_from_lines, dt))
 
-    line_BE, line_EF, line_GF, line_BG = parallelogram_from_angle_and_triangle(s, angle, (line_A_prime, line_B_prime, line_C_prime), 219*dt)
+    line_EB, line_BG, line_GF, line_FE = parallelogram_from_angle_and_triangle(s, angle, (line_C_prime, line_A_prime, line_B_prime), time_for(parallelogram_from_angle_and_triangle, dt))
 
     s.play(FadeOut(line_A_prime, line_B_prime, line_C_prime, line_A_prime_E_prime), run_time=dt)
 
-    line_AH = parallel_line(s, line_AB.get_start(), line_EF, 68*dt)
+    line_AH = parallel_line(s, line_AB.get_start(), line_FE, time_for(parallel_line, dt))
 
-    point_H = line_intersection([line_AH.get_start(), line_AH.get_end()], [line_GF.get_start(), line_GF.get_end()])
+    point_H = geometry.line_intersection(line_AH, line_GF)
 
-    line_GH = Line(line_BG.get_end(), point_H)
-    s.play(Create(line_GH), ReplacementTransform(line_AH, Line(line_AH.get_start(), point_H)), run_time=dt)
+    line_GH = Line(line_GF.get_start(), point_H)
+    line_AH_cut = Line(line_AH.get_start(), point_H)
+    s.play(Create(line_GH), ReplacementTransform(line_AH, line_AH_cut), run_time=dt)
 
     line_HB = Line(point_H, line_AB.get_end())
     s.play(Create(line_HB), run_time=dt)
 
-    point_K = line_intersection([line_HB.get_start(), line_HB.get_end()], [line_EF.get_start(), line_EF.get_end()])
+    point_K = geometry.line_intersection(line_HB, line_FE)
 
-    line_KM = parallel_line(s, point_K, line_GF, 68*dt)
+    line_KM = parallel_line(s, point_K, line_GF, time_for(parallel_line, dt))
 
-    point_M = line_intersection([line_KM.get_start(), line_KM.get_end()], [line_BG.get_start(), line_BG.get_end()])
-    line_MB = Line(point_M, line_AB.get_end())
+    line_KM_cut = Line(line_KM.get_start(), line_MB.get_start())
 
-    s.play(ReplacementTransform(line_KM, Line(line_KM.get_start(), point_M)), Create(line_BM), run_time=dt)
-
-    point_L = line_intersection([line_KM.get_start(), line_KM.get_end()], [line_AH.get_start(), line_AH.get_end()])
-
-    line_LM = Line(point_L, line_MB.get_start())
-    line_AL = Line(line_AB.get_start(), point_L)
+    s.play(ReplacementTransform(line_KM, line_KM_cut), Create(line_MB), run_time=dt)
 
     s.play(Create(line_LM), Create(line_AL), run_time=dt)
 
-    s.play(FadeOut(line_KM, line_HB, line_GH, line_AH, line_BE, line_EF, line_GF, line_BG), run_time=dt)
+    s.play(FadeOut(line_KM_cut, line_HB, line_GH, line_AH_cut, line_EB, line_FE, line_GF, line_BG), run_time=dt)
 
     return line_AL, line_LM, line_MB
 
-def parallelogram_from_angle_and_rectilineal_figure(s: Scene, angle: tuple, rect_fig: tuple, line_KF: Line, time: float = 820) -> tuple:
-    """Will construct a parallelogram from an angle and rectilineal figure from I.45 in 820 operations
+@construction(plays=2, calls=(parallelogram_from_angle_and_triangle_on_line,)*2, names={'rect_fig': ('AB', 'BC', 'CD', 'DA'), 'line_KF': 'KF', 'angle': (('E', None), ('E', None)), 'return': ('KM', 'ML', 'LF')})
+def parallelogram_from_angle_and_rectilineal_figure(s: Scene, angle: tuple, rect_fig: tuple, line_KF: Line, time: float = None) -> tuple:
+    """Will construct a parallelogram from an angle and rectilineal figure from I.45 in 684 operations
     
     Parameters
     ----------
@@ -601,30 +560,30 @@ def parallelogram_from_angle_and_rectilineal_figure(s: Scene, angle: tuple, rect
     
     Returns
     -------
-    a tuple of the other three Lines that make up the parallelogram in counterclockwise order
+    a tuple of the other three Lines that make up the parallelogram
     """
 
-    dt = time / 820
+    dt = get_dt(parallelogram_from_angle_and_rectilineal_figure, time)
+    line_KM, line_ML, line_LF = (Line(*line) for line in geometry.parallelogram_from_angle_and_rectilineal_figure(angle, rect_fig, line_KF))
 
     line_AB, line_BC, line_CD, line_DA = rect_fig
 
     line_DB = Line(line_CD.get_end(), line_BC.get_start())
     s.play(Create(line_DB), run_time=dt)
 
-    line_KH, line_GH, line_FG = parallelogram_from_angle_and_triangle_on_line(s, angle, (line_AB, line_DB, line_DA), line_KF, 409*dt)
+    line_KH, line_HG, line_GF = parallelogram_from_angle_and_triangle_on_line(s, angle, (line_AB, line_DB, line_DA), line_KF, time_for(parallelogram_from_angle_and_triangle_on_line, dt))
 
-    line_HM, line_LM, line_GL = parallelogram_from_angle_and_triangle_on_line(s, angle, (line_DB, line_BC, line_CD), line_GH, 409*dt)
+    line_HM, line_ML_drawn, line_LG = parallelogram_from_angle_and_triangle_on_line(s, angle, (line_DB, line_BC, line_CD), line_HG, time_for(parallelogram_from_angle_and_triangle_on_line, dt))
 
-    line_KM = Line(line_KH.get_start(), line_HM.get_end())
-    line_FL = Line(line_KF.get_end(), line_LM.get_start())
-    s.add(line_KM, line_FL)
+    s.add(line_KM, line_ML, line_LF)
 
-    s.play(FadeOut(line_GH, line_DB, line_FG, line_GL, line_KH, line_HM), run_time=dt)
+    s.play(FadeOut(line_HG, line_DB, line_GF, line_LG, line_KH, line_HM, line_ML_drawn), run_time=dt)
 
-    return line_KM, Line(line_LM.get_end(), line_LM.get_start()), Line(line_FL.get_end(), line_FL.get_start())
+    return line_KM, line_ML, line_LF
 
-def square_on_line(s: Scene, line_AB, time: float = 150) -> tuple:
-    """Will construct a square on a Line using I.46 in _ operations
+@construction(plays=3, calls=(perpendicular_from_point_on_line, cut_coincident_line_to_length, (parallel_line, parallel_line)), names={'line_AB': 'AB', 'return': ('BE', 'ED', 'DA')})
+def square_on_line(s: Scene, line_AB, time: float = None) -> tuple:
+    """Will construct a square on a Line using I.46 in 82 operations
     
     Parameters
     ----------
@@ -637,30 +596,130 @@ def square_on_line(s: Scene, line_AB, time: float = 150) -> tuple:
     
     Returns
     -------
-    a tuple of the three remaining lines of the square in clockwise order
+    a tuple of the three remaining lines of the square in counterclockwise order
     """
 
-    dt = time / 150
+    dt = get_dt(square_on_line, time)
+    line_BE, line_ED, line_DA = (Line(*line) for line in geometry.square_on_line(line_AB))
 
-    line_AC = perpendicular_from_point_on_line(s, line_AB, line_AB.get_start(), 9*dt)
+    line_AC = perpendicular_from_point_on_line(s, line_AB, line_AB.get_start(), time_for(perpendicular_from_point_on_line, dt))
 
-    point_D = Dot(cut_coincident_line_to_length(s, line_AC, line_AB, 2*dt))
+    point_D = Dot(cut_coincident_line_to_length(s, line_AC, line_AB, time_for(cut_coincident_line_to_length, dt)))
     s.play(Create(point_D), run_time=dt)
 
-    line_AD = Line(line_AB.get_start(), point_D.get_center())
-
-    line_DE = parallel_line(s, line_AD.get_end(), line_AB, 68*dt)
-
-    line_BE = parallel_line(s, line_AB.get_end(), line_AD, 68*dt)
+    line_AD = geometry.Segment(line_AB.get_start(), point_D.get_center())
 
-    point_E = line_intersection([line_DE.get_start(), line_DE.get_end()], [line_BE.get_start(), line_BE.get_end()])
+    line_DE, line_BE_long = play_together(
+        s,
+        steps(parallel_line, line_AD.get_end(), line_AB, time_for(parallel_line, dt)),
+        steps(parallel_line, line_AB.get_end(), line_AD, time_for(parallel_line, dt))
+    )
 
     s.play(
-        ReplacementTransform(line_DE, Line(line_DE.get_start(), point_E)),
-        ReplacementTransform(line_BE, Line(line_BE.get_start(), point_E)),
+        ReplacementTransform(line_DE, line_ED),
+        ReplacementTransform(line_BE_long, line_BE),
         run_time=dt
     )
 
+    s.add(line_DA)
     s.play(FadeOut(line_AC, point_D), run_time=dt)
 
-    return line_BE, Line(line_DE.get_end(), line_DE.get_start()), Line(line_AD.get_end(), line_AD.get_start())
\ No newline at end of file
+    return line_BE, line_ED, line_DA
+
+def _batch(s: Scene, each, solve, lines, *others, time: float = None) -> tuple:
+    # each construction is recorded once on the line from ORIGIN to RIGHT for every different shape of the
+    # other inputs, and the recording is copied onto each line. solve works out what they all return at once
+    lines = geometry.as_segments(lines)
+    solved = solve(lines, *others)
+    recorded = {}
+    generators = []
+    for index, (line, *other) in enumerate(zip(lines, *others)):
+        start, matrix = geometry.similarity(line)
+        normal = tuple((geometry.as_point(value) - start) @ np.linalg.inv(matrix).T for value in other)
+        key = geometry.geometry_key(normal)
+        if key not in recorded:
+            recorded[key] = trace(each, geometry.Segment(ORIGIN, RIGHT), *normal, time)
+        timeline, result = moved(*recorded[key], start, matrix)
+        for result_line, (result_start, result_end) in zip(result if isinstance(result, tuple) else (result,), solved[index].reshape(-1, 2, 3)):
+            result_line.put_start_and_end_on(result_start, result_end)
+        generators.append(replayed(timeline, result))
+    return play_together(s, *generators)
+
+@construction(plays=0, calls=(equilateral_triangle,))
+def equilateral_triangles(s: Scene, lines, time: float = None) -> tuple:
+    """Constructs an equilateral triangle on each of many lines side by side, one play for each operation of I.1.
+        The lines are not drawn, see geometry.equilateral_triangles for the results without animating
+    
+    Parameters
+    ----------
+    s :
+        The Scene
+    lines :
+        An array of shape (N, 2, 3) or a sequence of Lines
+    time :
+        How long it takes
+    
+    Returns
+    -------
+    a tuple of what equilateral_triangle returns for each line
+    """
+    return _batch(s, equilateral_triangle, geometry.equilateral_triangles, lines, time=time)
+
+@construction(plays=0, calls=(bisect_line,))
+def bisect_lines(s: Scene, lines, time: float = None) -> tuple:
+    """Bisects many lines side by side, one play for each operation of I.10
+    
+    Parameters
+    ----------
+    s :
+        The Scene
+    lines :
+        An array of shape (N, 2, 3) or a sequence of Lines
+    time :
+        How long it takes
+    
+    Returns
+    -------
+    a tuple of the bisector of each line
+    """
+    return _batch(s, bisect_line, geometry.bisect_lines, lines, time=time)
+
+@construction(plays=0, calls=(perpendicular_from_point_on_line,))
+def perpendiculars_from_points_on_lines(s: Scene, lines, points, time: float = None) -> tuple:
+    """Draws a perpendicular from a point on each of many lines side by side, one play for each operation of I.11
+    
+    Parameters
+    ----------
+    s :
+        The Scene
+    lines :
+        An array of shape (N, 2, 3) or a sequence of Lines
+    points :
+        An array of shape (N, 3) of a point on each line
+    time :
+        How long it takes
+    
+    Returns
+    -------
+    a tuple of the perpendicular on each line
+    """
+    return _batch(s, perpendicular_from_point_on_line, geometry.perpendiculars_from_points_on_lines, lines, points, time=time)
+
+@construction(plays=0, calls=(square_on_line,))
+def squares_on_lines(s: Scene, lines, time: float = None) -> tuple:
+    """Constructs a square on each of many lines side by side, one play for each operation of I.46
+    
+    Parameters
+    ----------
+    s :
+        The Scene
+    lines :
+        An array of shape (N, 2, 3) or a sequence of Lines
+    time :
+        How long it takes
+    
+    Returns
+    -------
+    a tuple of what square_on_line returns for each line
+    """
+    return _batch(s, square_on_line, geometry.squares_on_lines, lines, time=time)
\ No newline at end of file
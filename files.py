@@ -0,0 +1,27 @@
+import contextlib
+import os
+
+@contextlib.contextmanager
+def replacing(path: str, suffix: str = ''):
+    """Gives another name to write a file under and moves it onto path once it is written, so processes
+        running side by side never read half a file. The folder is made if it isn't there
+
+    Parameters
+    ----------
+    path :
+        the file
+    suffix :
+        what to end the other name with, for writers like np.savez that add their own
+
+    Returns
+    -------
+    the name to write to
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    partial = f"{path}.{os.getpid()}{suffix}"
+    try:
+        yield partial
+        os.replace(partial, path)
+    finally:
+        if os.path.exists(partial):
+            os.remove(partial)
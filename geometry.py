@@ -0,0 +1,832 @@
+import functools
+from collections import OrderedDict
+import numpy as np
+from ManimHelpers import intersections
+
+TOLERANCE = 1e-9
+QUANTUM = 1e-8
+CACHE_SIZE = 4096
+
+_cache = OrderedDict()
+_cache_stats = {'hits': 0, 'misses': 0}
+
+def as_point(point) -> np.ndarray:
+    """Turns a point given as an array, list or Mobject (Dot, Point) into a 3D array
+
+    Parameters
+    ----------
+    point :
+        The point
+
+    Returns
+    -------
+    The point as an array of shape (3,)
+    """
+    if hasattr(point, 'get_center'):
+        point = point.get_center()
+    point = np.asarray(point, dtype=float)
+    if point.shape == (2,):
+        point = np.append(point, 0.0)
+    return point
+
+class Segment:
+    """A line that is only used to work things out and never drawn. It has the same getters as a Line
+        without the bezier points and styling of a mobject.
+
+    Parameters
+    ----------
+    start :
+        where it starts
+    end :
+        where it ends
+    """
+    __slots__ = ('points',)
+
+    def __init__(self, start, end):
+        self.points = np.array([as_point(start), as_point(end)])
+
+    def __repr__(self):
+        return f"Segment({self.points[0].tolist()}, {self.points[1].tolist()})"
+
+    def __array__(self, dtype=None, copy=None):
+        return self.points.astype(dtype) if dtype is not None else self.points.copy()
+
+    def get_start(self) -> np.ndarray:
+        return self.points[0].copy()
+
+    def get_end(self) -> np.ndarray:
+        return self.points[1].copy()
+
+    def get_center(self) -> np.ndarray:
+        return (self.points[0] + self.points[1])/2
+
+    def get_vector(self) -> np.ndarray:
+        return self.points[1] - self.points[0]
+
+    def get_length(self) -> float:
+        return float(np.linalg.norm(self.points[1] - self.points[0]))
+
+    def get_unit_vector(self) -> np.ndarray:
+        return self.get_vector()/self.get_length()
+
+    def get_angle(self) -> float:
+        vector = self.get_vector()
+        return float(np.arctan2(vector[1], vector[0]))
+
+    def copy(self):
+        return Segment(*self.points)
+
+    def to_line(self, **kwargs):
+        """Promotes the segment to a manim Line for drawing
+
+        Parameters
+        ----------
+        **kwargs :
+            what to pass on to the Line
+
+        Returns
+        -------
+        the Line
+        """
+        from manim import Line
+        return Line(self.points[0], self.points[1], **kwargs)
+
+def as_segment(line) -> np.ndarray:
+    """Turns a Line, MarkedLine or array of two points into a segment
+
+    Parameters
+    ----------
+    line :
+        Anything with get_start and get_end, or an array of shape (2, 3)
+
+    Returns
+    -------
+    The segment as an array of shape (2, 3) holding the start and the end
+    """
+    if isinstance(line, Segment):
+        return line.points.copy()
+    if hasattr(line, 'get_start') and hasattr(line, 'get_end'):
+        return np.array([as_point(line.get_start()), as_point(line.get_end())])
+    start, end = line
+    return np.array([as_point(start), as_point(end)])
+
+def as_segments(lines) -> np.ndarray:
+    """Turns an array of shape (N, 2, 3) or any sequence of lines into an array of shape (N, 2, 3)"""
+    if isinstance(lines, np.ndarray):
+        return lines.astype(float).reshape(-1, 2, 3)
+    return np.array([as_segment(line) for line in lines]).reshape(-1, 2, 3)
+
+def segment(start, end) -> np.ndarray:
+    """Makes a segment from two points"""
+    return np.array([as_point(start), as_point(end)])
+
+def reverse(line) -> np.ndarray:
+    """The same segment going the other way"""
+    return as_segment(line)[::-1].copy()
+
+def length(line) -> float:
+    """The length of a segment"""
+    start, end = as_segment(line)
+    return float(np.linalg.norm(end - start))
+
+def unit_vector(line) -> np.ndarray:
+    """The unit vector pointing from the start of a segment to its end"""
+    start, end = as_segment(line)
+    return (end - start)/np.linalg.norm(end - start)
+
+def point_along(line, proportion: float) -> np.ndarray:
+    """The point a proportion of the way along a segment. 0.5 is the middle"""
+    start, end = as_segment(line)
+    return start + proportion*(end - start)
+
+def rotate(vector: np.ndarray, angle: float) -> np.ndarray:
+    """Rotates a vector, or an array of shape (..., 3) of them, counterclockwise about the z axis"""
+    c, s = np.cos(angle), np.sin(angle)
+    return np.stack([c*vector[..., 0] - s*vector[..., 1], s*vector[..., 0] + c*vector[..., 1], vector[..., 2]], axis=-1)
+
+def similarity(line) -> tuple:
+    """The turn and scale that takes the segment from ORIGIN to RIGHT onto line, so whatever is worked out
+        on that segment can be moved onto line with point @ matrix.T + start
+
+    Parameters
+    ----------
+    line :
+        the line
+
+    Returns
+    -------
+    the start of line and an array of shape (3, 3) that turns and scales about the origin
+    """
+    start, end = as_segment(line)
+    dx, dy = (end - start)[:2]
+    return start, np.array([[dx, -dy, 0], [dy, dx, 0], [0, 0, 1]])
+
+def cross(u: np.ndarray, v: np.ndarray) -> float:
+    """The z component of the cross product. Positive when v is counterclockwise of u"""
+    return float(u[0]*v[1] - u[1]*v[0])
+
+def line_intersection(line_1, line_2) -> np.ndarray:
+    """Intersects two segments as if they were extended forever
+
+    Parameters
+    ----------
+    line_1 :
+        The first line
+    line_2 :
+        The second line
+
+    Returns
+    -------
+    The point where the lines cross
+    """
+    point = intersections.line_line(as_segment(line_1), as_segment(line_2))
+    if np.isnan(point).any():
+        raise ValueError("Lines do not intersect")
+    return point
+
+def circle_line_intersection(center, radius: float, line) -> tuple:
+    """Intersects a circle with a segment extended forever
+
+    Parameters
+    ----------
+    center :
+        The center of the circle
+    radius :
+        The radius of the circle
+    line :
+        The line
+
+    Returns
+    -------
+    The two points in the order they are met going along the line
+    """
+    points = intersections.circle_line(as_point(center), radius, as_segment(line))
+    if np.isnan(points).any():
+        raise ValueError("The circle and line do not intersect")
+    return points[0], points[1]
+
+def circle_circle_intersection(center_1, radius_1: float, center_2, radius_2: float) -> tuple:
+    """Intersects two circles
+
+    Parameters
+    ----------
+    center_1 :
+        The center of the first circle
+    radius_1 :
+        The radius of the first circle
+    center_2 :
+        The center of the second circle
+    radius_2 :
+        The radius of the second circle
+
+    Returns
+    -------
+    The two points, the first to the left of the line from center_1 to center_2 and the second to the right
+    """
+    points = intersections.circle_circle(as_point(center_1), radius_1, as_point(center_2), radius_2)
+    if np.isnan(points).any():
+        raise ValueError("The circles do not intersect")
+    return points[0], points[1]
+
+def base_away_from(point, start, end) -> np.ndarray:
+    """Orders a base so an equilateral triangle built on it points away from a point
+
+    Parameters
+    ----------
+    point :
+        The point the triangle should point away from
+    start :
+        One end of the base
+    end :
+        The other end of the base
+
+    Returns
+    -------
+    The base as a segment
+    """
+    start = as_point(start)
+    end = as_point(end)
+    if cross(end - start, as_point(point) - start) > 0:
+        return segment(end, start)
+    return segment(start, end)
+
+def straddle_points(line_AB, point_C) -> tuple:
+    """The two points on line_AB equally far on either side of point_C used by I.11
+
+    Parameters
+    ----------
+    line_AB :
+        The line
+    point_C :
+        The point on the line
+
+    Returns
+    -------
+    The point towards the start of line_AB and the point towards its end
+    """
+    start, end = as_segment(line_AB)
+    point_C = as_point(point_C)
+    direction = unit_vector(line_AB)
+    d = 0.5*np.linalg.norm(point_C - start)
+    if d < TOLERANCE:
+        d = 0.5*np.linalg.norm(end - point_C)
+    return point_C - d*direction, point_C + d*direction
+
+def perpendicular_chord(line_AB, point_C) -> np.ndarray:
+    """The chord of line_AB cut by the circle I.12 draws about point_C
+
+    Parameters
+    ----------
+    line_AB :
+        The line
+    point_C :
+        The point off the line
+
+    Returns
+    -------
+    The chord as a segment. The circle's radius is the distance from point_C to either end
+    """
+    point_C = as_point(point_C)
+    point_Z = point_along(line_AB, 0.5)
+    radius = np.linalg.norm(point_Z - point_C) + 1
+    return segment(*circle_line_intersection(point_C, radius, line_AB))
+
+def equal_angle_lines(line_AB, point_A, angle: tuple) -> tuple:
+    """The lines I.23 lays out along line_AB before building its triangle
+
+    Parameters
+    ----------
+    line_AB :
+        The line the angle is constructed on
+    point_A :
+        The point the angle is constructed on
+    angle :
+        A tuple of two lines forming an angle
+
+    Returns
+    -------
+    The line from point_A backwards that is cut for the first side, and the point the base of the triangle ends at
+    """
+    point_A = as_point(point_A)
+    line_CD, line_CE = angle
+    direction = unit_vector(line_AB)
+    line_DE = segment(as_segment(line_CD)[1], as_segment(line_CE)[1])
+    line_AZ = segment(point_A, point_A - 1.1*length(line_CD)*direction)
+    end = point_A + 1.1*(length(line_DE) + length(line_CE))*direction
+    return line_AZ, end
+
+def angle_is_counterclockwise(angle: tuple) -> bool:
+    """Whether the second line of an angle is counterclockwise of the first"""
+    line_CD, line_CE = angle
+    return cross(unit_vector(line_CD), unit_vector(line_CE)) > 0
+
+def triangle_base_on_line(triangle: tuple, line_AB) -> np.ndarray:
+    """The line I.44 builds its copy of the triangle on so that it starts at the end of line_AB
+
+    Parameters
+    ----------
+    triangle :
+        A tuple of three lines making a triangle
+    line_AB :
+        The line the parallelogram goes on
+
+    Returns
+    -------
+    The base line as a segment
+    """
+    start, end = as_segment(line_AB)
+    direction = unit_vector(line_AB)
+    line_A, line_B, line_C = triangle
+    return segment(
+        end - direction*length(line_A),
+        end + 1.1*direction*(length(line_B) + length(line_C))
+    )
+
+def geometry_key(value):
+    """Turns the inputs of a construction into something hashable, rounding coordinates to QUANTUM
+        so the same figure reached by different arithmetic gives the same key
+
+    Parameters
+    ----------
+    value :
+        A Line, point, array, number or tuple of them
+
+    Returns
+    -------
+    The key
+    """
+    if isinstance(value, Segment) or hasattr(value, 'get_start') and hasattr(value, 'get_end'):
+        value = as_segment(value)
+    elif hasattr(value, 'get_center'):
+        value = as_point(value)
+    if isinstance(value, np.ndarray):
+        return value.shape, tuple(np.round(value.ravel()/QUANTUM).astype(np.int64).tolist())
+    if isinstance(value, (tuple, list)):
+        return tuple(geometry_key(item) for item in value)
+    if isinstance(value, float):
+        return round(value/QUANTUM)
+    return value
+
+def _copy_result(result):
+    if isinstance(result, tuple):
+        return tuple(_copy_result(item) for item in result)
+    return result.copy()
+
+def memoize(function):
+    """Caches a construction's result by its quantized input geometry, keeping the CACHE_SIZE most recently used
+
+    Parameters
+    ----------
+    function :
+        the construction
+
+    Returns
+    -------
+    the cached construction
+    """
+    @functools.wraps(function)
+    def cached(*args, **kwargs):
+        key = (function.__name__, geometry_key(args), geometry_key(tuple(sorted(kwargs.items()))))
+        if key in _cache:
+            _cache.move_to_end(key)
+            _cache_stats['hits'] += 1
+            return _copy_result(_cache[key])
+        _cache_stats['misses'] += 1
+        result = function(*args, **kwargs)
+        _cache[key] = _copy_result(result)
+        if len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+        return result
+    return cached
+
+def clear_cache():
+    """Forgets every cached construction"""
+    _cache.clear()
+    _cache_stats['hits'] = 0
+    _cache_stats['misses'] = 0
+
+def cache_info() -> dict:
+    """How often the cache has been used, and how full it is"""
+    return dict(_cache_stats, size=len(_cache), max_size=CACHE_SIZE)
+
+@memoize
+def equilateral_triangle(base_AB) -> tuple:
+    """The geometry of Prop I.1
+
+    Parameters
+    ----------
+    base_AB :
+        The Line or segment that makes the base of the triangle.
+
+    Returns
+    -------
+    The two segments that make up the rest of the triangle, both starting from the new vertex
+    """
+    point_A, point_B = as_segment(base_AB)
+    point_C = point_A + rotate(point_B - point_A, np.pi/3)
+    return segment(point_C, point_B), segment(point_C, point_A)
+
+@memoize
+def point_to_line(point_A, line_BC) -> np.ndarray:
+    """The geometry of Prop I.2
+
+    Parameters
+    ----------
+    point_A :
+        The point to draw from
+    line_BC :
+        The length to match
+
+    Returns
+    -------
+    The segment from point_A equal to line_BC
+    """
+    point_A = as_point(point_A)
+    point_B, point_C = as_segment(line_BC)
+    if np.linalg.norm(point_B - point_A) < TOLERANCE:
+        return segment(point_A, point_C)
+    line_DB, line_DA = equilateral_triangle(segment(point_A, point_B))
+    return segment(point_A, point_A + unit_vector(line_DA)*length(line_BC))
+
+@memoize
+def cut_seperate_line_to_length(greater_line, lesser_line) -> np.ndarray:
+    """The geometry of Prop I.3
+
+    Parameters
+    ----------
+    greater_line :
+        A line longer than the other line
+    lesser_line :
+        A line shorter than the other line
+
+    Returns
+    -------
+    The point where greater_line was cut.
+    """
+    start = as_segment(greater_line)[0]
+    line_AD = point_to_line(start, lesser_line)
+    return start + unit_vector(greater_line)*length(line_AD)
+
+def cut_coincident_line_to_length(greater_line, lesser_line) -> np.ndarray:
+    """The geometry of cutting greater_line to the length of lesser_line when they are coincident
+
+    Parameters
+    ----------
+    greater_line :
+        The longer line
+    lesser_line :
+        The shorter line
+
+    Returns
+    -------
+    The point on the greater line that was cut
+    """
+    start = as_segment(greater_line)[0]
+    return start + unit_vector(greater_line)*length(lesser_line)
+
+@memoize
+def bisect_angle(line_AB, line_CA) -> np.ndarray:
+    """The geometry of Prop I.9
+
+    Parameters
+    ----------
+    line_AB :
+        one of the lines, starting at the vertex
+    line_CA :
+        the other line, ending at the vertex
+
+    Returns
+    -------
+    the segment from the vertex that bisects the angle
+    """
+    point_A, point_B = as_segment(line_AB)
+    point_C = as_segment(line_CA)[0]
+    point_D = point_along(line_AB, 0.5)
+    point_E = cut_coincident_line_to_length(segment(point_A, point_C), segment(point_A, point_D))
+    line_FD, line_FE = equilateral_triangle(base_away_from(point_A, point_E, point_D))
+    return segment(point_A, line_FD[0])
+
+@memoize
+def bisect_line(line_AB) -> np.ndarray:
+    """The geometry of Prop I.10
+
+    Parameters
+    ----------
+    line_AB :
+        The line to bisect
+
+    Returns
+    -------
+    The bisector, from the vertex of the equilateral triangle on line_AB to the middle of line_AB
+    """
+    line_CB, line_CA = equilateral_triangle(line_AB)
+    return bisect_angle(line_CB, reverse(line_CA))
+
+@memoize
+def perpendicular_from_point_on_line(line_AB, point_C) -> np.ndarray:
+    """The geometry of Prop I.11
+
+    Parameters
+    ----------
+    line_AB :
+        The line
+    point_C :
+        The point
+
+    Returns
+    -------
+    The perpendicular segment, on the left of line_AB
+    """
+    point_C = as_point(point_C)
+    point_D, point_E = straddle_points(line_AB, point_C)
+    line_FD, line_FE = equilateral_triangle(segment(point_D, point_E))
+    return segment(point_C, line_FD[0])
+
+@memoize
+def perpendicular_from_point_off_line(line_AB, point_C) -> np.ndarray:
+    """The geometry of Prop I.12
+
+    Parameters
+    ----------
+    line_AB :
+        The line to drop the perpendicular onto
+    point_C :
+        The point to drop the perpendicular from
+
+    Returns
+    -------
+    The perpendicular segment
+    """
+    point_C = as_point(point_C)
+    bisector_GE = bisect_line(perpendicular_chord(line_AB, point_C))
+    return segment(point_C, bisector_GE[1])
+
+@memoize
+def triangle_from_lines(base_line, line_A, line_B, line_C, clockwise: bool = False) -> tuple:
+    """The geometry of Prop I.22
+
+    Parameters
+    ----------
+    base_line :
+        the line (longer than line_A + line_B + line_C) to build the triangle on
+    line_A :
+        the first line
+    line_B :
+        the second line
+    line_C :
+        the third line
+    clockwise :
+        put the new vertex on the right of base_line instead of the left
+
+    Returns
+    -------
+    a tuple of the three segments that make up the triangle respective to (line_A, line_B, line_C)
+    """
+    end = as_segment(base_line)[1]
+    point_F = cut_seperate_line_to_length(base_line, line_A)
+    point_G = cut_seperate_line_to_length(segment(point_F, end), line_B)
+    point_H = cut_seperate_line_to_length(segment(point_G, end), line_C)
+    point_K_left, point_K_right = circle_circle_intersection(
+        point_F, length(line_A),
+        point_G, np.linalg.norm(point_H - point_G)
+    )
+    point_K = point_K_right if clockwise else point_K_left
+    return segment(point_K, point_F), segment(point_F, point_G), segment(point_G, point_K)
+
+@memoize
+def equal_angle(line_AB, point_A, angle: tuple) -> np.ndarray:
+    """The geometry of Prop I.23
+
+    Parameters
+    ----------
+    line_AB :
+        The line to construct the angle on
+    point_A :
+        The point to construct the angle on
+    angle :
+        A tuple of two lines from the same point forming an angle
+
+    Returns
+    -------
+    The segment that makes the angle ending on A
+    """
+    line_CD, line_CE = angle
+    line_DE = segment(as_segment(line_CD)[1], as_segment(line_CE)[1])
+    line_AZ, end = equal_angle_lines(line_AB, point_A, angle)
+    point_Y = cut_seperate_line_to_length(line_AZ, line_CD)
+    line_FA, line_AG, line_GF = triangle_from_lines(
+        segment(point_Y, end), line_CD, line_CE, line_DE,
+        clockwise=angle_is_counterclockwise(angle)
+    )
+    return line_FA
+
+@memoize
+def parallel_line(point_A, line_BC) -> np.ndarray:
+    """The geometry of Prop I.31
+
+    Parameters
+    ----------
+    point_A :
+        The point to draw the parallel line through
+    line_BC :
+        The direction the parallel line goes in
+
+    Returns
+    -------
+    The parallel segment, with point_A in its middle
+    """
+    point_A = as_point(point_A)
+    point_C = as_segment(line_BC)[1]
+    point_D = point_along(line_BC, 0.25)
+    line_EA = equal_angle(segment(point_A, point_D), point_A, (segment(point_D, point_C), segment(point_D, point_A)))
+    return segment(line_EA[0], point_A + unit_vector(line_EA)*length(line_EA))
+
+@memoize
+def parallelogram_from_angle_and_triangle(angle: tuple, triangle: tuple) -> tuple:
+    """The geometry of Prop I.42. Half the third line of triangle will be the base of the parallelogram
+
+    Parameters
+    ----------
+    angle :
+        A tuple containing the two lines assuming counterclockwise order
+    triangle :
+        A tuple of three lines containing the triangle, each starting where the last ended
+
+    Returns
+    -------
+    a tuple of the four segments making the parallelogram, starting from the middle of the third line
+    """
+    point_A = as_segment(triangle[1])[0]
+    point_C = as_segment(triangle[2])[0]
+    point_E = bisect_line(triangle[2])[1]
+
+    line_FE = equal_angle(segment(point_C, point_E), point_E, angle)
+    line_AG = parallel_line(point_A, triangle[2])
+    line_CG = parallel_line(point_C, line_FE)
+
+    point_G = line_intersection(line_AG, line_CG)
+    point_F = line_intersection(line_AG, line_FE)
+    return segment(point_E, point_C), segment(point_C, point_G), segment(point_G, point_F), segment(point_F, point_E)
+
+@memoize
+def parallelogram_from_angle_and_triangle_on_line(angle: tuple, triangle: tuple, line_AB) -> tuple:
+    """The geometry of Prop I.44
+
+    Parameters
+    ----------
+    angle :
+        A tuple of two lines in counterclockwise order
+    triangle :
+        A tuple of three lines making a triangle in counterclockwise order
+    line_AB :
+        The line to build the parallelogram on
+
+    Returns
+    -------
+    A tuple of the three remaining segments that make the parallelogram
+    """
+    point_A, point_B = as_segment(line_AB)
+    line_K_prime_F_prime, line_F_prime_G_prime, line_G_prime_K_prime = triangle_from_lines(
+        triangle_base_on_line(triangle, line_AB), *triangle
+    )
+    line_EB, line_BG, line_GF, line_FE = parallelogram_from_angle_and_triangle(
+        angle, (line_G_prime_K_prime, line_K_prime_F_prime, line_F_prime_G_prime)
+    )
+
+    line_AH = parallel_line(point_A, line_FE)
+    point_H = line_intersection(line_AH, line_GF)
+    point_K = line_intersection(segment(point_H, point_B), line_FE)
+
+    line_KM = parallel_line(point_K, line_GF)
+    point_M = line_intersection(line_KM, line_BG)
+    point_L = line_intersection(line_KM, line_AH)
+    return segment(point_A, point_L), segment(point_L, point_M), segment(point_M, point_B)
+
+@memoize
+def parallelogram_from_angle_and_rectilineal_figure(angle: tuple, rect_fig: tuple, line_KF) -> tuple:
+    """The geometry of Prop I.45
+
+    Parameters
+    ----------
+    angle :
+        a tuple of two lines in counterclockwise order
+    rect_fig :
+        A tuple of four lines making a rectilineal figure in counterclockwise order
+    line_KF :
+        The line to draw the parallelogram on
+
+    Returns
+    -------
+    a tuple of the other three segments that make up the parallelogram
+    """
+    line_AB, line_BC, line_CD, line_DA = rect_fig
+    line_DB = segment(as_segment(line_CD)[1], as_segment(line_BC)[0])
+
+    line_KH, line_HG, line_GF = parallelogram_from_angle_and_triangle_on_line(angle, (line_AB, line_DB, line_DA), line_KF)
+    line_HL, line_LM, line_MG = parallelogram_from_angle_and_triangle_on_line(angle, (line_DB, line_BC, line_CD), line_HG)
+
+    point_K, point_F = as_segment(line_KF)
+    return segment(point_K, line_HL[1]), line_LM, segment(line_MG[0], point_F)
+
+@memoize
+def square_on_line(line_AB) -> tuple:
+    """The geometry of Prop I.46
+
+    Parameters
+    ----------
+    line_AB :
+        The first line of the square
+
+    Returns
+    -------
+    a tuple of the three remaining segments of the square in counterclockwise order
+    """
+    point_A, point_B = as_segment(line_AB)
+    line_AC = perpendicular_from_point_on_line(line_AB, point_A)
+    point_D = cut_coincident_line_to_length(line_AC, line_AB)
+    line_AD = segment(point_A, point_D)
+
+    line_DE = parallel_line(point_D, line_AB)
+    line_BE = parallel_line(point_B, line_AD)
+    point_E = line_intersection(line_DE, line_BE)
+    return segment(point_B, point_E), segment(point_E, point_D), segment(point_D, point_A)
+
+def equilateral_triangles(lines) -> np.ndarray:
+    """The geometry of Prop I.1 on many bases at once
+
+    Parameters
+    ----------
+    lines :
+        An array of shape (N, 2, 3) of the bases
+
+    Returns
+    -------
+    An array of shape (N, 2, 2, 3) of the two segments of each triangle, like equilateral_triangle
+    """
+    lines = as_segments(lines)
+    point_A, point_B = lines[:, 0], lines[:, 1]
+    point_C = point_A + rotate(point_B - point_A, np.pi/3)
+    return np.stack([np.stack([point_C, point_B], axis=1), np.stack([point_C, point_A], axis=1)], axis=1)
+
+def bisect_lines(lines) -> np.ndarray:
+    """The geometry of Prop I.10 on many lines at once
+
+    Parameters
+    ----------
+    lines :
+        An array of shape (N, 2, 3) of the lines to bisect
+
+    Returns
+    -------
+    An array of shape (N, 2, 3) of the bisectors, like bisect_line
+    """
+    lines = as_segments(lines)
+    apex = equilateral_triangles(lines)[:, 0, 0]
+    return np.stack([apex, lines.mean(axis=1)], axis=1)
+
+def perpendiculars_from_points_on_lines(lines, points) -> np.ndarray:
+    """The geometry of Prop I.11 on many lines at once
+
+    Parameters
+    ----------
+    lines :
+        An array of shape (N, 2, 3) of the lines
+    points :
+        An array of shape (N, 3) of the points on them
+
+    Returns
+    -------
+    An array of shape (N, 2, 3) of the perpendiculars, like perpendicular_from_point_on_line
+    """
+    lines = as_segments(lines)
+    points = np.array([as_point(point) for point in points]).reshape(-1, 3)
+    start, end = lines[:, 0], lines[:, 1]
+    direction = (end - start)/np.linalg.norm(end - start, axis=-1, keepdims=True)
+
+    # straddle_points, taking the far side when the point is the start of the line
+    d = 0.5*np.linalg.norm(points - start, axis=-1)
+    d = np.where(d < TOLERANCE, 0.5*np.linalg.norm(end - points, axis=-1), d)
+    apex = equilateral_triangles(np.stack([points - d[:, None]*direction, points + d[:, None]*direction], axis=1))[:, 0, 0]
+    return np.stack([points, apex], axis=1)
+
+def squares_on_lines(lines) -> np.ndarray:
+    """The geometry of Prop I.46 on many lines at once
+
+    Parameters
+    ----------
+    lines :
+        An array of shape (N, 2, 3) of the first side of each square
+
+    Returns
+    -------
+    An array of shape (N, 3, 2, 3) of the other three sides of each square, like square_on_line
+    """
+    lines = as_segments(lines)
+    point_A, point_B = lines[:, 0], lines[:, 1]
+    side = rotate(point_B - point_A, np.pi/2)
+    point_D, point_E = point_A + side, point_B + side
+    return np.stack([
+        np.stack([point_B, point_E], axis=1),
+        np.stack([point_E, point_D], axis=1),
+        np.stack([point_D, point_A], axis=1)
+    ], axis=1)
@@ -0,0 +1,293 @@
+import contextlib
+from manim import *
+from ManimHelpers import geometry
+from ManimHelpers.registry import listen
+from ManimHelpers.timeline import Recorder, Step, Timeline
+
+class Call:
+    """One call of a construction in a ConstructionGraph
+
+    Parameters
+    ----------
+    name :
+        the name of the construction
+    arguments :
+        what it was called with, without the Scene
+    parent :
+        the Call it was made from, None for the outermost one
+    first :
+        the index of its first step in the recorded timeline
+    """
+
+    def __init__(self, name: str, arguments: dict, parent=None, first: int = 0):
+        self.name = name
+        self.arguments = arguments
+        self.key = (name, geometry.geometry_key(tuple(value for argument, value in arguments.items() if argument != 'time')))
+        self.parent = parent
+        self.children = []
+        self.first = first
+        self.last = first
+        self.depth = parent.depth + 1 if parent is not None else 0
+        self.result = None
+
+    def __repr__(self):
+        return f"Call({self.name}, steps {self.first}-{self.last}, {len(self.children)} calls)"
+
+def point_keys(value) -> set:
+    """The keys of every point in some geometry, the ends of lines and the centers of dots included"""
+    if isinstance(value, (tuple, list)):
+        return set().union(*[point_keys(item) for item in value])
+    if isinstance(value, geometry.Segment) or hasattr(value, 'get_start') and hasattr(value, 'get_end'):
+        return point_keys(tuple(geometry.as_segment(value)))
+    if hasattr(value, 'get_center'):
+        value = value.get_center()
+    if isinstance(value, np.ndarray) and value.shape[-1:] == (3,):
+        return {geometry.geometry_key(point) for point in value.reshape(-1, 3)}
+    return set()
+
+def mobjects_in(value) -> list:
+    """Every mobject in some geometry, inside tuples and lists too"""
+    if isinstance(value, (tuple, list)):
+        return [mobject for item in value for mobject in mobjects_in(item)]
+    return [value] if isinstance(value, Mobject) else []
+
+def mobject_ids(value) -> set:
+    """The ids of every mobject in some geometry, inside tuples and lists too"""
+    return {id(mobject) for mobject in mobjects_in(value)}
+
+def made_in(call: Call, other: Call) -> bool:
+    """Whether a call is another one or was made from inside it"""
+    while call is not None and call is not other:
+        call = call.parent
+    return call is other
+
+class Builder:
+    """Listens to a construction while it is recorded and builds the tree of its calls, see registry.listen"""
+
+    def __init__(self, recorder: Recorder):
+        self.recorder = recorder
+        self.calls = []
+        # the calls open in each lane, see registry.report
+        self._open = {}
+
+    @contextlib.contextmanager
+    def span(self, name: str, category: str, arguments: dict = None, lane: tuple = (), **args):
+        arguments = {argument: value for argument, value in (arguments or {}).items() if argument != 's'}
+        chain = [call for length in range(len(lane) + 1) for call in self._open.get(lane[:length], ())]
+        parent = chain[-1] if chain else None
+        call = Call(name, arguments, parent, len(self.recorder.timeline))
+        if parent is not None:
+            parent.children.append(call)
+        self.calls.append(call)
+        opened = self._open.setdefault(lane, [])
+        opened.append(call)
+        try:
+            yield args
+        finally:
+            opened.pop()
+            call.last = len(self.recorder.timeline)
+            call.result = args.get('result')
+
+class ConstructionGraph:
+    """A construction recorded as the graph of the constructions it calls and the steps each of them makes,
+        before anything is played. Calls with the same construction and the same inputs share a key, and
+        playing the graph draws each of them once. The scaffolding can be pruned to play only what the
+        result needs.
+
+    Parameters
+    ----------
+    construction :
+        the construction
+    *args :
+        what to pass to it after the Scene
+    **kwargs :
+        what else to pass to it
+    """
+
+    def __init__(self, construction, *args, **kwargs):
+        self.recorder = Recorder()
+        builder = Builder(self.recorder)
+        with listen(builder):
+            self.result = construction(self.recorder, *args, **kwargs)
+        self.timeline = self.recorder.timeline
+        self.calls = builder.calls
+        self.root = self.calls[0]
+
+        # the ids of the mobjects in the scene before each step, and at the end
+        self.scenes = [set()]
+        for step in self.timeline:
+            self.scenes.append(self.scenes[-1] - {id(mobject) for mobject in step.removed} | {id(mobject) for mobject in step.added})
+
+        self.by_key = {}
+        for call in self.calls:
+            self.by_key.setdefault(call.key, []).append(call)
+
+        # the deepest calls each step was made in, more than one where constructions were played side by side
+        self.owners = [[self.root] for step in self.timeline]
+        for call in self.calls[1:]:
+            for index in range(call.first, call.last):
+                self.owners[index] = [owner for owner in self.owners[index] if owner is not call.parent] + [call]
+        # the call each mobject was brought in by, the one that returned it when several were being played
+        returned = {call: mobject_ids(call.result) for call in self.calls}
+        self.creators = {}
+        for step, candidates in zip(self.timeline, self.owners):
+            for mobject in step.added:
+                if id(mobject) not in self.creators:
+                    self.creators[id(mobject)] = next((call for call in candidates if id(mobject) in returned[call]), candidates[0])
+
+    def get_duplicates(self) -> dict:
+        """The calls that repeat an earlier call with the same inputs, by key. See get_repeats for the ones play leaves out"""
+        return {key: calls for key, calls in self.by_key.items() if len(calls) > 1}
+
+    def get_repeats(self) -> dict:
+        """The later calls of get_duplicates that play leaves out, with the first call each one repeats.
+            A call can be left out when its steps are its own, it takes nothing away that was there before it
+            and all it leaves behind is its result
+
+        Returns
+        -------
+        a dict of each Call left out to the first Call with its key
+        """
+        repeats = {}
+        for calls in self.get_duplicates().values():
+            for call in calls[1:]:
+                if any(made_in(other, call) for other in repeats):
+                    continue
+                if not all(made_in(owner, call) for owners in self.owners[call.first:call.last] for owner in owners):
+                    continue
+                there, left = self.scenes[call.first], self.scenes[call.last]
+                if there - left or left - there - mobject_ids(call.result):
+                    continue
+                repeats = {other: first for other, first in repeats.items() if not made_in(other, call)}
+                repeats[call] = calls[0]
+        return repeats
+
+    def merged(self) -> Timeline:
+        """The recorded timeline with each call of get_repeats drawn only once. The steps of a repeat are
+            replaced by one that draws its result, since the first call already showed how it is made
+
+        Returns
+        -------
+        the Timeline
+        """
+        repeats = {call.first: call for call in self.get_repeats() if call.last > call.first}
+        steps = []
+        index = 0
+        while index < len(self.timeline):
+            if index not in repeats:
+                steps.append(self.timeline[index])
+                index += 1
+                continue
+            call = repeats[index]
+            new = [mobject for mobject in mobjects_in(call.result) if id(mobject) not in self.scenes[index]]
+            if new:
+                steps.append(Step('play', [Create(mobject) for mobject in new], 1, new))
+            index = call.last
+        return Timeline(steps)
+
+    def get_dependencies(self, call: Call) -> list:
+        """The calls a call needs to come after: the ones that brought in the mobjects it was given
+            and the earlier calls from the same parent whose results it was given points of
+
+        Parameters
+        ----------
+        call :
+            the Call
+
+        Returns
+        -------
+        a list of the Calls
+        """
+        found = []
+
+        def visit(value):
+            if isinstance(value, (tuple, list)):
+                for item in value:
+                    visit(item)
+            elif id(value) in self.creators and self.creators[id(value)] not in found:
+                found.append(self.creators[id(value)])
+
+        visit(list(call.arguments.values()))
+        if call.parent is not None:
+            given = point_keys(list(call.arguments.values()))
+            for sibling in call.parent.children[:call.parent.children.index(call)]:
+                if sibling not in found and given & point_keys(sibling.result):
+                    found.append(sibling)
+        return found
+
+    def get_schedule(self, call: Call = None) -> list:
+        """Groups the calls a call makes so that none depends on another in the same group or a later one,
+            so each group could be played together
+
+        Parameters
+        ----------
+        call :
+            the Call, the outermost one when None
+
+        Returns
+        -------
+        a list of lists of Calls in the order they can be played
+        """
+        call = call or self.root
+        levels = {}
+        for child in call.children:
+            inside = [dependency for dependency in self.get_dependencies(child) if dependency in levels]
+            levels[child] = max((levels[dependency] + 1 for dependency in inside), default=0)
+        schedule = [[] for _ in range(max(levels.values(), default=-1) + 1)]
+        for child, level in levels.items():
+            schedule[level].append(child)
+        return schedule
+
+    def get_survivors(self) -> list:
+        """The mobjects still in the scene at the end, with repeats of the same line drawn twice left out"""
+        survivors = []
+        drawn = set()
+        for mobject in self.recorder.mobjects:
+            key = geometry.geometry_key(mobject) if hasattr(mobject, 'get_start') else id(mobject)
+            if key not in drawn:
+                drawn.add(key)
+                survivors.append(mobject)
+        return survivors
+
+    def result_only(self, total_time: float = None) -> Timeline:
+        """A timeline that only draws what is left at the end, each piece at the point it was first drawn.
+            Scaffolding that is made and faded away is pruned, and a line drawn twice is only drawn once
+
+        Parameters
+        ----------
+        total_time :
+            how long the new timeline should take, as long as the pieces took to draw in the full one when None
+
+        Returns
+        -------
+        the Timeline
+        """
+        survivors = {id(mobject) for mobject in self.get_survivors()}
+        steps = []
+        for step in self.timeline:
+            kept = [mobject for mobject in step.added if id(mobject) in survivors]
+            if kept:
+                survivors -= {id(mobject) for mobject in kept}
+                steps.append(Step('play', [Create(mobject) for mobject in kept], step.run_time or 1, kept))
+        timeline = Timeline(steps)
+        return timeline.compressed(total_time) if total_time is not None and steps else timeline
+
+    def play(self, s: Scene, result_only: bool = False, total_time: float = None):
+        """Plays the recorded construction, the whole of it with each repeated call drawn once, see merged,
+            or only what its result needs
+
+        Parameters
+        ----------
+        s :
+            The Scene
+        result_only :
+            whether to prune the scaffolding, see result_only
+        total_time :
+            how long to take when result_only
+
+        Returns
+        -------
+        what the construction returned
+        """
+        (self.result_only(total_time) if result_only else self.merged()).replay(s)
+        return self.result
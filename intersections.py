@@ -0,0 +1,130 @@
+import numpy as np
+
+TOLERANCE = 1e-9
+
+def _cross(u: np.ndarray, v: np.ndarray) -> np.ndarray:
+    return u[..., 0]*v[..., 1] - u[..., 1]*v[..., 0]
+
+def _normal(u: np.ndarray) -> np.ndarray:
+    return np.stack([-u[..., 1], u[..., 0], np.zeros(u.shape[:-1])], axis=-1)
+
+def line_line(lines_1: np.ndarray, lines_2: np.ndarray) -> np.ndarray:
+    """Intersects lines with lines as if they were extended forever. Broadcasts like any NumPy operation,
+        so lines_1[:, None] and lines_2[None, :] intersects every pair.
+
+    Parameters
+    ----------
+    lines_1 :
+        An array of shape (..., 2, 3) of start and end points
+    lines_2 :
+        An array of shape (..., 2, 3) of start and end points
+
+    Returns
+    -------
+    An array of shape (..., 3) of the points. Parallel lines give NaN
+    """
+    lines_1 = np.asarray(lines_1, dtype=float)
+    lines_2 = np.asarray(lines_2, dtype=float)
+    p = lines_1[..., 0, :]
+    d_1 = lines_1[..., 1, :] - p
+    r = lines_2[..., 0, :]
+    d_2 = lines_2[..., 1, :] - r
+
+    denominator = _cross(d_1, d_2)
+    parallel = np.abs(denominator) <= TOLERANCE*np.linalg.norm(d_1, axis=-1)*np.linalg.norm(d_2, axis=-1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t = np.where(parallel, np.nan, _cross(r - p, d_2)/np.where(parallel, 1, denominator))
+    return p + t[..., None]*d_1
+
+def circle_line(centers: np.ndarray, radii: np.ndarray, lines: np.ndarray) -> np.ndarray:
+    """Intersects circles with lines extended forever. Vertical lines need no special case and a tangent line
+        gives the same point twice.
+
+    Parameters
+    ----------
+    centers :
+        An array of shape (..., 3)
+    radii :
+        An array of shape (...)
+    lines :
+        An array of shape (..., 2, 3)
+
+    Returns
+    -------
+    An array of shape (..., 2, 3) holding both points in the order they are met going along each line.
+        Circles that miss their line give NaN
+    """
+    centers = np.asarray(centers, dtype=float)
+    radii = np.asarray(radii, dtype=float)
+    lines = np.asarray(lines, dtype=float)
+    start = lines[..., 0, :]
+    direction = lines[..., 1, :] - start
+    direction = direction/np.linalg.norm(direction, axis=-1, keepdims=True)
+
+    foot = start + np.sum((centers - start)*direction, axis=-1, keepdims=True)*direction
+    h_squared = radii**2 - np.sum((centers - foot)**2, axis=-1)
+    h_squared = np.where(h_squared < -TOLERANCE*np.maximum(radii**2, 1), np.nan, np.maximum(h_squared, 0))
+    offset = np.sqrt(h_squared)[..., None]*direction
+    return np.stack([foot - offset, foot + offset], axis=-2)
+
+def circle_circle(centers_1: np.ndarray, radii_1: np.ndarray, centers_2: np.ndarray, radii_2: np.ndarray) -> np.ndarray:
+    """Intersects circles with circles
+
+    Parameters
+    ----------
+    centers_1 :
+        An array of shape (..., 3)
+    radii_1 :
+        An array of shape (...)
+    centers_2 :
+        An array of shape (..., 3)
+    radii_2 :
+        An array of shape (...)
+
+    Returns
+    -------
+    An array of shape (..., 2, 3) holding the point to the left of the line from the first center to the second,
+        then the one to the right. Tangent circles give the same point twice and circles that miss give NaN
+    """
+    centers_1 = np.asarray(centers_1, dtype=float)
+    centers_2 = np.asarray(centers_2, dtype=float)
+    radii_1 = np.asarray(radii_1, dtype=float)
+    radii_2 = np.asarray(radii_2, dtype=float)
+
+    d = np.linalg.norm(centers_2 - centers_1, axis=-1)
+    concentric = d < TOLERANCE
+    d = np.where(concentric, np.nan, d)
+    e = (centers_2 - centers_1)/d[..., None]
+    a = (radii_1**2 - radii_2**2 + d**2)/(2*d)
+    h_squared = radii_1**2 - a**2
+    h_squared = np.where(h_squared < -TOLERANCE*np.maximum(radii_1**2, 1), np.nan, np.maximum(h_squared, 0))
+
+    middle = centers_1 + a[..., None]*e
+    offset = np.sqrt(h_squared)[..., None]*_normal(e)
+    return np.stack([middle + offset, middle - offset], axis=-2)
+
+def intersect_all(lines: np.ndarray = None, circles: tuple = None) -> dict:
+    """Every intersection between a set of lines and circles, found in one batched call per kind of pair
+
+    Parameters
+    ----------
+    lines :
+        An array of shape (N, 2, 3)
+    circles :
+        A tuple of an array of centers of shape (M, 3) and an array of radii of shape (M,)
+
+    Returns
+    -------
+    A dictionary with 'line_line' of shape (N, N, 3), 'circle_line' of shape (M, N, 2, 3) and
+        'circle_circle' of shape (M, M, 2, 3). Pairs that don't meet, including a shape with itself, are NaN
+    """
+    found = {}
+    if lines is not None:
+        lines = np.asarray(lines, dtype=float)
+        found['line_line'] = line_line(lines[:, None], lines[None, :])
+    if circles is not None:
+        centers, radii = (np.asarray(part, dtype=float) for part in circles)
+        found['circle_circle'] = circle_circle(centers[:, None], radii[:, None], centers[None, :], radii[None, :])
+        if lines is not None:
+            found['circle_line'] = circle_line(centers[:, None], radii[:, None], lines[None, :])
+    return found
@@ -0,0 +1,239 @@
+import inspect
+from manim import *
+from ManimHelpers import geometry
+from ManimHelpers.constant_suppliments import LETTER_FONT_SIZE, label
+
+# the places a label can go around its point, tried the furthest out from the figure first
+DIRECTIONS = (UR, UL, DR, DL, UP, DOWN, RIGHT, LEFT)
+
+class SpatialGrid:
+    """Buckets boxes and segments into square cells so only the things near a box are checked against it
+
+    Parameters
+    ----------
+    cell_size :
+        the width of a cell
+    """
+
+    def __init__(self, cell_size: float):
+        self.cell_size = cell_size
+        self.cells = {}
+        self.items = []
+
+    def _cells(self, low: np.ndarray, high: np.ndarray):
+        (i_0, j_0), (i_1, j_1) = np.floor(low[:2]/self.cell_size).astype(int), np.floor(high[:2]/self.cell_size).astype(int)
+        return ((i, j) for i in range(i_0, i_1 + 1) for j in range(j_0, j_1 + 1))
+
+    def _put(self, item: tuple, cells):
+        self.items.append(item)
+        for cell in cells:
+            self.cells.setdefault(cell, []).append(len(self.items) - 1)
+
+    def add_box(self, low: np.ndarray, high: np.ndarray):
+        """Adds the box between corners low and high"""
+        self._put(('box', low, high), self._cells(low, high))
+
+    def add_segment(self, start: np.ndarray, end: np.ndarray):
+        """Adds the segment from start to end to every cell it passes through"""
+        steps = int(np.ceil(2*np.linalg.norm(end - start)/self.cell_size)) + 1
+        points = np.linspace(start, end, steps + 1)
+        cells = {tuple(cell) for cell in np.floor(points[:, :2]/self.cell_size).astype(int)}
+        self._put(('segment', start, end), cells)
+
+    def count_hits(self, low: np.ndarray, high: np.ndarray) -> int:
+        """How many of the boxes and segments overlap the box between low and high
+
+        Parameters
+        ----------
+        low :
+            the bottom left corner
+        high :
+            the top right corner
+
+        Returns
+        -------
+        the number of overlaps
+        """
+        nearby = {index for cell in self._cells(low, high) for index in self.cells.get(cell, ())}
+        return sum(1 for index in nearby if overlaps(self.items[index], low, high))
+
+def overlaps(item: tuple, low: np.ndarray, high: np.ndarray) -> bool:
+    """Whether a box or segment from a SpatialGrid overlaps the box between low and high"""
+    kind, a, b = item
+    if kind == 'box':
+        return bool(np.all(a[:2] <= high[:2]) and np.all(low[:2] <= b[:2]))
+    # clips the segment to the box one axis at a time
+    t_0, t_1 = 0, 1
+    direction = b - a
+    for axis in (0, 1):
+        if abs(direction[axis]) < geometry.TOLERANCE:
+            if not low[axis] <= a[axis] <= high[axis]:
+                return False
+            continue
+        near, far = sorted(((low[axis] - a[axis])/direction[axis], (high[axis] - a[axis])/direction[axis]))
+        t_0, t_1 = max(t_0, near), min(t_1, far)
+        if t_0 > t_1:
+            return False
+    return True
+
+def name_points(lines, names=None, tolerance: float = 1e-6) -> dict:
+    """Names the corners of a figure, like the tuples of lines the constructions return.
+        See construction_points for the names a proposition gives them
+
+    Parameters
+    ----------
+    lines :
+        the Lines, MarkedLines, Segments or (2, 3) arrays of the figure
+    names :
+        the names in the order the corners are first met, A, B, C... when None
+    tolerance :
+        how close two ends have to be to be the same corner
+
+    Returns
+    -------
+    a dictionary of each name to its point
+    """
+    corners = {}
+    for segment in (geometry.as_segment(line) for line in lines):
+        for point in segment:
+            corners.setdefault(tuple(np.round(point/tolerance).astype(int)), point)
+    if names is None:
+        names = [chr(ord('A') + i%26) + (f"_{i//26}" if i >= 26 else '') for i in range(len(corners))]
+    return dict(zip(names, corners.values()))
+
+def place_labels(points: dict, lines=(), font_size: float = LETTER_FONT_SIZE, buff: float = 0.1, **kwargs) -> VGroup:
+    """Puts a label next to each point where it doesn't cover the lines, the points or the other labels
+
+    Parameters
+    ----------
+    points :
+        a dictionary of each name to its point, see name_points
+    lines :
+        the Lines, MarkedLines, Segments or (2, 3) arrays to keep clear of
+    font_size :
+        how big the labels are
+    buff :
+        how far a label is from its point
+    **kwargs :
+        what else to pass on to label
+
+    Returns
+    -------
+    a VGroup of the labels in the same order as points
+    """
+    labels = [label(name, font_size, **kwargs) for name in points]
+    if not labels:
+        return VGroup()
+    points = [geometry.as_point(point) for point in points.values()]
+    sizes = [np.array([text.width, text.height, 0])/2 for text in labels]
+    middle = np.mean(points, axis=0)
+
+    grid = SpatialGrid(2*max(size[1] for size in sizes) + buff)
+    for start, end in (geometry.as_segment(line) for line in lines):
+        grid.add_segment(start, end)
+    dot = np.array([buff, buff, 0])/2
+    for point in points:
+        grid.add_box(point - dot, point + dot)
+
+    for text, point, size in zip(labels, points, sizes):
+        outward = point - middle
+        best = None
+        for direction in sorted(DIRECTIONS, key=lambda direction: -np.dot(direction, outward)):
+            center = point + direction*(size + buff)
+            hits = grid.count_hits(center - size, center + size)
+            if best is None or hits < best[0]:
+                best = (hits, center)
+            if hits == 0:
+                break
+        grid.add_box(best[1] - size, best[1] + size)
+        text.move_to(best[1])
+    return VGroup(*labels)
+
+def label_figure(lines, names=None, **kwargs) -> VGroup:
+    """Names the corners of a figure and labels them, see name_points and place_labels
+
+    Parameters
+    ----------
+    lines :
+        the lines of the figure
+    names :
+        the names of the corners in the order they are first met
+    **kwargs :
+        what to pass on to place_labels
+
+    Returns
+    -------
+    a VGroup of the labels
+    """
+    return place_labels(name_points(lines, names), lines, **kwargs)
+
+def construction_points(function, args: tuple, result, tolerance: float = 1e-6) -> dict:
+    """Names the points of a construction's figure the way its proposition does, from the names it was registered with
+
+    Parameters
+    ----------
+    function :
+        the construction
+    args :
+        what it was given after the Scene
+    result :
+        what it returned
+    tolerance :
+        how close two points have to be to be the same point
+
+    Returns
+    -------
+    a dictionary of each name to its point, in the order the names are given
+    """
+    arguments = inspect.signature(function).bind_partial(None, *args).arguments
+    points = {}
+    seen = set()
+
+    def visit(value, names):
+        if names is None:
+            return
+        if isinstance(value, (tuple, list)):
+            for item, item_names in zip(value, names):
+                visit(item, item_names)
+            return
+        found = geometry.as_segment(value) if len(names) == 2 else [geometry.as_point(value)]
+        for name, point in zip(names, found):
+            key = tuple(np.round(point/tolerance).astype(int))
+            if name is None or key in seen:
+                continue
+            if name in points and not np.allclose(points[name], point, atol=tolerance):
+                raise ValueError(f"{function.__name__} names two different points {name}")
+            seen.add(key)
+            points.setdefault(name, point)
+
+    for argument, names in function.names.items():
+        visit(result if argument == 'return' else arguments.get(argument), names)
+    return points
+
+def figure_lines(value) -> list:
+    """Every Line, MarkedLine or Segment in the arguments or result of a construction, as segments"""
+    if isinstance(value, (tuple, list)):
+        return [line for item in value for line in figure_lines(item)]
+    if isinstance(value, geometry.Segment) or hasattr(value, 'get_start') and hasattr(value, 'get_end'):
+        return [geometry.as_segment(value)]
+    return []
+
+def label_construction(function, args: tuple, result, **kwargs) -> VGroup:
+    """Labels the points of a construction's figure with the names from its proposition, see construction_points
+
+    Parameters
+    ----------
+    function :
+        the construction
+    args :
+        what it was given after the Scene
+    result :
+        what it returned
+    **kwargs :
+        what to pass on to place_labels
+
+    Returns
+    -------
+    a VGroup of the labels
+    """
+    return place_labels(construction_points(function, args, result), figure_lines((args, result)), **kwargs)
@@ -0,0 +1,192 @@
+import contextlib
+from PIL import Image
+from manim import *
+from ManimHelpers.registry import listen
+from ManimHelpers.rendering import lines
+from ManimHelpers.timeline import Recorder
+
+SCAFFOLD_OPACITY = 0.3
+
+class Keyframes(Recorder):
+    """Records a construction like a Recorder and keeps a copy of what is in the scene each time
+        a construction it is told about starts or ends, and of everything taken out of the scene,
+        so they can be drawn as they were even if they are moved afterwards. See registry.listen
+
+    Parameters
+    ----------
+    inputs :
+        the mobjects given to the construction, which are in every keyframe
+    """
+
+    def __init__(self, inputs: list = ()):
+        super().__init__()
+        self.inputs = list(inputs)
+        self.frames = []
+        self.scaffolding = []
+        self._plays = 0
+
+    def _keep_removed(self, steps: int):
+        for step in self.timeline[steps:]:
+            self.scaffolding += [mobject.copy() for mobject in step.removed]
+
+    def remove(self, *mobjects):
+        steps = len(self.timeline)
+        super().remove(*mobjects)
+        self._keep_removed(steps)
+        return self
+
+    def play(self, *animations, **kwargs):
+        steps = len(self.timeline)
+        super().play(*animations, **kwargs)
+        self._keep_removed(steps)
+
+    def snapshot(self):
+        """Keeps a copy of what is in the scene now, if anything was played since the last one"""
+        plays = sum(1 for step in self.timeline if step.kind in ('play', 'wait'))
+        if plays > self._plays:
+            self._plays = plays
+            self.frames.append(self.inputs + [mobject.copy() for mobject in self.mobjects])
+
+    @contextlib.contextmanager
+    def span(self, name: str, category: str, **args):
+        self.snapshot()
+        try:
+            yield args
+        finally:
+            self.snapshot()
+
+def keyframes(construction, *args, depth: int = 2, **kwargs) -> tuple:
+    """Records a construction and gives what is in the scene at the end of each of its pieces, without animating
+
+    Parameters
+    ----------
+    construction :
+        the construction
+    *args :
+        what to pass to it after the Scene
+    depth :
+        the deepest constructions to split at, 2 splits between the ones the construction calls itself
+    **kwargs :
+        what else to pass to it
+
+    Returns
+    -------
+    a list of lists of the mobjects in each keyframe, input lines included, and a list of
+        the scaffolding that was taken out of the scene along the way
+    """
+    recorder = Keyframes(lines((args, kwargs)))
+    with listen(recorder, depth):
+        construction(recorder, *args, **kwargs)
+    recorder.snapshot()
+    return recorder.frames, recorder.scaffolding
+
+def fit_frame(mobjects: list, aspect_ratio: float = 16/9, margin: float = 0.1) -> dict:
+    """The camera frame that fits every mobject
+
+    Parameters
+    ----------
+    mobjects :
+        the mobjects
+    aspect_ratio :
+        the width of the frame over its height
+    margin :
+        how much room to leave around them, as a fraction of their size
+
+    Returns
+    -------
+    the frame_center, frame_width and frame_height to give a Camera
+    """
+    points = np.vstack([mobject.get_all_points() for mobject in mobjects if len(mobject.get_all_points())])
+    low, high = points.min(axis=0), points.max(axis=0)
+    width, height = (1 + 2*margin)*(high - low)[:2]
+    height = max(height, width/aspect_ratio, 1e-3)
+    return {'frame_center': (low + high)/2, 'frame_width': height*aspect_ratio, 'frame_height': height}
+
+def render_still(mobjects: list, pixel_width: int = 480, pixel_height: int = 270, frame: dict = None) -> Image.Image:
+    """Draws mobjects with a manim Camera straight to an image
+
+    Parameters
+    ----------
+    mobjects :
+        the mobjects
+    pixel_width :
+        how wide the image is
+    pixel_height :
+        how tall the image is
+    frame :
+        the frame to draw, see fit_frame. Fits the mobjects when None
+
+    Returns
+    -------
+    the image
+    """
+    frame = frame or fit_frame(mobjects, pixel_width/pixel_height)
+    camera = Camera(pixel_width=pixel_width, pixel_height=pixel_height, **frame)
+    camera.capture_mobjects(mobjects)
+    return camera.get_image()
+
+def contact_sheet(images: list, columns: int = 4, gap: int = 4) -> Image.Image:
+    """Tiles images in rows, left to right
+
+    Parameters
+    ----------
+    images :
+        the images, all the same size
+    columns :
+        how many images in a row
+    gap :
+        the pixels between them
+
+    Returns
+    -------
+    the sheet
+    """
+    width, height = images[0].size
+    columns = min(columns, len(images))
+    rows = -(-len(images)//columns)
+    sheet = Image.new('RGBA', (columns*width + (columns - 1)*gap, rows*height + (rows - 1)*gap), 'black')
+    for index, image in enumerate(images):
+        sheet.paste(image, ((index%columns)*(width + gap), (index//columns)*(height + gap)))
+    return sheet
+
+def preview(construction, *args, path: str = None, figure: bool = False, depth: int = 2, columns: int = 4, pixel_width: int = 480, pixel_height: int = 270, **kwargs) -> Image.Image:
+    """A quick look at a construction drawn from its geometry instead of rendering a video.
+        Either a contact sheet of a still after each of its pieces, or one still of the final figure
+        with all the scaffolding that was drawn along the way shown faintly behind it
+
+    Parameters
+    ----------
+    construction :
+        the construction
+    *args :
+        what to pass to it after the Scene
+    path :
+        a file to save the image to
+    figure :
+        whether to draw the one still of the final figure instead of the contact sheet
+    depth :
+        the deepest constructions to split at, see rendering.split
+    columns :
+        how many stills in a row of the contact sheet
+    pixel_width :
+        how wide each still is
+    pixel_height :
+        how tall each still is
+    **kwargs :
+        what else to pass to the construction
+
+    Returns
+    -------
+    the image
+    """
+    frames, scaffolding = keyframes(construction, *args, depth=depth, **kwargs)
+    frame = fit_frame(scaffolding + [mobject for mobjects in frames for mobject in mobjects], pixel_width/pixel_height)
+    if figure:
+        for mobject in scaffolding:
+            mobject.set_opacity(SCAFFOLD_OPACITY)
+        image = render_still(scaffolding + frames[-1], pixel_width, pixel_height, frame)
+    else:
+        image = contact_sheet([render_still(mobjects, pixel_width, pixel_height, frame) for mobjects in frames], columns)
+    if path is not None:
+        image.save(path)
+    return image
@@ -0,0 +1,139 @@
+import contextlib
+import json
+import os
+import time
+from ManimHelpers import registry
+
+class Profiler:
+    """Stands in for a Scene and passes the calls on to it, timing every construction and every play
+        so they can be opened in a trace viewer like chrome://tracing, Perfetto or speedscope
+
+    Parameters
+    ----------
+    s :
+        The Scene to play in
+    """
+
+    def __init__(self, s):
+        self.scene = s
+        self.events = []
+        self._start = time.perf_counter()
+        # the names of the spans open in each lane, see registry.report
+        self._stacks = {(): []}
+        self._tids = {(): 0}
+
+    def __getattr__(self, name):
+        if name == 'scene':
+            raise AttributeError(name)
+        return getattr(self.scene, name)
+
+    def _now(self) -> float:
+        return (time.perf_counter() - self._start)*1e6
+
+    def _ids(self) -> set:
+        return {id(mobject) for mobject in getattr(self.scene, 'mobjects', ())}
+
+    def _tid(self, lane: tuple):
+        # each lane of constructions played side by side gets a row of its own in the viewer, numbered in the order they start
+        if lane not in self._tids:
+            self._tids[lane] = len(self._tids)
+        return self._tids[lane]
+
+    def _chain(self, lane: tuple) -> list:
+        # the spans open around one in lane, outermost first
+        return [name for length in range(len(lane) + 1) for name in self._stacks.get(lane[:length], ())]
+
+    def _rows(self, lane: tuple) -> list:
+        # the innermost lanes under lane with spans open, as a play made now animates each of them
+        below = [other for other, names in self._stacks.items() if names and len(other) > len(lane) and other[:len(lane)] == lane]
+        return [other for other in below if not any(len(deeper) > len(other) and deeper[:len(other)] == other for deeper in below)] or [lane]
+
+    @contextlib.contextmanager
+    def span(self, name: str, category: str, **args):
+        """Times whatever runs inside it as one event
+
+        Parameters
+        ----------
+        name :
+            what to call the event
+        category :
+            'construction', 'play' or 'wait'
+        **args :
+            anything else to show with the event. The arguments and result of a construction are left out,
+            and a lane puts it on a row of its own, see registry.report. A play made while constructions
+            are played side by side is shown in the row of each of them, with how many in shared
+        """
+        args.pop('arguments', None)
+        lane = tuple(args.pop('lane', ()))
+        rows = [lane] if category == 'construction' else self._rows(lane)
+        if len(rows) > 1:
+            args['shared'] = len(rows)
+        before = self._ids()
+        start = self._now()
+        stack = self._stacks.setdefault(lane, [])
+        stack.append(name)
+        try:
+            yield args
+        finally:
+            args.pop('result', None)
+            stack.pop()
+            after = self._ids()
+            args.update(created=len(after - before), destroyed=len(before - after))
+            end = self._now()
+            for row in rows:
+                chain = self._chain(row)
+                self.events.append({
+                    'name': name, 'cat': category, 'ph': 'X', 'ts': start, 'dur': end - start,
+                    'pid': os.getpid(), 'tid': self._tid(row),
+                    'args': dict(args, depth=len(chain), construction=chain[-1] if chain else None)
+                })
+
+    def play(self, *animations, run_time: float = None, **kwargs):
+        from manim import config
+        if run_time is None:
+            run_time = max((getattr(animation, 'run_time', 1) for animation in animations), default=0)
+        names = ', '.join(type(animation).__name__ for animation in animations)
+        with self.span(f"play({names})", 'play', run_time=run_time, frames=int(round(run_time*config.frame_rate))):
+            self.scene.play(*animations, run_time=run_time, **kwargs)
+
+    def wait(self, duration: float = 1, **kwargs):
+        from manim import config
+        with self.span('wait', 'wait', run_time=duration, frames=int(round(duration*config.frame_rate))):
+            self.scene.wait(duration, **kwargs)
+
+    def get_trace(self) -> dict:
+        """The events in the Chrome trace format, which speedscope and Perfetto open too"""
+        names = [
+            {'name': 'thread_name', 'ph': 'M', 'pid': os.getpid(), 'tid': tid, 'args': {'name': 'lane ' + '.'.join(str(index) for index in lane) if lane else 'main'}}
+            for lane, tid in self._tids.items()
+        ]
+        return {'traceEvents': names + sorted(self.events, key=lambda event: event['ts']), 'displayTimeUnit': 'ms'}
+
+    def save(self, path: str):
+        """Writes the trace to a JSON file"""
+        with open(path, 'w') as file:
+            json.dump(self.get_trace(), file)
+
+@contextlib.contextmanager
+def profile(s, path: str = None):
+    """Profiles the constructions run inside it. Pass the Profiler it gives to the constructions
+        in place of the Scene so their plays are timed too.
+
+    Parameters
+    ----------
+    s :
+        The Scene
+    path :
+        a file to save the trace to at the end
+
+    Returns
+    -------
+    the Profiler
+    """
+    profiler = Profiler(s)
+    try:
+        with registry.listen(profiler):
+            yield profiler
+    finally:
+        if path is not None:
+            profiler.save(path)
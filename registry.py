@@ -0,0 +1,280 @@
+import contextlib
+import functools
+import inspect
+from ManimHelpers import geometry
+
+CONSTRUCTIONS = {}
+SUMMARIES = ('appear', 'skip')
+
+_stack = []
+_detail = {'max_depth': None, 'summary': 'appear'}
+# what is told about every construction as it runs, see listen
+_listeners = []
+
+def construction(plays: int, calls: tuple = (), names: dict = None):
+    """Registers a construction with the number of plays it makes itself and the constructions it calls,
+        so its number of operations can be worked out instead of written down.
+        The construction also takes max_depth and summary keywords, see level_of_detail,
+        and is reported to whatever is listening, see listen.
+
+    Parameters
+    ----------
+    plays :
+        how many times the construction calls play itself
+    calls :
+        the constructions it calls, once for each time it calls them.
+        A tuple of constructions that are played together counts as the longest of them
+    names :
+        what the proposition calls the points of the figure, by argument and 'return' for what it returns.
+        A line is named by its start and end, like 'AB', a point by one name and a tuple by a tuple of names.
+        None leaves a point unnamed. See labels.construction_points
+
+    Returns
+    -------
+    the decorator
+    """
+    def register(function):
+        signature = inspect.signature(function)
+
+        @functools.wraps(function)
+        def run(s, *args, max_depth: int = None, summary: str = None, **kwargs):
+            if max_depth is not None or summary is not None:
+                with level_of_detail(
+                    max_depth if max_depth is not None else _detail['max_depth'],
+                    summary or _detail['summary']
+                ):
+                    return run(s, *args, **kwargs)
+            if _detail['max_depth'] is not None and len(_stack) > _detail['max_depth']:
+                return summarize(run, signature, s, args, kwargs)
+            _stack.append(function.__name__)
+            try:
+                if not _listening(len(_stack)):
+                    return function(s, *args, **kwargs)
+                arguments = signature.bind(s, *args, **kwargs)
+                arguments.apply_defaults()
+                with report(function.__name__, len(_stack), arguments.arguments, op_count(run)) as event:
+                    event['result'] = function(s, *args, **kwargs)
+                    return event['result']
+            finally:
+                _stack.pop()
+
+        run.plays = plays
+        run.calls = tuple(calls)
+        run.names = names or {}
+        CONSTRUCTIONS[function.__name__] = run
+        return run
+    return register
+
+@contextlib.contextmanager
+def level_of_detail(max_depth: int = None, summary: str = 'appear'):
+    """Collapses every construction nested deeper than max_depth. A collapsed construction is worked out
+        with the solver in geometry and none of its own mobjects or animations are made.
+
+    Parameters
+    ----------
+    max_depth :
+        how many levels of nested constructions to draw in full. 0 only draws the outermost one and None draws all
+    summary :
+        'appear' to draw the result of a collapsed construction in one operation, 'skip' to add it without animating
+    """
+    if summary not in SUMMARIES:
+        raise ValueError(f"summary must be one of {SUMMARIES}")
+    previous = dict(_detail)
+    _detail['max_depth'] = max_depth
+    _detail['summary'] = summary
+    try:
+        yield
+    finally:
+        _detail.update(previous)
+
+@contextlib.contextmanager
+def listen(listener, max_depth: int = None, alone: bool = False):
+    """Tells listener about every construction that runs inside it. Each one enters listener.span(name, 'construction', **args)
+        for as long as it runs, with its arguments, time, operations, depth and lane in args, and puts what it returns
+        in the dictionary the span gives back under 'result'. Profiler is one
+
+    Parameters
+    ----------
+    listener :
+        anything with a span like Profiler's
+    max_depth :
+        the deepest constructions to tell it about, 1 being the outermost. All of them when None
+    alone :
+        whether to tell only this listener until it stops, and none of the ones listening already
+
+    Returns
+    -------
+    the listener
+    """
+    previous = list(_listeners)
+    if alone:
+        _listeners.clear()
+    _listeners.append((listener, max_depth))
+    try:
+        yield listener
+    finally:
+        _listeners[:] = previous
+
+def _listening(depth: int) -> list:
+    return [listener for listener, max_depth in _listeners if max_depth is None or depth <= max_depth]
+
+@contextlib.contextmanager
+def report(name: str, depth: int, arguments: dict, operations: int, lane: tuple = ()):
+    """Tells whatever is listening that a construction is running for as long as it is in, see listen.
+        Constructions report themselves, and timeline.play_together reports the ones it plays back
+
+    Parameters
+    ----------
+    name :
+        the name of the construction
+    depth :
+        how many constructions it is nested in, itself included
+    arguments :
+        what it was called with by name, time included
+    operations :
+        its number of operations, see op_count
+    lane :
+        which of the constructions played side by side it belongs to, () when it isn't played beside others.
+        See timeline.play_together
+
+    Returns
+    -------
+    a dictionary to put what the construction returns in under 'result'
+    """
+    result = {}
+    with contextlib.ExitStack() as stack:
+        events = [
+            stack.enter_context(listener.span(
+                name, 'construction', arguments=arguments, time=arguments['time'],
+                operations=operations, depth=depth, lane=lane
+            ))
+            for listener in _listening(depth)
+        ]
+        yield result
+        for event in events:
+            event.update(result)
+
+def get_depth() -> int:
+    """How many constructions are running inside each other right now"""
+    return len(_stack)
+
+def summarize(function, signature: inspect.Signature, s, args: tuple, kwargs: dict):
+    """Stands in for a construction that is too deep to draw, using the solver of the same name in geometry
+
+    Parameters
+    ----------
+    function :
+        the construction
+    signature :
+        the signature of the construction
+    s :
+        The Scene
+    args :
+        the positional arguments after the Scene
+    kwargs :
+        the keyword arguments
+
+    Returns
+    -------
+    the same kind of result the construction returns
+    """
+    from manim import Create, Line
+    arguments = signature.bind(s, *args, **kwargs)
+    arguments.apply_defaults()
+    arguments = dict(arguments.arguments)
+    del arguments['s']
+    time = arguments.pop('time')
+
+    def to_mobjects(result):
+        if isinstance(result, tuple):
+            return tuple(to_mobjects(item) for item in result)
+        if result.shape == (2, 3):
+            return Line(*result)
+        if result.ndim > 2:
+            return tuple(to_mobjects(item) for item in result)
+        return result
+
+    def flatten(result):
+        if isinstance(result, tuple):
+            return [line for item in result for line in flatten(item)]
+        return [result] if isinstance(result, Line) else []
+
+    result = to_mobjects(getattr(geometry, function.__name__)(**arguments))
+    lines = flatten(result)
+    if lines and _detail['summary'] == 'appear':
+        s.play(*[Create(line) for line in lines], run_time=get_dt(function, time))
+    elif lines:
+        s.add(*lines)
+    return result
+
+@functools.lru_cache(maxsize=None)
+def op_count(function) -> int:
+    """The number of operations a construction takes, counting the ones in every construction it calls.
+        Worked out once for each construction
+
+    Parameters
+    ----------
+    function :
+        the construction
+
+    Returns
+    -------
+    the number of operations
+    """
+    return function.plays + sum(
+        max(op_count(together) for together in call) if isinstance(call, tuple) else op_count(call)
+        for call in function.calls
+    )
+
+def op_counts() -> dict:
+    """The number of operations of every registered construction, by name"""
+    return {name: op_count(function) for name, function in CONSTRUCTIONS.items()}
+
+def get_dt(function, time: float = None) -> float:
+    """How long one operation of a construction lasts
+
+    Parameters
+    ----------
+    function :
+        the construction
+    time :
+        how long the whole construction takes. One second per operation when None
+
+    Returns
+    -------
+    the length of one operation
+    """
+    if time is None:
+        return 1
+    return time/op_count(function)
+
+def time_for(function, dt: float) -> float:
+    """How long to give a construction when each operation lasts dt"""
+    return op_count(function)*dt
+
+def check_timing(function, *args, time: float = None, **kwargs):
+    """Runs a construction against a Recorder and checks it takes as long as it was given
+
+    Parameters
+    ----------
+    function :
+        the construction
+    *args :
+        what to pass to it after the Scene
+    time :
+        how long to give it
+    **kwargs :
+        what else to pass to it
+
+    Returns
+    -------
+    the recorded Timeline
+    """
+    from ManimHelpers.timeline import Recorder
+    expected = time if time is not None else op_count(function)
+    recorder = Recorder()
+    function(recorder, *args, time=time, **kwargs)
+    recorded = recorder.timeline.get_total_time()
+    if abs(recorded - expected) > 1e-6*max(expected, 1):
+        raise AssertionError(f"{function.__name__} took {recorded} but was given {expected}")
+    return recorder.timeline
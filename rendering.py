@@ -0,0 +1,503 @@
+import contextlib
+import functools
+import hashlib
+import os
+import shutil
+import subprocess
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from manim import *
+from ManimHelpers import geometry
+from ManimHelpers.files import replacing
+from ManimHelpers.registry import CONSTRUCTIONS, listen
+from ManimHelpers.timeline import Recorder, flatten_animations
+
+# where rendered pieces of constructions are kept between runs, set MANIMHELPERS_SEGMENT_CACHE to move it.
+# Pass cache_dir=None to render_parallel or construct_cached to render without it
+SEGMENT_CACHE_DIR = os.environ.get('MANIMHELPERS_SEGMENT_CACHE', os.path.join(os.path.expanduser('~'), '.cache', 'ManimHelpers', 'segments'))
+
+class Boundaries:
+    """Listens to a construction while it is recorded and notes the play where each construction
+        it is told about starts and ends, see registry.listen
+
+    Parameters
+    ----------
+    recorder :
+        the Recorder the construction plays in
+    """
+
+    def __init__(self, recorder: Recorder):
+        self.recorder = recorder
+        self.plays = {0}
+
+    def count(self) -> int:
+        return sum(1 for step in self.recorder.timeline if step.kind in ('play', 'wait'))
+
+    @contextlib.contextmanager
+    def span(self, name: str, category: str, **args):
+        self.plays.add(self.count())
+        try:
+            yield args
+        finally:
+            self.plays.add(self.count())
+
+def split(construction, *args, depth: int = 2, **kwargs) -> tuple:
+    """Records a construction and splits its plays where the constructions it calls start and end
+
+    Parameters
+    ----------
+    construction :
+        the construction
+    *args :
+        what to pass to it after the Scene
+    depth :
+        the deepest constructions to split at, 2 splits between the ones the construction calls itself
+    **kwargs :
+        what else to pass to it
+
+    Returns
+    -------
+    a list of (first, last) play numbers of each segment, counting waits as manim does,
+        a list of how long each segment lasts and the recorded Timeline
+    """
+    recorder = Recorder()
+    boundaries = Boundaries(recorder)
+    with listen(boundaries, depth):
+        construction(recorder, *args, **kwargs)
+
+    times = [step.run_time for step in recorder.timeline if step.kind in ('play', 'wait')]
+    cuts = sorted(boundaries.plays | {len(times)})
+    segments = [(first, last - 1) for first, last in zip(cuts, cuts[1:]) if last > first]
+    return segments, [sum(times[first:last + 1]) for first, last in segments], recorder.timeline
+
+def balance(segments: list, times: list, count: int) -> list:
+    """Joins neighbouring segments into at most count chunks that take about as long as each other
+
+    Parameters
+    ----------
+    segments :
+        the (first, last) play numbers of each segment
+    times :
+        how long each segment lasts
+    count :
+        how many chunks to make
+
+    Returns
+    -------
+    a list of (first, last) play numbers of each chunk
+    """
+    target = sum(times)/max(count, 1)
+    chunks = []
+    elapsed = 0
+    for (first, last), time in zip(segments, times):
+        if chunks and elapsed + time/2 <= target*len(chunks):
+            chunks[-1] = (chunks[-1][0], last)
+        else:
+            chunks.append((first, last))
+        elapsed += time
+    return chunks
+
+def portable(value):
+    """Turns the Lines in the arguments of a construction into Segments so they can be sent to another process"""
+    if isinstance(value, dict):
+        return {key: portable(item) for key, item in value.items()}
+    if isinstance(value, (tuple, list)):
+        return type(value)(portable(item) for item in value)
+    if isinstance(value, Mobject) and hasattr(value, 'get_start') and hasattr(value, 'get_end'):
+        return geometry.Segment(value.get_start(), value.get_end())
+    return value
+
+def drawable(value):
+    """Turns the Segments from portable back into Lines"""
+    if isinstance(value, dict):
+        return {key: drawable(item) for key, item in value.items()}
+    if isinstance(value, (tuple, list)):
+        return type(value)(drawable(item) for item in value)
+    if isinstance(value, geometry.Segment):
+        return value.to_line()
+    return value
+
+def lines(value) -> list:
+    """Every Line in the arguments of a construction, however deep they are in tuples and dictionaries"""
+    if isinstance(value, dict):
+        return lines(list(value.values()))
+    if isinstance(value, (tuple, list)):
+        return [line for item in value for line in lines(item)]
+    return [value] if isinstance(value, Line) else []
+
+def render_segment(name: str, args: tuple, kwargs: dict, first: int, last: int, output_file: str, media_dir: str, quality: str) -> str:
+    """Renders plays first to last of a construction on its own. Everything before first is run without
+        being rendered so the scene is in the same state it would be in the full render
+
+    Parameters
+    ----------
+    name :
+        the name of the construction
+    args :
+        the arguments after the Scene, as made by portable
+    kwargs :
+        the keyword arguments, as made by portable
+    first :
+        the first play to render
+    last :
+        the last play to render
+    output_file :
+        what to call the movie
+    media_dir :
+        where manim puts its files
+    quality :
+        the manim quality, like 'low_quality'
+
+    Returns
+    -------
+    the path of the movie
+    """
+    from ManimHelpers import constructions  # noqa: F401, importing it registers the constructions in this process
+    args, kwargs = drawable(args), drawable(kwargs)
+
+    class Piece(Scene):
+        def construct(self):
+            self.add(*lines((args, kwargs)))
+            CONSTRUCTIONS[name](self, *args, **kwargs)
+
+    with tempconfig({
+        'quality': quality, 'media_dir': media_dir, 'output_file': output_file, 'preview': False,
+        'from_animation_number': first, 'upto_animation_number': last, 'disable_caching': True
+    }):
+        scene = Piece()
+        scene.render()
+        return str(scene.renderer.file_writer.movie_file_path)
+
+def stitch(paths: list, output: str) -> str:
+    """Joins movies end to end with ffmpeg without re-encoding them
+
+    Parameters
+    ----------
+    paths :
+        the movies in order
+    output :
+        where to put the joined movie
+
+    Returns
+    -------
+    output
+    """
+    ffmpeg = getattr(config, 'ffmpeg_executable', None) or shutil.which('ffmpeg')
+    if ffmpeg is None:
+        raise RuntimeError("joining the pieces of a construction needs ffmpeg, and it isn't on the PATH")
+    with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as listing:
+        listing.writelines(f"file '{os.path.abspath(path)}'\n" for path in paths)
+    try:
+        subprocess.run(
+            [ffmpeg, '-y', '-loglevel', 'error', '-f', 'concat', '-safe', '0', '-i', listing.name, '-c', 'copy', output],
+            check=True
+        )
+    finally:
+        os.remove(listing.name)
+    return output
+
+def render_parallel(construction, *args, output: str = None, workers: int = None, depth: int = 2, quality: str = 'low_quality', media_dir: str = None, cache_dir: str = SEGMENT_CACHE_DIR, **kwargs) -> str:
+    """Renders a construction in pieces on several processes and joins them into one movie.
+        The pieces are split where the constructions it calls start and end, and each process works out
+        the geometry of the pieces before its own again so no state has to be sent between them.
+        The Lines given to the construction are sent as their start and end, so they are drawn plain.
+
+    Parameters
+    ----------
+    construction :
+        the construction
+    *args :
+        what to pass to it after the Scene
+    output :
+        where to put the movie, the name of the construction in the current directory when None
+    workers :
+        how many processes to use, one per core when None
+    depth :
+        the deepest constructions to split at, see split
+    quality :
+        the manim quality
+    media_dir :
+        where manim puts the pieces, a temporary directory when None
+    cache_dir :
+        where to keep rendered pieces to reuse them, see render_cached. None to always render
+    **kwargs :
+        what else to pass to the construction
+
+    Returns
+    -------
+    the path of the movie
+    """
+    workers = workers or os.cpu_count()
+    output = output or f"{construction.__name__}.mp4"
+    segments, times, timeline = split(construction, *args, depth=depth, **kwargs)
+    if not segments:
+        raise ValueError(f"{construction.__name__} makes no plays, so there is no movie to render")
+    chunks = balance(segments, times, workers)
+
+    with contextlib.ExitStack() as stack:
+        if media_dir is None:
+            media_dir = stack.enter_context(tempfile.TemporaryDirectory())
+        with ProcessPoolExecutor(min(workers, len(chunks))) as pool:
+            paths = list(pool.map(
+                render_cached,
+                *zip(*[
+                    (
+                        segment_key(construction.__name__, args, kwargs, first, last, quality), cache_dir,
+                        construction.__name__, portable(args), portable(kwargs), first, last, f"segment_{index:04d}", media_dir, quality
+                    )
+                    for index, (first, last) in enumerate(chunks)
+                ])
+            ))
+        return stitch(paths, output)
+
+@functools.lru_cache(maxsize=None)
+def source_hash() -> str:
+    """A hash of the code of every module in the package, so changing what a construction draws doesn't reuse old movies"""
+    package = os.path.dirname(os.path.abspath(geometry.__file__))
+    digest = hashlib.sha256()
+    for name in sorted(name for name in os.listdir(package) if name.endswith('.py')):
+        digest.update(name.encode())
+        with open(os.path.join(package, name), 'rb') as file:
+            digest.update(file.read())
+    return digest.hexdigest()
+
+def style_key(value):
+    """The colors and stroke widths of the mobjects in the arguments of a construction"""
+    if isinstance(value, (tuple, list)):
+        return tuple(style_key(item) for item in value)
+    if isinstance(value, Mobject):
+        return tuple((str(mobject.get_color()), float(mobject.get_stroke_width())) for mobject in value.get_family())
+    return None
+
+def segment_key(name: str, args: tuple, kwargs: dict, first: int = None, last: int = None, quality: str = None, scene: str = None) -> str:
+    """The address of a rendered piece of a construction in the cache
+
+    Parameters
+    ----------
+    name :
+        the name of the construction
+    args :
+        the arguments after the Scene
+    kwargs :
+        the keyword arguments, including time
+    first :
+        the first play of the piece, None for the whole construction
+    last :
+        the last play of the piece, None for the whole construction
+    quality :
+        the manim quality, the current resolution and frame rate when None
+    scene :
+        a hash of whatever else is in the scene, see scene_key
+
+    Returns
+    -------
+    the key
+    """
+    if quality is None:
+        quality = (config.pixel_width, config.pixel_height, config.frame_rate, str(config.background_color))
+    kwargs = tuple(sorted(kwargs.items()))
+    described = repr((
+        source_hash(), name, geometry.geometry_key(args), geometry.geometry_key(kwargs),
+        style_key(args), style_key(kwargs), first, last, quality, scene
+    ))
+    return hashlib.sha256(described.encode()).hexdigest()
+
+def hash_mobjects(digest, mobjects):
+    """Feeds how some mobjects look into a hashlib digest"""
+    for mobject in mobjects:
+        for part in mobject.get_family():
+            digest.update(np.round(part.points/geometry.QUANTUM).astype(np.int64).tobytes())
+            digest.update(repr((type(part).__name__, str(part.get_color()), float(part.get_stroke_width()))).encode())
+
+def scene_key(s: Scene) -> str:
+    """A hash of how everything in a scene looks right now"""
+    digest = hashlib.sha256()
+    hash_mobjects(digest, s.mobjects)
+    return digest.hexdigest()
+
+def store(path: str, cache_dir: str, key: str) -> str:
+    """Copies a movie into the cache under key and gives back where it went"""
+    cached = os.path.join(cache_dir, f"{key}.mp4")
+    with replacing(cached, '.mp4') as partial:
+        shutil.copyfile(path, partial)
+    return cached
+
+def render_cached(key: str, cache_dir: str, *args) -> str:
+    """Gives the movie of a piece from the cache, rendering it with render_segment if it isn't there
+
+    Parameters
+    ----------
+    key :
+        the address of the piece, see segment_key
+    cache_dir :
+        where the cache is, None to always render
+    *args :
+        what to pass to render_segment
+
+    Returns
+    -------
+    the path of the movie
+    """
+    if cache_dir is not None and os.path.exists(os.path.join(cache_dir, f"{key}.mp4")):
+        return os.path.join(cache_dir, f"{key}.mp4")
+    path = render_segment(*args)
+    return store(path, cache_dir, key) if cache_dir is not None else path
+
+def construct_cached(s: Scene, construction, *args, cache_dir: str = SEGMENT_CACHE_DIR, **kwargs):
+    """Runs a construction in a Scene, reusing its movie from the cache when the same construction has been
+        rendered before from the same inputs, in the same style and quality, with the same scene around it.
+        On a hit the construction still runs so the scene ends up the same, but nothing is rendered.
+
+    Parameters
+    ----------
+    s :
+        The Scene
+    construction :
+        the construction
+    *args :
+        what to pass to it after the Scene
+    cache_dir :
+        where the cache is
+    **kwargs :
+        what else to pass to it
+
+    Returns
+    -------
+    what the construction returns
+    """
+    renderer = getattr(s, 'renderer', None)
+    file_writer = getattr(renderer, 'file_writer', None)
+    if cache_dir is None or file_writer is None or renderer.skip_animations:
+        return construction(s, *args, **kwargs)
+
+    key = segment_key(construction.__name__, args, kwargs, scene=scene_key(s))
+    cached = os.path.join(cache_dir, f"{key}.mp4")
+    before = len(file_writer.partial_movie_files)
+    if os.path.exists(cached):
+        # manim resets skip_animations to this before every play
+        skipping = renderer._original_skipping_status
+        renderer._original_skipping_status = True
+        try:
+            result = construction(s, *args, **kwargs)
+        finally:
+            renderer._original_skipping_status = skipping
+            renderer.skip_animations = skipping
+        # manim opens the movie of each play by its number, so the cached movie takes the place of
+        # the last skipped play instead of shifting every play after it
+        skipped = [index for index in range(before, len(file_writer.partial_movie_files)) if file_writer.partial_movie_files[index] is None]
+        if skipped:
+            file_writer.partial_movie_files[skipped[-1]] = cached
+        return result
+
+    result = construction(s, *args, **kwargs)
+    paths = [path for path in file_writer.partial_movie_files[before:] if path is not None]
+    if paths:
+        with tempfile.TemporaryDirectory() as directory:
+            store(stitch(paths, os.path.join(directory, 'joined.mp4')), cache_dir, key)
+    return result
+
+def piece_keys(timeline, inputs: list, pieces: list, quality: str) -> list:
+    """The address of each piece of a recorded construction worked out from what it draws, so a piece
+        whose geometry didn't change keeps its address when the inputs of the construction change
+
+    Parameters
+    ----------
+    timeline :
+        the recorded Timeline, see split
+    inputs :
+        the Lines given to the construction, which are in the scene the whole time
+    pieces :
+        the (first, last) play numbers of each piece, in order
+    quality :
+        the manim quality
+
+    Returns
+    -------
+    a list of the keys
+    """
+    plays = [index for index, step in enumerate(timeline) if step.kind in ('play', 'wait')]
+    live = {}
+    done = 0
+    keys = []
+    for first, last in pieces:
+        # what is in the scene when the piece starts
+        for step in timeline[done:plays[first]]:
+            live.update((id(mobject), mobject) for mobject in step.added)
+            for mobject in step.removed:
+                live.pop(id(mobject), None)
+        done = plays[first]
+
+        digest = hashlib.sha256(repr((source_hash(), quality)).encode())
+        hash_mobjects(digest, list(inputs) + list(live.values()))
+        for step in timeline[plays[first]:plays[last] + 1]:
+            digest.update(repr((step.kind, round(step.run_time, 6))).encode())
+            hash_mobjects(digest, step.mobjects)
+            for animation in flatten_animations(step.animations):
+                digest.update(type(animation).__name__.encode())
+                hash_mobjects(digest, [
+                    mobject for mobject in (getattr(animation, 'mobject', None), getattr(animation, 'target_mobject', None))
+                    if mobject is not None
+                ])
+        keys.append(digest.hexdigest())
+    return keys
+
+def render_incremental(construction, *args, output: str = None, workers: int = None, depth: int = 2, quality: str = 'low_quality', media_dir: str = None, cache_dir: str = SEGMENT_CACHE_DIR, **kwargs) -> str:
+    """Renders a construction in pieces like render_parallel, but addresses each piece in the cache by the geometry
+        it draws instead of the inputs of the whole construction. After an input is changed only the pieces that
+        draw something different are rendered again and the rest come from the cache.
+
+    Parameters
+    ----------
+    construction :
+        the construction
+    *args :
+        what to pass to it after the Scene
+    output :
+        where to put the movie, the name of the construction in the current directory when None
+    workers :
+        how many processes to use, one per core when None
+    depth :
+        the deepest constructions to split at, see split. Deeper gives smaller pieces to reuse
+    quality :
+        the manim quality
+    media_dir :
+        where manim puts the pieces, a temporary directory when None
+    cache_dir :
+        where to keep the pieces
+    **kwargs :
+        what else to pass to the construction
+
+    Returns
+    -------
+    the path of the movie
+    """
+    if cache_dir is None:
+        raise ValueError("render_incremental needs a cache_dir to reuse pieces from")
+    workers = workers or os.cpu_count()
+    output = output or f"{construction.__name__}.mp4"
+    pieces, times, timeline = split(construction, *args, depth=depth, **kwargs)
+    if not pieces:
+        raise ValueError(f"{construction.__name__} makes no plays, so there is no movie to render")
+    keys = piece_keys(timeline, lines((args, kwargs)), pieces, quality)
+    paths = [os.path.join(cache_dir, f"{key}.mp4") for key in keys]
+    missing = [index for index, path in enumerate(paths) if not os.path.exists(path)]
+    logger.info(f"Rendering {len(missing)} of {len(pieces)} pieces of {construction.__name__}, the rest are unchanged")
+
+    if missing:
+        with contextlib.ExitStack() as stack:
+            if media_dir is None:
+                media_dir = stack.enter_context(tempfile.TemporaryDirectory())
+            with ProcessPoolExecutor(min(workers, len(missing))) as pool:
+                rendered = pool.map(
+                    render_cached,
+                    *zip(*[
+                        (
+                            keys[index], cache_dir, construction.__name__, portable(args), portable(kwargs),
+                            pieces[index][0], pieces[index][1], f"piece_{index:04d}", media_dir, quality
+                        )
+                        for index in missing
+                    ])
+                )
+                for index, path in zip(missing, rendered):
+                    paths[index] = path
+    return stitch(paths, output)
@@ -0,0 +1,232 @@
+import hashlib
+import json
+import os
+from manim import *
+from ManimHelpers import geometry
+from ManimHelpers.files import replacing
+from ManimHelpers.rendering import lines
+from ManimHelpers.timeline import Recorder, Step, Timeline
+
+FORMAT = 1
+
+class Table:
+    """The geometry and style of every mobject, segment and array of points in a result or timeline,
+        each kept once and given an index
+
+    Parameters
+    ----------
+    items :
+        the arrays the table is read back from, None for a new table
+    """
+
+    def __init__(self, items: dict = None):
+        self._index = {}
+        self.kinds, self.points, self.colors, self.stroke_widths, self.fill_opacities = [], [], [], [], []
+        self.loaded = []
+        self.made = {}
+        if items is not None:
+            offsets = items['offsets']
+            for index, kind in enumerate(items['kinds']):
+                points = items['points'][offsets[index]:offsets[index + 1]]
+                self.loaded.append((str(kind), points, str(items['colors'][index]), float(items['stroke_widths'][index]), float(items['fill_opacities'][index])))
+
+    def put(self, item) -> int:
+        """Adds an item if it isn't in the table yet and gives its index"""
+        if id(item) in self._index:
+            return self._index[id(item)]
+        if isinstance(item, geometry.Segment):
+            kind, points, style = 'segment', item.points, ('', 0, 0)
+        elif isinstance(item, np.ndarray):
+            kind, points, style = 'points', item.reshape(-1, 3), ('', 0, 0)
+        elif isinstance(item, Line):
+            kind, points = 'line', np.array([item.get_start(), item.get_end()])
+            style = (str(item.get_color()), item.get_stroke_width(), item.get_fill_opacity())
+        else:
+            kind, points = 'vmobject', item.points
+            style = (str(item.get_color()), item.get_stroke_width(), item.get_fill_opacity())
+        self.kinds.append(kind)
+        self.points.append(np.asarray(points, dtype=float))
+        self.colors.append(style[0])
+        self.stroke_widths.append(style[1])
+        self.fill_opacities.append(style[2])
+        self._index[id(item)] = len(self.kinds) - 1
+        return self._index[id(item)]
+
+    def get(self, index: int, segments: bool = False, shape: tuple = None):
+        """Makes the item at index from the loaded arrays, Lines as Segments when segments is True.
+            Each one is only made once so the same item comes back every time"""
+        kind, points, color, stroke_width, fill_opacity = self.loaded[index]
+        if kind == 'points':
+            return np.array(points).reshape(shape)
+        if kind == 'segment' or kind == 'line' and segments:
+            return geometry.Segment(*points)
+        if index not in self.made:
+            if kind == 'line':
+                self.made[index] = Line(*points, color=color, stroke_width=stroke_width)
+            else:
+                self.made[index] = VMobject(stroke_color=color, stroke_width=stroke_width)
+                self.made[index].set_points(np.array(points)).set_fill(color, fill_opacity)
+        return self.made[index]
+
+    def get_arrays(self) -> dict:
+        """The table as arrays to save"""
+        return {
+            'kinds': np.array(self.kinds, dtype=str),
+            'points': np.concatenate(self.points) if self.points else np.zeros((0, 3)),
+            'offsets': np.cumsum([0] + [len(points) for points in self.points]),
+            'colors': np.array(self.colors, dtype=str),
+            'stroke_widths': np.array(self.stroke_widths, dtype=float),
+            'fill_opacities': np.array(self.fill_opacities, dtype=float),
+        }
+
+def encode(value, table: Table):
+    """The layout of a result with its geometry put in table, as something json can write"""
+    if isinstance(value, (tuple, list)):
+        return {'tuple': [encode(item, table) for item in value]}
+    if isinstance(value, np.ndarray) and value.shape[-1:] == (3,):
+        return {'item': table.put(value), 'shape': list(value.shape)}
+    if isinstance(value, (geometry.Segment, Mobject)):
+        return {'item': table.put(value)}
+    if isinstance(value, np.ndarray):
+        raise TypeError(f"can only save arrays of points, with 3 numbers in their last dimension, not shape {value.shape}")
+    if isinstance(value, np.generic):
+        value = value.item()
+    return {'value': value}
+
+def decode(layout: dict, table: Table, segments: bool = False):
+    """Makes a result back from its layout, see encode"""
+    if 'tuple' in layout:
+        return tuple(decode(item, table, segments) for item in layout['tuple'])
+    if 'item' in layout:
+        return table.get(layout['item'], segments, layout.get('shape'))
+    return layout['value']
+
+def inputs_key(args: tuple, kwargs: dict) -> str:
+    """A hash of the geometry of what a construction was given, see geometry.geometry_key"""
+    described = repr((geometry.geometry_key(args), geometry.geometry_key(tuple(sorted(kwargs.items())))))
+    return hashlib.sha256(described.encode()).hexdigest()
+
+def saved_inputs(path: str) -> str:
+    """The inputs_key a file written by save_result was saved with, None when it wasn't given one"""
+    with np.load(path) as items:
+        return str(items['inputs']) if 'inputs' in items.files else None
+
+def save_result(path: str, result, timeline: Timeline = None, inputs: str = None):
+    """Writes what a construction returned to an npz file so other scenes can load it instead of
+        running the construction again. The arrays are stored uncompressed
+
+    Parameters
+    ----------
+    path :
+        the file
+    result :
+        what the construction returned
+    timeline :
+        the steps the construction made, see Recorder, to store too. Only what each step adds and
+        removes is kept, not the animations themselves
+    inputs :
+        the inputs_key of what the construction was given, to store too
+    """
+    table = Table()
+    arrays = {'layout': np.array(json.dumps(encode(result, table)))}
+    if timeline is not None:
+        added = [[table.put(mobject) for mobject in step.added] for step in timeline]
+        removed = [[table.put(mobject) for mobject in step.removed] for step in timeline]
+        arrays.update({
+            'step_kinds': np.array([step.kind for step in timeline], dtype=str),
+            'run_times': np.array([step.run_time for step in timeline], dtype=float),
+            'added': np.array([index for indices in added for index in indices], dtype=int),
+            'added_offsets': np.cumsum([0] + [len(indices) for indices in added]),
+            'removed': np.array([index for indices in removed for index in indices], dtype=int),
+            'removed_offsets': np.cumsum([0] + [len(indices) for indices in removed]),
+        })
+    if inputs is not None:
+        arrays['inputs'] = np.array(inputs)
+    arrays.update(table.get_arrays())
+    arrays['format'] = np.array(FORMAT)
+
+    with replacing(path, '.npz') as partial:
+        np.savez(partial, **arrays)
+
+def load_result(path: str, segments: bool = False, timeline: bool = False):
+    """Reads what a construction returned from a file written by save_result
+
+    Parameters
+    ----------
+    path :
+        the file
+    segments :
+        whether to give the lines as geometry.Segments instead of Lines
+    timeline :
+        whether to give the stored timeline too. It replays with Create for what each play added
+        and FadeOut for what it removed
+
+    Returns
+    -------
+    the result, and the Timeline when timeline is True
+    """
+    with np.load(path) as items:
+        items = dict(items)
+    if int(items['format']) != FORMAT:
+        raise ValueError(f"{path} was saved in format {int(items['format'])}, not {FORMAT}")
+    table = Table(items)
+    result = decode(json.loads(str(items['layout'])), table, segments)
+    if not timeline:
+        return result
+    if 'step_kinds' not in items:
+        raise ValueError(f"{path} was saved without a timeline")
+
+    steps = []
+    added_offsets, removed_offsets = items['added_offsets'], items['removed_offsets']
+    for index, (kind, run_time) in enumerate(zip(items['step_kinds'], items['run_times'])):
+        added = [table.get(item) for item in items['added'][added_offsets[index]:added_offsets[index + 1]]]
+        removed = [table.get(item) for item in items['removed'][removed_offsets[index]:removed_offsets[index + 1]]]
+        if kind == 'play':
+            animations = [Create(mobject) for mobject in added] + [FadeOut(mobject) for mobject in removed]
+            steps.append(Step('play', animations, float(run_time), added, removed))
+        elif kind == 'add':
+            steps.append(Step('add', added=added, mobjects=added))
+        elif kind == 'remove':
+            steps.append(Step('remove', removed=removed, mobjects=removed))
+        else:
+            steps.append(Step(str(kind), run_time=float(run_time)))
+    return result, Timeline(steps)
+
+def construct_saved(s: Scene, path: str, construction, *args, timeline: bool = False, **kwargs):
+    """Loads the result of a construction from path and adds its lines to the scene without animating,
+        or runs the construction and saves its result there when the file doesn't exist yet or was saved
+        from other inputs. Meant for propositions that build on ones proved in another video
+
+    Parameters
+    ----------
+    s :
+        The Scene
+    path :
+        the file, see save_result
+    construction :
+        the construction
+    *args :
+        what to pass to it after the Scene
+    timeline :
+        whether to save the steps of the construction too. They are recorded first and then played
+    **kwargs :
+        what else to pass to it
+
+    Returns
+    -------
+    what the construction returns
+    """
+    inputs = inputs_key(args, kwargs)
+    if os.path.exists(path) and saved_inputs(path) == inputs:
+        result = load_result(path)
+        s.add(*lines(result))
+        return result
+    if not timeline:
+        result = construction(s, *args, **kwargs)
+        save_result(path, result, inputs=inputs)
+        return result
+    recorder = Recorder(*s.mobjects)
+    result = construction(recorder, *args, **kwargs)
+    recorder.timeline.replay(s)
+    save_result(path, result, recorder.timeline, inputs)
+    return result
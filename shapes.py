@@ -1,5 +1,130 @@
 from manim import *
 from ManimHelpers.constant_suppliments import *
+from ManimHelpers import geometry
+
+# how many arcs make up the circles used while constructing
+SCAFFOLD_CIRCLE_COMPONENTS = 9
+
+class CirclePool:
+    """Makes circles by scaling and shifting the points of one unit circle instead of working out new arcs,
+        reusing circles that have been retired once they are out of the scene
+
+    Parameters
+    ----------
+    num_components :
+        how many components make up each circle
+    size :
+        the most retired circles to hold on to
+    """
+
+    def __init__(self, num_components: int = SCAFFOLD_CIRCLE_COMPONENTS, size: int = 64):
+        self.num_components = num_components
+        self.size = size
+        self.template = None
+        self.retired = []
+
+    def get(self, radius: float, center: np.ndarray = ORIGIN, color: str = WHITE) -> Circle:
+        """A circle of radius around center
+
+        Parameters
+        ----------
+        radius :
+            the radius
+        center :
+            the center
+        color :
+            the color of the circle
+
+        Returns
+        -------
+        the Circle
+        """
+        if self.template is None:
+            self.template = Circle(radius=1, num_components=self.num_components)
+        circle = self.retired.pop() if self.retired else self.template.copy()
+        circle.set_points(radius*self.template.points + geometry.as_point(center))
+        circle.radius = radius
+        circle.set_stroke(color, DEFAULT_STROKE_WIDTH, opacity=1)
+        return circle.set_fill(opacity=0)
+
+    def retire(self, *mobjects):
+        """Hands back circles that are no longer in the scene so get can reuse them"""
+        for mobject in mobjects:
+            if isinstance(mobject, Circle) and len(self.retired) < self.size:
+                self.retired.append(mobject)
+
+circles = CirclePool()
+
+def retire_circles(s: Scene, *mobjects):
+    """Gives circles that were just faded out back to circles. Only done when s is a Scene, because a Recorder
+        or anything else that holds on to the animations to play them later still needs the circles as they were
+
+    Parameters
+    ----------
+    s :
+        The Scene
+    *mobjects :
+        the mobjects that were faded out, only the circles are kept
+    """
+    if isinstance(s, Scene):
+        circles.retire(*mobjects)
+
+# each mark is a tuple of strokes, and each stroke goes between two angles off the line.
+# None is the middle of the mark. Ticks reach length out and arrows twice that
+ONE_TICK = ((PI/2, -PI/2),)
+FIVE_TICK = ((PI/3, -PI/2 - PI/6), (PI/2 + PI/6, -PI/3))
+TEN_TICK = ONE_TICK + FIVE_TICK
+ONE_ARROW = ((None, PI/2 + PI/3), (None, -PI/2 - PI/3))
+FIVE_ARROW = ONE_ARROW + ((None, PI/2 + PI/6), (None, -PI/2 - PI/6))
+TEN_ARROW = ((PI/2, -PI/2),) + FIVE_ARROW
+
+def mark_strokes(cong_mark_num: int, parrel_mark_num: int, length: float) -> tuple:
+    """Lays out the strokes of the ticks and arrows of a MarkedLine as if the line went to the right
+        and every mark were centered on the origin
+
+    Parameters
+    ----------
+    cong_mark_num :
+        the number of ticks
+    parrel_mark_num :
+        the number of arrows
+    length :
+        the length of the ticks
+
+    Returns
+    -------
+    an array of shape (n, 2, 3) of the start and end of every stroke and an array of shape (n,) of which mark each stroke belongs to
+    """
+    marks = []
+    for number, (ten, five, one), size in ((cong_mark_num, (TEN_TICK, FIVE_TICK, ONE_TICK), length), (parrel_mark_num, (TEN_ARROW, FIVE_ARROW, ONE_ARROW), 2*length)):
+        marks += [(ten, size)]*(number//10) + [(five, size)]*(number%10//5) + [(one, size)]*(number%5)
+
+    angles = [stroke for mark, size in marks for stroke in mark]
+    if not angles:
+        return np.zeros((0, 2, 3)), np.zeros(0, dtype=int)
+    sizes = np.repeat([size for mark, size in marks], [len(mark) for mark, size in marks])
+    slots = np.repeat(np.arange(len(marks)), [len(mark) for mark, size in marks])
+
+    angles = np.array([[np.nan if angle is None else angle for angle in stroke] for stroke in angles])
+    radii = np.where(np.isnan(angles), 0, sizes[:, None])
+    angles = np.nan_to_num(angles)
+    strokes = np.stack([radii*np.cos(angles), radii*np.sin(angles), np.zeros(angles.shape)], axis=-1)
+    return strokes, slots
+
+def strokes_to_points(strokes: np.ndarray) -> np.ndarray:
+    """Turns straight strokes into the points of one VMobject path, four bezier points a stroke
+
+    Parameters
+    ----------
+    strokes :
+        an array of shape (n, 2, 3)
+
+    Returns
+    -------
+    an array of shape (4n, 3)
+    """
+    weights = np.linspace(0, 1, 4)[None, :, None]
+    return (strokes[:, None, 0] + weights*(strokes[:, None, 1] - strokes[:, None, 0])).reshape(-1, 3)
 
 class MarkedLine(VMobject):
     """A line with ticks to represent congruency and arrows to represent parrelelism
@@ -33,126 +158,62 @@ class MarkedLine(VMobject):
         VMobject.__init__(self, **kwargs)
 
         self.add(self.line)
-        angle_main_line = self.line.get_angle()
 
-        # number of marks
-        num_ten_ticks = int(cong_mark_num/10)
-        num_five_ticks = int((cong_mark_num - 10*num_ten_ticks)/5)
-        num_one_ticks = cong_mark_num - 10*num_ten_ticks - 5*num_five_ticks
-        
-        num_ten_arrows = int(parrel_mark_num/10)
-        num_five_arrows = int((parrel_mark_num - 10*num_ten_arrows)/5)
-        num_one_arrows = parrel_mark_num - 10*num_ten_arrows - 5*num_five_arrows
+        strokes, slots = mark_strokes(cong_mark_num, parrel_mark_num, length)
+        # the marks are kept as (how far along the line, offset across it) so they follow the line
+        # through one affine transform, see update_marks
+        self.mark_local = np.zeros((4*len(strokes), 4))
+        if len(strokes) != 0:
+            # the percentage of length between marks
+            mark_spacing = mark_layout_width / (slots[-1] + 1)
+            first_mark = mark_origin - mark_spacing*slots[-1]/2
+            self.mark_local[:, 0] = np.repeat(first_mark + mark_spacing*slots, 4)
+            self.mark_local[:, 1:3] = strokes_to_points(strokes)[:, :2]
+            self.mark_local[:, 3] = 1
+
+        self.marks = VMobject(stroke_width=3)
+        self.update_marks()
+        self.add(self.marks)
 
-        num_marks = num_ten_ticks + num_five_ticks + num_one_ticks + num_ten_arrows + num_five_arrows + num_one_arrows
+    def get_mark_transform(self) -> np.ndarray:
+        """The affine transform from the marks' line-local coordinates to where the line is now
 
-        if num_marks != 0:
-            # the percentage of length between marks
-            mark_spacing = mark_layout_width / num_marks
-
-            # start + start_to_next_mark = location of first mark at first
-            start = self.line.get_start()
-            end = self.line.get_end()
-            start_to_next_mark = (end - start)*(mark_origin - mark_spacing*(num_marks-1)/2)
-            mark_width = 3
-            for i in range(num_ten_ticks):
-                self.add(Line(
-                    start = start + start_to_next_mark + self.rot(PI/2 + angle_main_line)@(length*RIGHT),
-                    end = start + start_to_next_mark + self.rot(-PI/2 + angle_main_line)@(length*RIGHT),
-                    stroke_width = mark_width
-                ))
-                self.add(Line(
-                    start = start + start_to_next_mark + self.rot(PI/3 + angle_main_line)@(length*RIGHT),
-                    end = start + start_to_next_mark + self.rot(-PI/2 - PI/6 + angle_main_line)@(length*RIGHT),
-                    stroke_width = mark_width
-                ))
-                self.add(Line(
-                    start = start + start_to_next_mark + self.rot(PI/2 + PI/6 + angle_main_line)@(length*RIGHT),
-                    end = start + start_to_next_mark + self.rot(-PI/3 + angle_main_line)@(length*RIGHT),
-                    stroke_width = mark_width
-                ))
-                start_to_next_mark += mark_spacing*(end - start)
-            for i in range(num_five_ticks):
-                self.add(Line(
-                    start = start + start_to_next_mark + self.rot(PI/3 + angle_main_line)@(length*RIGHT),
-                    end = start + start_to_next_mark + self.rot(-PI/2 - PI/6 + angle_main_line)@(length*RIGHT),
-                    stroke_width = mark_width
-                ))
-                self.add(Line(
-                    start = start + start_to_next_mark + self.rot(PI/2 + PI/6 + angle_main_line)@(length*RIGHT),
-                    end = start + start_to_next_mark + self.rot(-PI/3 + angle_main_line)@(length*RIGHT),
-                    stroke_width = mark_width
-                ))
-                start_to_next_mark += mark_spacing*(end - start)
-            for i in range(num_one_ticks):
-                self.add(Line(
-                    start = start + start_to_next_mark + self.rot(PI/2 + angle_main_line)@(length*RIGHT),
-                    end = start + start_to_next_mark + self.rot(-PI/2 + angle_main_line)@(length*RIGHT),
-                    stroke_width = mark_width
-                ))
-                start_to_next_mark += mark_spacing*(end - start)
-            length = 2*length
-            for i in range(num_ten_arrows):
-                self.add(Line(
-                    start = start + start_to_next_mark + self.rot(PI/2 + angle_main_line)@(length*RIGHT),
-                    end = start + start_to_next_mark + self.rot(-PI/2 + angle_main_line)@(length*RIGHT),
-                    stroke_width = mark_width
-                ))
-                self.add(Line(
-                    start = start + start_to_next_mark,
-                    end = start + start_to_next_mark + self.rot(PI/2 + PI/3 + angle_main_line)@(length*RIGHT),
-                    stroke_width = mark_width
-                ))
-                self.add(Line(
-                    start = start + start_to_next_mark,
-                    end = start + start_to_next_mark + self.rot(-PI/2 - PI/3 + angle_main_line)@(length*RIGHT),
-                    stroke_width = mark_width
-                ))
-                self.add(Line(
-                    start = start + start_to_next_mark,
-                    end = start + start_to_next_mark + self.rot(PI/2 + PI/6 + angle_main_line)@(length*RIGHT),
-                    stroke_width = mark_width
-                ))
-                self.add(Line(
-                    start = start + start_to_next_mark,
-                    end = start + start_to_next_mark + self.rot(-PI/2 - PI/6 + angle_main_line)@(length*RIGHT),
-                    stroke_width = mark_width
-                ))
-                start_to_next_mark += mark_spacing*(end - start)
-            for i in range(num_five_arrows):
-                self.add(Line(
-                    start = start + start_to_next_mark,
-                    end = start + start_to_next_mark + self.rot(PI/2 + PI/3 + angle_main_line)@(length*RIGHT),
-                    stroke_width = mark_width
-                ))
-                self.add(Line(
-                    start = start + start_to_next_mark,
-                    end = start + start_to_next_mark + self.rot(-PI/2 - PI/3 + angle_main_line)@(length*RIGHT),
-                    stroke_width = mark_width
-                ))
-                self.add(Line(
-                    start = start + start_to_next_mark,
-                    end = start + start_to_next_mark + self.rot(PI/2 + PI/6 + angle_main_line)@(length*RIGHT),
-                    stroke_width = mark_width
-                ))
-                self.add(Line(
-                    start = start + start_to_next_mark,
-                    end = start + start_to_next_mark + self.rot(-PI/2 - PI/6 + angle_main_line)@(length*RIGHT),
-                    stroke_width = mark_width
-                ))
-                start_to_next_mark += mark_spacing*(end - start)
-            for i in range(num_one_arrows):
-                self.add(Line(
-                    start = start + start_to_next_mark,
-                    end = start + start_to_next_mark + self.rot(PI/2 + PI/3 + angle_main_line)@(length*RIGHT),
-                    stroke_width = mark_width
-                ))
-                self.add(Line(
-                    start = start + start_to_next_mark,
-                    end = start + start_to_next_mark + self.rot(-PI/2 - PI/3 + angle_main_line)@(length*RIGHT),
-                    stroke_width = mark_width
-                ))
-                start_to_next_mark += mark_spacing*(end - start)
+        Returns
+        -------
+        an array of shape (3, 4) taking (proportion, x offset, y offset, 1) to a point
+        """
+        start = self.line.get_start()
+        rotation = self.rot(self.line.get_angle())
+        return np.column_stack([self.line.get_end() - start, rotation[:, 0], rotation[:, 1], start])
+
+    def update_marks(self, *args):
+        """Moves the marks back onto the line after self.line was moved, rotated or transformed.
+            It can be added as an updater, marked_line.add_updater(MarkedLine.update_marks)
+
+        Returns
+        -------
+        self
+        """
+        if len(self.mark_local) != 0:
+            self.marks.set_points(self.mark_local@self.get_mark_transform().T)
+        return self
+
+    def put_start_and_end_on(self, start: np.ndarray, end: np.ndarray):
+        """Moves the line to start and end and takes the marks with it without changing their size
+
+        Parameters
+        ----------
+        start :
+            the new start
+        end :
+            the new end
+
+        Returns
+        -------
+        self
+        """
+        self.line.put_start_and_end_on(start, end)
+        return self.update_marks()
 
     def rot(self, angle):
         return np.array([[np.cos(angle), -np.sin(angle), 0], [np.sin(angle), np.cos(angle), 0], [0, 0, 1]])
@@ -170,4 +231,108 @@ class MarkedLine(VMobject):
         return self.line.get_unit_vector()
     
     def get_angle(self):
-        return self.line.get_angle()
\ No newline at end of file
+        return self.line.get_angle()
+
+def equal_classes(values, tolerance: float, period: float = None) -> list:
+    """Groups values that are within tolerance of each other using a hash index of buckets tolerance wide,
+        so each value is only compared to the ones in its own and the neighbouring buckets
+
+    Parameters
+    ----------
+    values :
+        the values
+    tolerance :
+        how far apart two equal values can be
+    period :
+        if given, values are taken modulo period, like directions modulo PI
+
+    Returns
+    -------
+    a list with the class of each value, numbered in the order they are first seen
+    """
+    buckets = {}
+    classes = []
+    count = 0
+    wrap = int(np.ceil(period/tolerance)) if period is not None else None
+    for value in values:
+        if period is not None:
+            value %= period
+        key = int(np.floor(value/tolerance))
+        found = None
+        for neighbour in (key - 1, key, key + 1):
+            if wrap is not None:
+                neighbour %= wrap
+            for other, other_class in buckets.get(neighbour, ()):
+                distance = abs(value - other)
+                if period is not None:
+                    distance = min(distance, period - distance)
+                if distance <= tolerance:
+                    found = other_class
+                    break
+            if found is not None:
+                break
+        if found is None:
+            found = count
+            count += 1
+        buckets.setdefault(key % wrap if wrap is not None else key, []).append((value, found))
+        classes.append(found)
+    return classes
+
+def figure_marks(lines, tolerance: float = 1e-6) -> tuple:
+    """Works out the marks for a figure so congruent lines share a number of ticks and parallel lines
+        share a number of arrows. Lines that are not equal or parallel to any other get none
+
+    Parameters
+    ----------
+    lines :
+        the Lines, MarkedLines, Segments or (2, 3) arrays of the figure
+    tolerance :
+        how different two lengths or directions can be and still count as the same
+
+    Returns
+    -------
+    a list of the number of ticks and a list of the number of arrows for each line
+    """
+    segments = [geometry.as_segment(line) for line in lines]
+    vectors = [end - start for start, end in segments]
+    lengths = [np.linalg.norm(vector) for vector in vectors]
+    angles = [np.arctan2(vector[1], vector[0]) for vector in vectors]
+
+    def numbers(classes):
+        sizes = {}
+        for found in classes:
+            sizes[found] = sizes.get(found, 0) + 1
+        shared = {}
+        for found in classes:
+            if sizes[found] > 1 and found not in shared:
+                shared[found] = len(shared) + 1
+        return [shared.get(found, 0) for found in classes]
+
+    return numbers(equal_classes(lengths, tolerance)), numbers(equal_classes(angles, tolerance, PI))
+
+def mark_figure(lines, tolerance: float = 1e-6, **kwargs) -> list:
+    """Makes a MarkedLine for each line of a figure with its congruent and parallel lines marked to match,
+        like the tuples from square_on_line or parallelogram_from_angle_and_rectilineal_figure
+
+    Parameters
+    ----------
+    lines :
+        the Lines, MarkedLines, Segments or (2, 3) arrays of the figure
+    tolerance :
+        how different two lengths or directions can be and still count as the same
+    **kwargs :
+        what else to pass on to each MarkedLine
+
+    Returns
+    -------
+    a list of the MarkedLines in the same order
+    """
+    cong_mark_nums, parrel_mark_nums = figure_marks(lines, tolerance)
+    marked = []
+    for line, cong_mark_num, parrel_mark_num in zip(lines, cong_mark_nums, parrel_mark_nums):
+        if isinstance(line, MarkedLine):
+            line = line.line
+        elif not isinstance(line, Line):
+            line = Line(*geometry.as_segment(line))
+        marked.append(MarkedLine(line, cong_mark_num, parrel_mark_num, **kwargs))
+    return marked
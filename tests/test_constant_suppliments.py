@@ -0,0 +1,15 @@
+from ManimHelpers import constant_suppliments
+
+def test_star_import_only_gives_the_constants():
+    names = {}
+    exec('from ManimHelpers.constant_suppliments import *', names)
+
+    assert {'TEXT_A', 'TEXT_Z', 'MIN_RUN_TIME', 'label'} <= set(names)
+    assert not {'os', 'hashlib', 'contextlib', 'replacing', 'glyph_outline'} & set(names)
+
+def test_letters_are_rendered_when_first_used():
+    letter = constant_suppliments._Letter('Q')
+    assert ('Q', '') not in constant_suppliments._outlines
+
+    assert len(letter.submobjects) == len(constant_suppliments.label('Q').submobjects)
+    assert ('Q', '') in constant_suppliments._outlines
@@ -0,0 +1,15 @@
+from manim import *
+from ManimHelpers import constructions, geometry
+from ManimHelpers.registry import op_count
+from ManimHelpers.timeline import Recorder
+
+def test_squares_on_lines_play_the_squares_of_the_solver_together():
+    lines = np.array([[[0, 0, 0], [2, 0, 0]], [[2, 0, 0], [1, 3, 0]], [[1, 3, 0], [0, 0, 0]]], dtype=float)
+    recorder = Recorder()
+    squares = constructions.squares_on_lines(recorder, lines)
+
+    solved = geometry.squares_on_lines(lines)
+    for square, sides in zip(squares, solved):
+        assert np.allclose([[line.get_start(), line.get_end()] for line in square], sides)
+    assert recorder.timeline.get_play_count() == op_count(constructions.square_on_line)
+    assert {id(mobject) for mobject in recorder.mobjects} == {id(line) for square in squares for line in square}
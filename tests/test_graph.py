@@ -0,0 +1,35 @@
+from manim import *
+from ManimHelpers import constructions
+from ManimHelpers.benchmarks import cases
+from ManimHelpers.graph import ConstructionGraph
+
+def test_calls_played_together_own_their_steps():
+    graph = ConstructionGraph(constructions.square_on_line, Line(ORIGIN, 2*RIGHT))
+    parallels = [call for call in graph.root.children if call.name == 'parallel_line']
+
+    assert len(parallels) == 2
+    for parallel in parallels:
+        assert parallel.last > parallel.first
+        assert graph.creators[id(parallel.result)] is parallel
+    assert graph.get_schedule()[-1] == parallels
+
+def test_result_only_draws_only_the_result():
+    graph = ConstructionGraph(constructions.square_on_line, Line(ORIGIN, 2*RIGHT))
+
+    drawn = [mobject for step in graph.result_only() for mobject in step.added]
+    assert {id(mobject) for mobject in drawn} == {id(line) for line in graph.result}
+
+def test_a_repeated_call_is_drawn_once():
+    graph = ConstructionGraph(constructions.equal_angle, *cases()['equal_angle'])
+    repeats = graph.get_repeats()
+    merged = list(graph.merged())
+
+    assert [call.name for call in repeats] == ['equilateral_triangle']
+    for call, first in repeats.items():
+        assert call.key == first.key
+        assert all(step in merged for step in graph.timeline[first.first:first.last])
+        assert not any(step in merged for step in graph.timeline[call.first:call.last])
+    scene = set()
+    for step in merged:
+        scene = scene - {id(mobject) for mobject in step.removed} | {id(mobject) for mobject in step.added}
+    assert scene == graph.scenes[-1]
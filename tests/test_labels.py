@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+from manim import *
+from ManimHelpers import constructions, geometry
+from ManimHelpers.benchmarks import cases
+from ManimHelpers.labels import construction_points
+from ManimHelpers.registry import CONSTRUCTIONS
+from ManimHelpers.timeline import Recorder
+
+@pytest.mark.parametrize('name', sorted(name for name, function in CONSTRUCTIONS.items() if function.names))
+def test_names_match_the_figure(name):
+    function = CONSTRUCTIONS[name]
+    args = cases()[name]
+    points = construction_points(function, args, function(Recorder(), *args))
+    solved = construction_points(function, args, getattr(geometry, name)(*args))
+
+    def names(value):
+        if isinstance(value, (tuple, list)):
+            return {name for item in value for name in names(item)}
+        return set(value or ())
+
+    # a name is left out when its point already has one, like the vertex of an angle on the figure
+    assert points and set(points) <= names(list(function.names.values()))
+    assert list(points) == list(solved)
+    for point in points:
+        assert np.allclose(points[point], solved[point], atol=1e-6)
+
+def test_square_is_named_as_in_the_proposition():
+    line_AB = Line(ORIGIN, 2*RIGHT)
+    result = constructions.square_on_line(Recorder(), line_AB)
+    points = construction_points(constructions.square_on_line, (line_AB,), result)
+
+    assert list(points) == ['A', 'B', 'E', 'D']
+    assert np.allclose(points['E'], [2, 2, 0])
+    assert np.allclose(points['D'], [0, 2, 0])
@@ -0,0 +1,14 @@
+from manim import *
+from ManimHelpers import constructions, geometry
+from ManimHelpers.preview import keyframes
+
+def test_final_frame_of_equilateral_triangle_holds_only_the_base_and_sides():
+    base_AB = Line(ORIGIN, 2*RIGHT)
+    frames, scaffolding = keyframes(constructions.equilateral_triangle, base_AB)
+
+    last = frames[-1]
+    assert last[0] is base_AB
+    assert all(isinstance(mobject, Line) for mobject in last)
+    drawn = sorted(geometry.geometry_key(mobject) for mobject in last[1:])
+    assert drawn == sorted(geometry.geometry_key(geometry.Segment(*side)) for side in geometry.equilateral_triangle(base_AB))
+    assert len(scaffolding) == 2
@@ -0,0 +1,32 @@
+from manim import *
+from ManimHelpers import constructions, profiling
+from ManimHelpers.timeline import Recorder
+
+def test_constructions_played_together_are_timed_as_they_play():
+    recorder = Recorder()
+    with profiling.profile(recorder) as profiler:
+        constructions.square_on_line(profiler, Line(ORIGIN, 2*RIGHT))
+    events = [event for event in profiler.get_trace()['traceEvents'] if event['ph'] == 'X']
+
+    parallels = [event for event in events if event['name'] == 'parallel_line']
+    assert len(parallels) == 2
+    assert len({event['tid'] for event in parallels}) == 2
+    for parallel in parallels:
+        plays = [
+            event for event in events if event['cat'] == 'play' and event['tid'] == parallel['tid']
+            and parallel['ts'] <= event['ts'] <= parallel['ts'] + parallel['dur']
+        ]
+        assert len(plays) > 1
+        assert parallel['args']['created'] > 0
+
+def test_lanes_are_numbered_the_same_every_run():
+    rows = []
+    for run in range(2):
+        with profiling.profile(Recorder()) as profiler:
+            constructions.square_on_line(profiler, Line(ORIGIN, 2*RIGHT))
+        names = [event for event in profiler.get_trace()['traceEvents'] if event['ph'] == 'M']
+        rows.append([(event['tid'], event['args']['name']) for event in names])
+
+    assert rows[0] == rows[1]
+    assert rows[0][0] == (0, 'main')
+    assert [tid for tid, name in rows[0]] == list(range(len(rows[0])))
@@ -0,0 +1,13 @@
+import pytest
+from ManimHelpers.benchmarks import cases
+from ManimHelpers.registry import CONSTRUCTIONS, check_timing, op_count
+
+@pytest.mark.parametrize('time', [None, 7])
+@pytest.mark.parametrize('name', sorted(CONSTRUCTIONS))
+def test_construction_takes_the_time_it_is_given(name, time):
+    check_timing(CONSTRUCTIONS[name], *cases()[name], time=time)
+
+@pytest.mark.parametrize('name', sorted(CONSTRUCTIONS))
+def test_construction_plays_once_for_each_operation(name):
+    timeline = check_timing(CONSTRUCTIONS[name], *cases()[name])
+    assert timeline.get_play_count() == op_count(CONSTRUCTIONS[name])
@@ -0,0 +1,60 @@
+import pytest
+from manim import *
+from ManimHelpers import rendering
+
+class FileWriter:
+    def __init__(self):
+        self.partial_movie_files = []
+
+class Renderer:
+    def __init__(self):
+        self.file_writer = FileWriter()
+        self.skip_animations = False
+        self._original_skipping_status = False
+
+class Movie:
+    """Stands in for a Scene, adding a partial movie or a skipped placeholder for each play like manim does"""
+
+    def __init__(self):
+        self.renderer = Renderer()
+        self.mobjects = []
+
+    def play(self, *animations, **kwargs):
+        skipped = self.renderer._original_skipping_status
+        self.renderer.file_writer.partial_movie_files.append(None if skipped else f"play{len(self.renderer.file_writer.partial_movie_files)}.mp4")
+
+def two_plays(s):
+    s.play()
+    s.play()
+
+def test_cache_hit_takes_the_place_of_a_skipped_play(tmp_path):
+    s = Movie()
+    s.play()
+    key = rendering.segment_key(two_plays.__name__, (), {}, scene=rendering.scene_key(s))
+    cached = tmp_path/f"{key}.mp4"
+    cached.write_bytes(b'')
+
+    rendering.construct_cached(s, two_plays, cache_dir=str(tmp_path))
+    s.play()
+
+    assert s.renderer.file_writer.partial_movie_files == ['play0.mp4', None, str(cached), 'play3.mp4']
+
+def test_source_hash_covers_every_module(tmp_path, monkeypatch):
+    (tmp_path / 'geometry.py').write_text('')
+    (tmp_path / 'intersections.py').write_text('')
+    monkeypatch.setattr(rendering.geometry, '__file__', str(tmp_path / 'geometry.py'))
+    rendering.source_hash.cache_clear()
+    before = rendering.source_hash()
+
+    (tmp_path / 'intersections.py').write_text('# changed')
+    rendering.source_hash.cache_clear()
+    assert rendering.source_hash() != before
+    rendering.source_hash.cache_clear()
+
+def nothing(s):
+    pass
+
+@pytest.mark.parametrize('render', [rendering.render_parallel, rendering.render_incremental])
+def test_a_construction_without_plays_is_refused_before_rendering(render, tmp_path):
+    with pytest.raises(ValueError, match='no plays'):
+        render(nothing, cache_dir=str(tmp_path))
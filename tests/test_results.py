@@ -0,0 +1,21 @@
+import pytest
+from manim import *
+from ManimHelpers import constructions
+from ManimHelpers.results import construct_saved, save_result
+from ManimHelpers.timeline import Recorder
+
+def test_construct_saved_runs_again_for_other_inputs(tmp_path):
+    path = str(tmp_path/'square.npz')
+    small = construct_saved(Recorder(), path, constructions.square_on_line, Line(ORIGIN, RIGHT))
+    large = construct_saved(Recorder(), path, constructions.square_on_line, Line(ORIGIN, 5*RIGHT))
+    loaded = construct_saved(Recorder(), path, constructions.square_on_line, Line(ORIGIN, 5*RIGHT))
+
+    assert np.allclose(small[1].get_start(), [1, 1, 0])
+    assert np.allclose(large[1].get_start(), [5, 5, 0])
+    assert np.allclose(loaded[1].get_start(), [5, 5, 0])
+    assert [file.name for file in tmp_path.iterdir()] == ['square.npz']
+
+def test_saving_an_array_that_is_not_points_says_why(tmp_path):
+    with pytest.raises(TypeError, match='shape'):
+        save_result(str(tmp_path/'angles.npz'), (np.zeros(4),))
+    assert list(tmp_path.iterdir()) == []
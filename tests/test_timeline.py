@@ -0,0 +1,66 @@
+import pytest
+from manim import *
+from ManimHelpers import constructions
+from ManimHelpers.benchmarks import cases
+from ManimHelpers.timeline import InstantAdd, InstantRemove, Pacer, Recorder
+
+def test_fade_out_of_several_mobjects_removes_each_of_them():
+    line_AB, line_AC, circle = Line(ORIGIN, RIGHT), Line(ORIGIN, UP), Circle()
+    recorder = Recorder()
+    recorder.play(Create(line_AB), Create(line_AC), Create(circle))
+    recorder.play(FadeOut(line_AB, circle))
+
+    assert recorder.mobjects == [line_AC]
+    assert recorder.timeline[-1].removed == [line_AB, circle]
+    assert recorder.timeline.get_live_counts() == [3, 1]
+
+def test_fade_in_of_several_mobjects_adds_each_of_them():
+    line_AB, line_AC = Line(ORIGIN, RIGHT), Line(ORIGIN, UP)
+    recorder = Recorder()
+    recorder.play(FadeIn(line_AB, line_AC))
+
+    assert recorder.mobjects == [line_AB, line_AC]
+    recorder.remove(line_AB, line_AC)
+    assert recorder.mobjects == []
+
+def test_equilateral_triangle_leaves_only_its_sides():
+    recorder = Recorder()
+    sides = constructions.equilateral_triangle(recorder, Line(ORIGIN, 2*RIGHT))
+
+    assert {id(mobject) for mobject in recorder.mobjects} == {id(side) for side in sides}
+
+def test_coalescing_keeps_adds_and_removes_in_order():
+    lines = [Line(ORIGIN, i*RIGHT) for i in range(1, 6)]
+    recorder = Recorder()
+    recorder.play(Create(lines[0]), run_time=0.1)
+    recorder.play(Create(lines[1]), run_time=0.1)
+    recorder.add(lines[2])
+    recorder.play(Create(lines[3]), run_time=0.1)
+    recorder.play(Create(lines[4]), run_time=0.1)
+    recorder.remove(lines[0])
+
+    coalesced = recorder.timeline.coalesced(1)
+    assert [step.kind for step in coalesced] == ['play']
+    succession = coalesced[0].animations[0]
+    assert [type(animation) for animation in succession.animations] == [AnimationGroup, AnimationGroup, InstantAdd, AnimationGroup, AnimationGroup, InstantRemove]
+    assert coalesced[0].added == lines[1:]
+    assert coalesced.get_total_time() == recorder.timeline.get_total_time()
+
+MIN_RUN_TIME = 0.5
+
+def test_coalesced_plays_last_at_least_the_minimum():
+    recorder = Recorder()
+    constructions.parallelogram_from_angle_and_rectilineal_figure(recorder, *cases()['parallelogram_from_angle_and_rectilineal_figure'], time=20)
+
+    coalesced = recorder.timeline.coalesced(MIN_RUN_TIME)
+    assert min(step.run_time for step in coalesced if step.kind == 'play') >= MIN_RUN_TIME - 1e-9
+    assert coalesced.get_total_time() == pytest.approx(20)
+
+def test_paced_plays_last_at_least_the_minimum():
+    scene = Recorder()
+    with Pacer(scene, MIN_RUN_TIME) as pacer:
+        constructions.parallelogram_from_angle_and_rectilineal_figure(pacer, *cases()['parallelogram_from_angle_and_rectilineal_figure'], time=20)
+
+    assert min(step.run_time for step in scene.timeline if step.kind == 'play') >= MIN_RUN_TIME - 1e-9
+    assert scene.timeline.get_total_time() == pytest.approx(20)
+    assert {id(mobject) for mobject in scene.mobjects} == {id(mobject) for mobject in pacer.mobjects}
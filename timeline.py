@@ -0,0 +1,765 @@
+import contextlib
+import copy
+from manim import *
+from ManimHelpers import geometry, registry
+from ManimHelpers.constant_suppliments import MIN_RUN_TIME
+
+def flatten_animations(animations) -> list:
+    """Opens up AnimationGroups, Successions and the like into the animations they hold
+
+    Parameters
+    ----------
+    animations :
+        An iterable of animations
+
+    Returns
+    -------
+    A list of the animations that act on a mobject
+    """
+    flat = []
+    for animation in animations:
+        if getattr(animation, 'animations', None):
+            flat += flatten_animations(animation.animations)
+        else:
+            flat.append(animation)
+    return flat
+
+class Step:
+    """One call made on a Scene while constructing
+
+    Parameters
+    ----------
+    kind :
+        'play', 'add', 'remove' or 'wait'
+    animations :
+        the animations given to play
+    run_time :
+        how long the step takes in the video
+    added :
+        the mobjects that are in the scene after the step but were not before
+    removed :
+        the mobjects that were in the scene before the step but are not after
+    kwargs :
+        any other keyword arguments given to play
+    mobjects :
+        the mobjects given to add or remove
+    lanes :
+        the Frames of the constructions that were running when the step was made, for each lane. See Tracer
+    """
+
+    def __init__(self, kind: str, animations: tuple = (), run_time: float = 0, added: list = None, removed: list = None, kwargs: dict = None, mobjects: tuple = (), lanes: dict = None):
+        self.kind = kind
+        self.animations = tuple(animations)
+        self.mobjects = tuple(mobjects)
+        self.run_time = run_time
+        self.added = added if added is not None else []
+        self.removed = removed if removed is not None else []
+        self.kwargs = kwargs if kwargs is not None else {}
+        self.lanes = lanes if lanes is not None else {}
+
+    def __repr__(self):
+        names = ', '.join(type(animation).__name__ for animation in self.animations)
+        return f"Step({self.kind}, [{names}], run_time={self.run_time:.3f}, +{len(self.added)}, -{len(self.removed)})"
+
+def play_step(s, step: Step):
+    """Makes a recorded call on a real Scene
+
+    Parameters
+    ----------
+    s :
+        The Scene
+    step :
+        The step
+    """
+    if step.kind == 'play':
+        s.play(*step.animations, run_time=step.run_time, **step.kwargs)
+    elif step.kind == 'add':
+        s.add(*step.mobjects)
+    elif step.kind == 'remove':
+        s.remove(*step.mobjects)
+    elif step.kind == 'wait':
+        s.wait(step.run_time)
+
+class InstantAdd(Animation):
+    """Adds mobjects to the scene when it is reached in a Succession, taking no time.
+        Keeps an add in its place when plays are merged, see merge_steps
+
+    Parameters
+    ----------
+    *mobjects :
+        the mobjects to add
+    """
+
+    def __init__(self, *mobjects, **kwargs):
+        self.mobjects = mobjects
+        super().__init__(Group(*mobjects), run_time=0, **kwargs)
+
+    def _setup_scene(self, scene):
+        if scene is not None:
+            scene.add(*self.mobjects)
+
+    def begin(self):
+        pass
+
+    def interpolate(self, alpha: float):
+        pass
+
+    def finish(self):
+        pass
+
+    def clean_up_from_scene(self, scene):
+        pass
+
+class InstantRemove(InstantAdd):
+    """Takes mobjects out of the scene when it is reached in a Succession, taking no time.
+        Keeps a remove in its place when plays are merged, see merge_steps
+
+    Parameters
+    ----------
+    *mobjects :
+        the mobjects to remove
+    """
+    remover = True
+
+    def __init__(self, *mobjects, **kwargs):
+        super().__init__(*mobjects, remover=True, **kwargs)
+
+    def _setup_scene(self, scene):
+        if scene is not None:
+            scene.remove(*self.mobjects)
+
+def merge_steps(steps: list) -> list:
+    """Merges each run of steps between waits into one play that runs their animations one after the other.
+        Adds and removes become InstantAdds and InstantRemoves in the same places so everything shows up
+        in the same order. A run without a play is left as it is.
+
+    Parameters
+    ----------
+    steps :
+        the steps in order
+
+    Returns
+    -------
+    the merged steps
+    """
+    merged = []
+    run = []
+    for step in list(steps) + [None]:
+        if step is not None and step.kind != 'wait':
+            run.append(step)
+            continue
+        plays = [item for item in run if item.kind == 'play']
+        if len(run) == 1 or not plays:
+            merged += run
+        elif run:
+            animations = []
+            added, removed = [], []
+            for item in run:
+                if item.kind == 'play':
+                    animations.append(AnimationGroup(*item.animations, run_time=item.run_time, **item.kwargs))
+                elif item.kind == 'add':
+                    animations.append(InstantAdd(*item.mobjects))
+                else:
+                    animations.append(InstantRemove(*item.mobjects))
+                # what is in the scene after the run and not before, and the other way around
+                for mobject in item.added:
+                    if mobject in removed:
+                        removed.remove(mobject)
+                    else:
+                        added.append(mobject)
+                for mobject in item.removed:
+                    if mobject in added:
+                        added.remove(mobject)
+                    else:
+                        removed.append(mobject)
+            merged.append(Step('play', (Succession(*animations),), sum(play.run_time for play in plays), added, removed))
+        run = []
+        if step is not None:
+            merged.append(step)
+    return merged
+
+class Timeline:
+    """The steps of a construction in the order they were made
+
+    Parameters
+    ----------
+    steps :
+        the steps
+    """
+
+    def __init__(self, steps: list = None):
+        self.steps = steps if steps is not None else []
+
+    def __len__(self):
+        return len(self.steps)
+
+    def __iter__(self):
+        return iter(self.steps)
+
+    def __getitem__(self, index):
+        return self.steps[index]
+
+    def append(self, step: Step):
+        self.steps.append(step)
+
+    def get_total_time(self) -> float:
+        """How long the timeline lasts when played"""
+        return sum(step.run_time for step in self.steps)
+
+    def get_play_count(self) -> int:
+        """How many times play is called when the timeline is replayed"""
+        return sum(1 for step in self.steps if step.kind == 'play')
+
+    def get_live_counts(self) -> list:
+        """The number of mobjects in the scene after each step"""
+        counts = []
+        live = 0
+        for step in self.steps:
+            live += len(step.added) - len(step.removed)
+            counts.append(live)
+        return counts
+
+    def compressed(self, total_time: float):
+        """A copy of the timeline with every run_time scaled so the whole thing lasts total_time
+
+        Parameters
+        ----------
+        total_time :
+            how long the new timeline should take
+
+        Returns
+        -------
+        the new Timeline
+        """
+        factor = total_time/self.get_total_time()
+        return Timeline([
+            Step(step.kind, step.animations, step.run_time*factor, step.added, step.removed, step.kwargs, step.mobjects, step.lanes)
+            for step in self.steps
+        ])
+
+    def coalesced(self, min_run_time: float = MIN_RUN_TIME):
+        """A copy of the timeline where runs of short plays are merged into single plays
+
+        Parameters
+        ----------
+        min_run_time :
+            plays shorter than this are merged with the ones after them until they last at least this long
+
+        Returns
+        -------
+        the new Timeline
+        """
+        steps = []
+        run = []
+        for step in list(self.steps) + [None]:
+            if step is not None and step.kind != 'wait':
+                run.append(step)
+                continue
+            groups = [[]]
+            group_time = 0
+            for item in run:
+                if group_time >= min_run_time:
+                    groups.append([])
+                    group_time = 0
+                groups[-1].append(item)
+                group_time += item.run_time
+            # what is left before a wait or the end joins the group before it if it is too short on its own
+            if group_time < min_run_time and len(groups) > 1:
+                groups[-2] += groups.pop()
+            for group in groups:
+                steps += merge_steps(group)
+            if step is not None:
+                steps.append(step)
+            run = []
+        return Timeline(steps)
+
+    def replay(self, s):
+        """Makes the recorded calls on a real Scene
+
+        Parameters
+        ----------
+        s :
+            The Scene
+        """
+        for step in self.steps:
+            play_step(s, step)
+
+class Recorder:
+    """Stands in for a Scene and records what a construction asks of it instead of rendering
+
+    Parameters
+    ----------
+    mobjects :
+        the mobjects already in the scene
+    """
+
+    def __init__(self, *mobjects):
+        self.mobjects = []
+        self.timeline = Timeline()
+        self._ids = set()
+        self._put(mobjects)
+
+    def _expand(self, mobjects) -> list:
+        # FadeOut(a, b) and the like wrap what they are given in a new Group the scene never holds itself,
+        # so it stands for the mobjects in it
+        expanded = []
+        for mobject in mobjects:
+            if id(mobject) not in self._ids and type(mobject) is Group:
+                expanded += self._expand(mobject.submobjects)
+            else:
+                expanded.append(mobject)
+        return expanded
+
+    def _put(self, mobjects) -> list:
+        added = []
+        for mobject in self._expand(mobjects):
+            if id(mobject) not in self._ids:
+                self._ids.add(id(mobject))
+                self.mobjects.append(mobject)
+                added.append(mobject)
+        return added
+
+    def _take(self, mobjects) -> list:
+        removed = []
+        for mobject in self._expand(mobjects):
+            if id(mobject) in self._ids:
+                self._ids.remove(id(mobject))
+                self.mobjects.remove(mobject)
+                removed.append(mobject)
+        return removed
+
+    def add(self, *mobjects):
+        self.timeline.append(Step('add', added=self._put(mobjects), mobjects=mobjects))
+        return self
+
+    def remove(self, *mobjects):
+        self.timeline.append(Step('remove', removed=self._take(mobjects), mobjects=mobjects))
+        return self
+
+    def wait(self, duration: float = 1, **kwargs):
+        self.timeline.append(Step('wait', run_time=duration, kwargs=kwargs))
+
+    def play(self, *animations, run_time: float = None, **kwargs):
+        flat = flatten_animations(animations)
+        if run_time is None:
+            run_time = max((getattr(animation, 'run_time', 1) for animation in animations), default=0)
+
+        added = self._put(animation.mobject for animation in flat)
+        removed = []
+        for animation in flat:
+            if getattr(animation, 'replace_mobject_with_target_in_scene', False):
+                removed += self._take([animation.mobject])
+                added += self._put([animation.target_mobject])
+            elif getattr(animation, 'remover', False):
+                removed += self._take([animation.mobject])
+
+        # a mobject created and removed in the same play never shows up in the scene
+        removed_ids = {id(mobject) for mobject in removed}
+        added_ids = {id(mobject) for mobject in added}
+        self.timeline.append(Step(
+            'play', animations, run_time,
+            [mobject for mobject in added if id(mobject) not in removed_ids],
+            [mobject for mobject in removed if id(mobject) not in added_ids],
+            kwargs
+        ))
+
+    def get_mobject_count(self) -> int:
+        return len(self.mobjects)
+
+
+class Pacer(Recorder):
+    """Stands in for a Scene and passes the calls on to it, merging plays that would be shorter than
+        min_run_time into one Succession so a deep construction doesn't make a partial movie per operation.
+        Call flush, or use it in a with statement, once the construction is done.
+
+    Parameters
+    ----------
+    s :
+        The Scene to play in
+    min_run_time :
+        the shortest play that will be passed on
+    """
+
+    def __init__(self, s: Scene, min_run_time: float = MIN_RUN_TIME):
+        Recorder.__init__(self, *s.mobjects)
+        self.scene = s
+        self.min_run_time = min_run_time
+        self._flushed = 0
+        # the end of a group long enough to play, held back until the next one is too so a short one
+        # at the end can join it
+        self._ready = 0
+        self._pending_time = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.flush()
+
+    def __getattr__(self, name):
+        if name == 'scene':
+            raise AttributeError(name)
+        return getattr(self.scene, name)
+
+    def flush(self):
+        """Plays whatever is still waiting to be played"""
+        Timeline(merge_steps(self.timeline.steps[self._flushed:])).replay(self.scene)
+        self._flushed = self._ready = len(self.timeline)
+        self._pending_time = 0
+
+    def _pace(self):
+        self._pending_time += self.timeline[-1].run_time
+        if self._pending_time >= self.min_run_time:
+            Timeline(merge_steps(self.timeline.steps[self._flushed:self._ready])).replay(self.scene)
+            self._flushed, self._ready = self._ready, len(self.timeline)
+            self._pending_time = 0
+
+    def play(self, *animations, **kwargs):
+        Recorder.play(self, *animations, **kwargs)
+        self._pace()
+
+    def wait(self, duration: float = 1, **kwargs):
+        self.flush()
+        Recorder.wait(self, duration, **kwargs)
+        self.scene.wait(duration, **kwargs)
+        self._flushed = self._ready = len(self.timeline)
+
+
+class Scaffold:
+    """Stands in for a Scene and passes the calls on to it, keeping track of every mobject brought into the scene
+        so whatever is still there at the end and wasn't kept is removed, even when the construction raises.
+        Use it in a with statement, or see construct_scaffolded.
+
+    Parameters
+    ----------
+    s :
+        The Scene to play in
+    """
+
+    def __init__(self, s: Scene):
+        self.scene = s
+        self.recorder = Recorder(*s.mobjects)
+        self.existing = {id(mobject) for mobject in s.mobjects}
+        self.kept = set()
+        self.elapsed = 0
+        self.history = [(0, len(s.mobjects))]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.clean()
+
+    def __getattr__(self, name):
+        if name in ('scene', 'recorder'):
+            raise AttributeError(name)
+        return getattr(self.scene, name)
+
+    def _pass(self):
+        # only the counts are kept so the scaffold doesn't hold on to every animation
+        step = self.recorder.timeline.steps.pop()
+        self.elapsed += step.run_time
+        self.history.append((self.elapsed, self.recorder.get_mobject_count()))
+        play_step(self.scene, step)
+
+    def add(self, *mobjects):
+        self.recorder.add(*mobjects)
+        self._pass()
+        return self
+
+    def remove(self, *mobjects):
+        self.recorder.remove(*mobjects)
+        self._pass()
+        return self
+
+    def play(self, *animations, **kwargs):
+        self.recorder.play(*animations, **kwargs)
+        self._pass()
+
+    def wait(self, duration: float = 1, **kwargs):
+        self.recorder.wait(duration, **kwargs)
+        self._pass()
+
+    def keep(self, *mobjects):
+        """Keeps mobjects in the scene when the scaffold is cleaned up, tuples of them included"""
+        for mobject in mobjects:
+            if isinstance(mobject, (tuple, list)):
+                self.keep(*mobject)
+            else:
+                self.kept.add(id(mobject))
+
+    def get_leftovers(self) -> list:
+        """The mobjects brought in that are still in the scene and not kept"""
+        keep = self.existing | self.kept
+        return [mobject for mobject in self.recorder.mobjects if id(mobject) not in keep]
+
+    def clean(self):
+        """Removes the leftovers from the scene"""
+        leftovers = self.get_leftovers()
+        if leftovers:
+            self.remove(*leftovers)
+
+    def get_peak_count(self) -> int:
+        """The most mobjects there were in the scene at once"""
+        return max(count for elapsed, count in self.history)
+
+def construct_scaffolded(s: Scene, construction, *args, **kwargs):
+    """Runs a construction in a Scaffold so only what it returns is left in the scene
+
+    Parameters
+    ----------
+    s :
+        The Scene
+    construction :
+        the construction
+    *args :
+        what to pass to it after the Scene
+    **kwargs :
+        what else to pass to it
+
+    Returns
+    -------
+    what the construction returns
+    """
+    with Scaffold(s) as scaffold:
+        result = construction(scaffold, *args, **kwargs)
+        scaffold.keep(result)
+    return result
+
+class Frame:
+    """A construction that was running while steps were recorded, see Tracer
+
+    Parameters
+    ----------
+    name :
+        the name of the construction
+    arguments :
+        what it was called with by name, time included
+    operations :
+        its number of operations
+    depth :
+        how many constructions it was nested in, itself included
+    """
+
+    def __init__(self, name: str, arguments: dict, operations: int, depth: int):
+        self.name = name
+        self.arguments = arguments
+        self.operations = operations
+        self.depth = depth
+        self.result = None
+
+    def __repr__(self):
+        return f"Frame({self.name}, depth={self.depth})"
+
+class Tracer(Recorder):
+    """Records a construction like a Recorder and tags each step with the Frames of the constructions
+        running when it was made, so they can be reported again when the steps are played. See registry.listen
+    """
+
+    def __init__(self, *mobjects):
+        super().__init__(*mobjects)
+        self._open = {}
+
+    def _tag(self):
+        self.timeline[-1].lanes = {lane: tuple(frames) for lane, frames in self._open.items() if frames}
+
+    def add(self, *mobjects):
+        super().add(*mobjects)
+        self._tag()
+        return self
+
+    def remove(self, *mobjects):
+        super().remove(*mobjects)
+        self._tag()
+        return self
+
+    def wait(self, duration: float = 1, **kwargs):
+        super().wait(duration, **kwargs)
+        self._tag()
+
+    def play(self, *animations, **kwargs):
+        super().play(*animations, **kwargs)
+        self._tag()
+
+    @contextlib.contextmanager
+    def span(self, name: str, category: str, arguments: dict = None, operations: int = 0, depth: int = 0, lane: tuple = (), **args):
+        frame = Frame(name, {argument: value for argument, value in (arguments or {}).items() if argument != 's'}, operations, depth)
+        frames = self._open.setdefault(lane, [])
+        frames.append(frame)
+        try:
+            yield args
+        finally:
+            frames.pop()
+            frame.result = args.get('result')
+
+def trace(construction, *args, **kwargs) -> tuple:
+    """Records a construction with a Tracer. Only the Tracer is told about the constructions it calls
+
+    Parameters
+    ----------
+    construction :
+        the construction
+    *args :
+        what to pass to it after the Scene
+    **kwargs :
+        what else to pass to it
+
+    Returns
+    -------
+    the recorded Timeline and what the construction returned
+    """
+    recorder = Tracer()
+    with registry.listen(recorder, alone=True):
+        result = construction(recorder, *args, **kwargs)
+    return recorder.timeline, result
+
+def _moved(value, start: np.ndarray, matrix: np.ndarray):
+    if isinstance(value, geometry.Segment):
+        return geometry.Segment(*(value.points @ matrix.T + start))
+    if isinstance(value, np.ndarray) and value.shape[-1:] == (3,):
+        return value @ matrix.T + start
+    if isinstance(value, (tuple, list)):
+        return type(value)(_moved(item, start, matrix) for item in value)
+    if isinstance(value, dict):
+        return {key: _moved(item, start, matrix) for key, item in value.items()}
+    return value
+
+def moved(timeline: Timeline, result, start: np.ndarray, matrix: np.ndarray) -> tuple:
+    """Copies a recorded construction with everything in it turned, scaled and shifted, so it can be played
+        somewhere else without recording it again. Dots keep their size
+
+    Parameters
+    ----------
+    timeline :
+        the recorded Timeline, see trace
+    result :
+        what the construction returned
+    start :
+        where the origin goes
+    matrix :
+        an array of shape (3, 3) that turns and scales about the origin, see geometry.similarity
+
+    Returns
+    -------
+    the copied Timeline and what the copy returns
+    """
+    memo = {}
+    timeline, result = copy.deepcopy((timeline, result), memo)
+    scale = float(np.linalg.norm(matrix[:2, 0]))
+    for value in list(memo.values()):
+        if isinstance(value, Mobject):
+            value.points = value.points @ matrix.T + start
+            if isinstance(value, Dot):
+                value.scale(1/scale, about_point=value.get_center())
+            elif isinstance(value, Circle):
+                value.radius = getattr(value, 'radius', 1)*scale
+        elif isinstance(value, Frame):
+            value.arguments = _moved(value.arguments, start, matrix)
+            value.result = _moved(value.result, start, matrix)
+    return timeline, result
+
+def replayed(timeline: Timeline, result):
+    """A generator of recorded steps like the ones from steps, returning result"""
+    yield from timeline
+    return result
+
+def steps(construction, *args, **kwargs):
+    """Runs a construction as a generator of its steps instead of playing them.
+        The generator returns what the construction returns. The constructions it calls are only
+        reported to whatever is listening once their steps are played, see play_together
+
+    Parameters
+    ----------
+    construction :
+        the construction
+    *args :
+        what to pass to it after the Scene
+    **kwargs :
+        what else to pass to it
+
+    Returns
+    -------
+    the generator
+    """
+    return (yield from replayed(*trace(construction, *args, **kwargs)))
+
+def follow_lanes(spans: dict, index: int, step: Step = None):
+    """Opens and closes the reports of the constructions played by one of the generators in play_together
+        so they are the ones running when step was recorded, see registry.report
+
+    Parameters
+    ----------
+    spans :
+        the open reports of each lane, as lists of (Frame, event, ExitStack). Updated in place
+    index :
+        which generator the step came from. Its lanes are put under it
+    step :
+        the step about to be played, None to close every report of the generator
+    """
+    wanted = {(index,) + lane: frames for lane, frames in (step.lanes.items() if step is not None else ())}
+    for lane in sorted((lane for lane in spans if lane[0] == index), key=len, reverse=True):
+        frames = wanted.get(lane, ())
+        kept = 0
+        while kept < min(len(spans[lane]), len(frames)) and spans[lane][kept][0] is frames[kept]:
+            kept += 1
+        while len(spans[lane]) > kept:
+            frame, event, stack = spans[lane].pop()
+            event['result'] = frame.result
+            stack.close()
+    for lane in sorted(wanted, key=len):
+        opened = spans.setdefault(lane, [])
+        for frame in wanted[lane][len(opened):]:
+            stack = contextlib.ExitStack()
+            event = stack.enter_context(registry.report(frame.name, frame.depth, frame.arguments, frame.operations, lane))
+            opened.append((frame, event, stack))
+
+def play_together(s, *generators) -> tuple:
+    """Plays the steps of several constructions side by side, one AnimationGroup for each operation.
+        The constructions each generator recorded are reported as its steps are played, each generator
+        in a lane of its own, see registry.report
+
+    Parameters
+    ----------
+    s :
+        The Scene
+    *generators :
+        generators of steps, like the ones from steps
+
+    Returns
+    -------
+    a tuple of what each generator returned
+    """
+    results = [None]*len(generators)
+    active = list(enumerate(generators))
+    spans = {}
+    try:
+        while active:
+            groups = []
+            times = []
+            still_active = []
+            for index, generator in active:
+                try:
+                    step = next(generator)
+                    while step.kind not in ('play', 'wait'):
+                        follow_lanes(spans, index, step)
+                        play_step(s, step)
+                        step = next(generator)
+                except StopIteration as stop:
+                    results[index] = stop.value
+                    follow_lanes(spans, index)
+                    continue
+                follow_lanes(spans, index, step)
+                if step.kind == 'play':
+                    groups.append(AnimationGroup(*step.animations, run_time=step.run_time, **step.kwargs))
+                else:
+                    groups.append(Wait(step.run_time))
+                times.append(step.run_time)
+                still_active.append((index, generator))
+            if groups:
+                s.play(AnimationGroup(*groups), run_time=max(times))
+            active = still_active
+    finally:
+        for lane in sorted(spans, key=len, reverse=True):
+            for frame, event, stack in reversed(spans[lane]):
+                stack.close()
+    return tuple(results)